@@ -64,12 +64,18 @@ CONTAINER_NAME = "_" + FORMATTER_NAME
 # TODO: Collate globals better
 def clear_globals():
     try:
-        GodotSynthProvider.synth_by_id.clear()
-        GodotSynthProvider.next_id = 0
-        global hex_color_to_name
-        hex_color_to_name.clear()
-        global constructed_the_table
-        constructed_the_table = False
+        provider_registry.clear()
+        named_color_tables.clear()
+        variant_type_tables.clear()
+        node_layouts.clear()
+        hash_map_provider_types.clear()
+        plain_data_types.clear()
+        enum_tables.clear()
+        packed_summary_formatters.clear()
+        key_hasher_indices.clear()
+        synthetic_provider_index.clear()
+        summary_provider_index.clear()
+        clear_all_caches()
     except Exception as e:
         print("Error clearing globals: " + str(e))
 
@@ -117,6 +123,7 @@ def attach_synthetic_to_type(module, category: SBTypeCategory, type_name, synth_
     if not category.AddTypeSynthetic(SBTypeNameSpecifier(type_name, is_regex), synth):
         print(f"Failed to add synthetic for {type_name}")
 
+    @cached_summary_dec
     def summary_fn(valobj, dict):
         return get_synth_summary(synth_class, valobj, dict)
 
@@ -135,6 +142,7 @@ def attach_synthetic_to_type(module, category: SBTypeCategory, type_name, synth_
 def attach_summary_to_type(module, category: SBTypeCategory, type_name, real_summary_fn, is_regex=False, real_fn_name: Optional[str] = None):
     if not real_fn_name:
         real_fn_name = str(real_summary_fn.__qualname__)
+    @cached_summary_dec
     def __spfunc(valobj, dict):
         try:
             return real_summary_fn(valobj, dict)
@@ -258,6 +266,33 @@ class ReloadCommand(_LLDBCommandBase):
         return
 
 
+class CacheCommand(_LLDBCommandBase):
+    program = "cache"
+    description = "Usage: cache stats|clear. Prints the hit rates of the formatter caches, or clears them."
+
+    def __call__(
+        self,
+        debugger: SBDebugger,
+        command,
+        exe_ctx: SBExecutionContext,
+        result: SBCommandReturnObject,
+    ):
+        command_args = shlex.split(command)
+        subcommand = command_args[0] if command_args else "stats"
+        if subcommand == "stats":
+            result.AppendMessage("\n".join(cache.get_stats_str() for cache in registered_caches))
+            result.SetStatus(eReturnStatusSuccessFinishResult)
+        elif subcommand == "clear":
+            for cache in registered_caches:
+                cache.clear()
+                cache.reset_stats()
+            result.AppendMessage("Caches have been cleared.")
+            result.SetStatus(eReturnStatusSuccessFinishNoResult)
+        else:
+            result.SetError(f"Unknown subcommand '{subcommand}'. {self.description}")
+        return
+
+
 class GetOptsCommand(_LLDBCommandBase):
     program = "get_opts"
     description = "This command prints a list of the current option settings for the Godot formatter script."
@@ -387,6 +422,8 @@ class SetOptsCommand(_LLDBCommandBase):
 
 def register_all_providers(debugger: SBDebugger):
     global module
+    # cached summaries may depend on the options that were just changed
+    clear_all_caches()
     cpp_category: SBTypeCategory = debugger.GetDefaultCategory()
     rust_category: SBTypeCategory = debugger.GetCategory("Rust")
     register_all_synth_and_summary_providers(module, cpp_category, debugger, SUMMARY_PROVIDERS, SYNTHETIC_PROVIDERS)
@@ -405,3 +442,4 @@ def __lldb_init_module(debugger: SBDebugger, dict):
     SetOptsCommand.register_lldb_command(debugger, __name__, CONTAINER_NAME, FORMATTER_NAME)
     GetOptsCommand.register_lldb_command(debugger, __name__, CONTAINER_NAME, FORMATTER_NAME)
     ReloadCommand.register_lldb_command(debugger, __name__, CONTAINER_NAME, FORMATTER_NAME)
+    CacheCommand.register_lldb_command(debugger, __name__, CONTAINER_NAME, FORMATTER_NAME)
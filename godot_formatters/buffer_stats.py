@@ -0,0 +1,150 @@
+from typing import Callable, Optional
+import heapq
+import math
+import struct
+
+# NumPy is optional; without it, the buffer is unpacked with struct
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Read the buffer this many bytes at a time
+STATS_CHUNK_BYTES = 4 * 1024 * 1024
+STATS_TOP_K = 5
+
+_NUMPY_DTYPES = {
+    "b": "<i1", "B": "<u1", "h": "<i2", "H": "<u2", "i": "<i4", "I": "<u4", "q": "<i8", "Q": "<u8", "f": "<f4", "d": "<f8",
+}
+
+
+class BufferStats:
+    """
+    Statistics of a buffer of numbers, or of vectors of numbers (one min/max/mean per component).
+    NaN and Inf components are counted, but left out of the min/max/mean.
+    The top elements are the ones with the largest absolute value (or length, for vectors).
+    """
+
+    def __init__(self, components: int, top_k: int):
+        self.count = 0
+        self.components = components
+        self.top_k = top_k
+        self.min: list = [None] * components
+        self.max: list = [None] * components
+        self.sum: list = [0] * components
+        self.finite_count: list[int] = [0] * components
+        self.nan_count = 0
+        self.inf_count = 0
+        # min-heap of (magnitude, index)
+        self.top: list[tuple[float, int]] = []
+
+    def _add_component(self, c: int, chunk_min, chunk_max, chunk_sum, chunk_finite: int):
+        if chunk_finite == 0:
+            return
+        self.min[c] = chunk_min if self.min[c] is None else min(self.min[c], chunk_min)
+        self.max[c] = chunk_max if self.max[c] is None else max(self.max[c], chunk_max)
+        self.sum[c] += chunk_sum
+        self.finite_count[c] += chunk_finite
+
+    def _add_top(self, magnitude: float, index: int):
+        if len(self.top) < self.top_k:
+            heapq.heappush(self.top, (magnitude, index))
+        elif magnitude > self.top[0][0]:
+            heapq.heapreplace(self.top, (magnitude, index))
+
+    def add_chunk_numpy(self, data: bytes, code: str, start: int):
+        values = numpy.frombuffer(data, dtype=_NUMPY_DTYPES[code]).reshape(-1, self.components)
+        is_float = code in "fd"
+        if is_float:
+            self.nan_count += int(numpy.isnan(values).sum())
+            self.inf_count += int(numpy.isinf(values).sum())
+        for c in range(self.components):
+            column = values[:, c]
+            if is_float:
+                column = column[numpy.isfinite(column)]
+            if column.size == 0:
+                continue
+            total = column.sum(dtype=numpy.float64 if is_float else numpy.int64 if code in "bhiq" else numpy.uint64)
+            self._add_component(c, column.min().item(), column.max().item(), total.item(), int(column.size))
+        as_float = values.astype(numpy.float64)
+        magnitudes = numpy.abs(as_float[:, 0]) if self.components == 1 else numpy.sqrt((as_float * as_float).sum(axis=1))
+        magnitudes[~numpy.isfinite(magnitudes)] = -1.0
+        k = min(self.top_k, magnitudes.size)
+        for i in numpy.argpartition(magnitudes, -k)[-k:]:
+            if magnitudes[i] >= 0:
+                self._add_top(float(magnitudes[i]), start + int(i))
+        self.count += len(values)
+
+    def add_chunk_struct(self, data: bytes, element_struct: struct.Struct, start: int):
+        chunk_min: list = [None] * self.components
+        chunk_max: list = [None] * self.components
+        chunk_sum: list = [0] * self.components
+        chunk_finite = [0] * self.components
+        index = start
+        for vals in element_struct.iter_unpack(data):
+            squares = 0.0
+            finite = True
+            for c, v in enumerate(vals):
+                if isinstance(v, float):
+                    if math.isnan(v):
+                        self.nan_count += 1
+                        finite = False
+                        continue
+                    if math.isinf(v):
+                        self.inf_count += 1
+                        finite = False
+                        continue
+                if chunk_min[c] is None or v < chunk_min[c]:
+                    chunk_min[c] = v
+                if chunk_max[c] is None or v > chunk_max[c]:
+                    chunk_max[c] = v
+                chunk_sum[c] += v
+                chunk_finite[c] += 1
+                squares += float(v) * float(v)
+            if finite:
+                self._add_top(abs(float(vals[0])) if self.components == 1 else math.sqrt(squares), index)
+            index += 1
+        for c in range(self.components):
+            self._add_component(c, chunk_min[c], chunk_max[c], chunk_sum[c], chunk_finite[c])
+        self.count += index - start
+
+    def _format_components(self, vals: list) -> str:
+        strs = ["-" if v is None else str(v) for v in vals]
+        return strs[0] if self.components == 1 else "(" + ", ".join(strs) + ")"
+
+    def format(self) -> str:
+        mean = [self.sum[c] / self.finite_count[c] if self.finite_count[c] else None for c in range(self.components)]
+        top = ", ".join("[{0}]: {1:g}".format(index, magnitude) for magnitude, index in sorted(self.top, reverse=True))
+        return "{{count: {0}, min: {1}, max: {2}, mean: {3}, nan: {4}, inf: {5}, top: {{{6}}}}}".format(
+            self.count,
+            self._format_components(self.min),
+            self._format_components(self.max),
+            self._format_components(mean),
+            self.nan_count,
+            self.inf_count,
+            top,
+        )
+
+
+def compute_buffer_stats(
+    read_chunk: Callable[[int, int], Optional[bytes]], count: int, element_struct: struct.Struct, top_k: int = STATS_TOP_K
+) -> Optional[BufferStats]:
+    """
+    Streams `count` elements through `read_chunk(start index, element count)`, STATS_CHUNK_BYTES at a time.
+    `element_struct` is the layout of one element, e.g. "<f" for float or "<fff" for Vector3.
+    """
+    element_format = element_struct.format if isinstance(element_struct.format, str) else element_struct.format.decode()
+    codes = element_format.lstrip("<")
+    if not codes or any(code != codes[0] for code in codes) or codes[0] not in _NUMPY_DTYPES:
+        return None
+    stats = BufferStats(len(codes), top_k)
+    chunk_elements = max(STATS_CHUNK_BYTES // element_struct.size, 1)
+    for start in range(0, count, chunk_elements):
+        data = read_chunk(start, min(chunk_elements, count - start))
+        if data is None:
+            return None
+        if numpy is not None:
+            stats.add_chunk_numpy(data, codes[0], start)
+        else:
+            stats.add_chunk_struct(data, element_struct, start)
+    return stats
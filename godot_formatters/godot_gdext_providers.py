@@ -58,6 +58,7 @@ def get_real_valobj_from_opaque_member(valobj: SBValue) -> Optional[SBValue]:
 
 
 class GDExtGenericSynthProvider(GodotSynthProvider):
+    __slots__ = ("type_name", "real_valobj", "synth_provider_type", "synth_provider")
     synth_provider: GodotSynthProvider
 
     def __init__(
@@ -121,6 +122,7 @@ def get_real_valobj_from_raw_gd(valobj: SBValue) -> SBValue:
     return obj_pointer.Cast(variant_cpptype)
 
 class GDExtGDObjectSynthProvider(GodotSynthProvider):
+    __slots__ = ("real_valobj",)
     real_valobj: SBValue
 
     def __init__(
@@ -153,6 +155,8 @@ class GDExtGDObjectSynthProvider(GodotSynthProvider):
     
     
 class GDExtBaseGDObjectSynthProvider(GDExtGDObjectSynthProvider):
+    __slots__ = ()
+
     # @override
     def update(self):
         obj = self.valobj.GetChildAtIndex(0)
@@ -14,7 +14,9 @@ import re
 import json
 
 from enum import Enum
-import weakref
+import bisect
+import struct
+from array import array
 from types import TracebackType
 from typing import Any, Callable, Generic, TypeVar, final, Optional
 
@@ -54,6 +56,18 @@ import godot_formatters.options
 # godot_formatters.options = reload(godot_formatters.options)
 from godot_formatters.options import *
 
+from godot_formatters.buffer_stats import compute_buffer_stats
+
+from godot_formatters.color_names import get_named_color, quantize_color
+
+from godot_formatters.hashfuncs import (
+    get_integer_hash_candidates,
+    hash_djb2,
+    hash_one_uint64,
+    probe_ahash_table,
+    probe_hash_table,
+)
+
 UINT32_MAX = 4294967295
 INT32_MAX = 2147483647
 
@@ -107,203 +121,132 @@ class VariantType(Enum):
     VARIANT_MAX = 39
 
 
+# How each Variant type is stored in `Variant::_data`
+VARIANT_STORAGE_NIL = "nil"
+VARIANT_STORAGE_MEMBER = "member"  # direct member of _data (e.g. `_bool`)
+VARIANT_STORAGE_POINTER = "pointer"  # heap-allocated, pointer member of _data (e.g. `_transform2d`)
+VARIANT_STORAGE_MEM = "_mem"  # stored in-place in `_data._mem`
+VARIANT_STORAGE_OBJECT = "object"  # Variant::ObjData stored in-place in `_data._mem`
+VARIANT_STORAGE_PACKED_ARRAY = "packed_array"  # Variant::PackedArrayRef<T> pointed to by `_data.packed_array`
+
+# (storage kind, member name or type name, synthetic child name), indexed by VariantType value
+# fmt: off
+VARIANT_TYPE_LAYOUT: list[tuple[str, Optional[str], Optional[str]]] = [
+    (VARIANT_STORAGE_NIL,          None,                                      None),                     # NIL
+    (VARIANT_STORAGE_MEMBER,       "_bool",                                   None),                     # BOOL
+    (VARIANT_STORAGE_MEMBER,       "_int",                                    None),                     # INT
+    (VARIANT_STORAGE_MEMBER,       "_float",                                  None),                     # FLOAT
+    (VARIANT_STORAGE_MEM,          "::String",                                "[string]"),               # STRING
+    (VARIANT_STORAGE_MEM,          "::Vector2",                               "[vector2]"),              # VECTOR2
+    (VARIANT_STORAGE_MEM,          "::Vector2i",                              "[vector2i]"),             # VECTOR2I
+    (VARIANT_STORAGE_MEM,          "::Rect2",                                 "[rect2]"),                # RECT2
+    (VARIANT_STORAGE_MEM,          "::Rect2i",                                "[rect2i]"),               # RECT2I
+    (VARIANT_STORAGE_MEM,          "::Vector3",                               "[vector3]"),              # VECTOR3
+    (VARIANT_STORAGE_MEM,          "::Vector3i",                              "[vector3i]"),             # VECTOR3I
+    (VARIANT_STORAGE_POINTER,      "_transform2d",                            None),                     # TRANSFORM2D
+    (VARIANT_STORAGE_MEM,          "::Vector4",                               "[vector4]"),              # VECTOR4
+    (VARIANT_STORAGE_MEM,          "::Vector4i",                              "[vector4i]"),             # VECTOR4I
+    (VARIANT_STORAGE_MEM,          "::Plane",                                 "[plane]"),                # PLANE
+    (VARIANT_STORAGE_MEM,          "::Quaternion",                            "[quaternion]"),           # QUATERNION
+    (VARIANT_STORAGE_POINTER,      "_aabb",                                   None),                     # AABB
+    (VARIANT_STORAGE_POINTER,      "_basis",                                  None),                     # BASIS
+    (VARIANT_STORAGE_POINTER,      "_transform3d",                            None),                     # TRANSFORM3D
+    (VARIANT_STORAGE_POINTER,      "_projection",                             None),                     # PROJECTION
+    (VARIANT_STORAGE_MEM,          "::Color",                                 "[color]"),                # COLOR
+    (VARIANT_STORAGE_MEM,          "::StringName",                            "[stringName]"),           # STRING_NAME
+    (VARIANT_STORAGE_MEM,          "::NodePath",                              "[nodePath]"),             # NODE_PATH
+    (VARIANT_STORAGE_MEM,          "::RID",                                   "[rid]"),                  # RID
+    (VARIANT_STORAGE_OBJECT,       "Variant::ObjData",                        "[objData]"),              # OBJECT
+    (VARIANT_STORAGE_MEM,          "::Callable",                              "[callable]"),             # CALLABLE
+    (VARIANT_STORAGE_MEM,          "::Signal",                                "[signal]"),               # SIGNAL
+    (VARIANT_STORAGE_MEM,          "::Dictionary",                            "[dictionary]"),           # DICTIONARY
+    (VARIANT_STORAGE_MEM,          "::Array",                                 "[array]"),                # ARRAY
+    (VARIANT_STORAGE_PACKED_ARRAY, "Variant::PackedArrayRef<unsigned char>",  "packedByteArrayref"),     # PACKED_BYTE_ARRAY
+    (VARIANT_STORAGE_PACKED_ARRAY, "Variant::PackedArrayRef<int>",            "packedInt32Arrayref"),    # PACKED_INT32_ARRAY
+    (VARIANT_STORAGE_PACKED_ARRAY, "Variant::PackedArrayRef<long long>",      "packedInt64Arrayref"),    # PACKED_INT64_ARRAY
+    (VARIANT_STORAGE_PACKED_ARRAY, "Variant::PackedArrayRef<float>",          "packedFloat32Arrayref"),  # PACKED_FLOAT32_ARRAY
+    (VARIANT_STORAGE_PACKED_ARRAY, "Variant::PackedArrayRef<double>",         "packedFloat64Arrayref"),  # PACKED_FLOAT64_ARRAY
+    (VARIANT_STORAGE_PACKED_ARRAY, "Variant::PackedArrayRef<String>",         "packedStringArrayref"),   # PACKED_STRING_ARRAY
+    (VARIANT_STORAGE_PACKED_ARRAY, "Variant::PackedArrayRef<Vector2>",        "packedVector2Arrayref"),  # PACKED_VECTOR2_ARRAY
+    (VARIANT_STORAGE_PACKED_ARRAY, "Variant::PackedArrayRef<Vector3>",        "packedVector3Arrayref"),  # PACKED_VECTOR3_ARRAY
+    (VARIANT_STORAGE_PACKED_ARRAY, "Variant::PackedArrayRef<Color>",          "packedColorArrayref"),    # PACKED_COLOR_ARRAY
+    (VARIANT_STORAGE_PACKED_ARRAY, "Variant::PackedArrayRef<Vector4>",        "packedVector4Arrayref"),  # PACKED_VECTOR4_ARRAY
+]
+# fmt: on
+
+
+class VariantTypeTable:
+    """
+    Pre-resolved SBTypes for every Variant type tag, built once per target.
+    A type missing from the target is remembered as None rather than searched for again.
+    """
+
+    def __init__(self, target: SBTarget):
+        self.target = target
+        self.types: list[Optional[SBType]] = [self._find_type(layout) for layout in VARIANT_TYPE_LAYOUT]
+
+    def _find_type(self, layout: tuple[str, Optional[str], Optional[str]]) -> Optional[SBType]:
+        kind, type_name, _ = layout
+        if kind not in (VARIANT_STORAGE_MEM, VARIANT_STORAGE_OBJECT, VARIANT_STORAGE_PACKED_ARRAY) or not type_name:
+            return None
+        sbtype = self.target.FindFirstType(type_name)
+        if not sbtype or not sbtype.IsValid():
+            return None
+        return sbtype
+
+    def get_type(self, variant_type: int) -> Optional[SBType]:
+        return self.types[variant_type]
+
+
+variant_type_tables: dict[int, VariantTypeTable] = {}
+
+
+def get_variant_type_table(target: SBTarget) -> VariantTypeTable:
+    key = get_target_key(target)
+    table = variant_type_tables.get(key)
+    if table is None:
+        table = variant_type_tables[key] = VariantTypeTable(target)
+    return table
+
+
 @print_trace_dec
 def Variant_GetValue(valobj: SBValue):
     # we need to get the type of the variant
     type = valobj.GetChildMemberWithName("type").GetValueAsUnsigned()
-    # switch on type
+    if type >= len(VARIANT_TYPE_LAYOUT):
+        return None
+    kind, member_name, child_name = VARIANT_TYPE_LAYOUT[type]
+    if kind == VARIANT_STORAGE_NIL:
+        return None
     data: SBValue = valobj.GetChildMemberWithName("_data")
-    mem: SBValue = data.GetChildMemberWithName("_mem")
-    mem_addr: SBAddress = mem.GetAddress()
-    packed_array: SBValue = data.GetChildMemberWithName("packed_array")
-    packed_array_addr: SBAddress = packed_array.GetAddress()
+    if kind == VARIANT_STORAGE_MEMBER:
+        return data.GetChildMemberWithName(member_name)
+    if kind == VARIANT_STORAGE_POINTER:
+        ptr = data.GetChildMemberWithName(member_name)
+        if is_valid_pointer(ptr):
+            return ptr
+        return None
     target: SBTarget = valobj.target
-    if type == VariantType.NIL.value:
+    # For _mem values, we have to cast them to the correct type
+    value_type = get_variant_type_table(target).get_type(type)
+    if value_type is None:
         return None
-    elif type == VariantType.BOOL.value:
-        return data.GetChildMemberWithName("_bool")
-    elif type == VariantType.INT.value:
-        return data.GetChildMemberWithName("_int")
-    elif type == VariantType.FLOAT.value:
-        return data.GetChildMemberWithName("_float")
-    elif type == VariantType.TRANSFORM2D.value:
-        _transform2d = data.GetChildMemberWithName("_transform2d")
-        if is_valid_pointer(_transform2d):
-            return _transform2d
-        else:
-            return None
-    elif type == VariantType.AABB.value:
-        _aabb = data.GetChildMemberWithName("_aabb")
-        if is_valid_pointer(_aabb):
-            return _aabb
-        else:
-            return None
-    elif type == VariantType.BASIS.value:
-        _basis = data.GetChildMemberWithName("_basis")
-        if is_valid_pointer(_basis):
-            return _basis
-        else:
-            return None
-    elif type == VariantType.TRANSFORM3D.value:
-        _transform3d = data.GetChildMemberWithName("_transform3d")
-        if is_valid_pointer(_transform3d):
-            return _transform3d
-        else:
-            return None
-    elif type == VariantType.PROJECTION.value:
-        _projection = data.GetChildMemberWithName("_projection")
-        if is_valid_pointer(_projection):
-            return _projection
-        else:
-            return None
-    elif type == VariantType.STRING.value:  # For _mem values, we have to cast them to the correct type
-        # find the type for "String"
-        stringType: SBType = target.FindFirstType("::String")
-        string: SBValue = target.CreateValueFromAddress("[string]", mem_addr, stringType)
-        return string
-    elif type == VariantType.VECTOR2.value:
-        vector2Type: SBType = target.FindFirstType("::Vector2")
-        vector2: SBValue = target.CreateValueFromAddress("[vector2]", mem_addr, vector2Type)
-        return vector2
-    elif type == VariantType.VECTOR2I.value:
-        vector2IType: SBType = target.FindFirstType("::Vector2i")
-        vector2i: SBValue = target.CreateValueFromAddress("[vector2i]", mem_addr, vector2IType)
-        return vector2i
-    elif type == VariantType.RECT2.value:
-        rect2Type: SBType = target.FindFirstType("::Rect2")
-        rect2: SBValue = target.CreateValueFromAddress("[rect2]", mem_addr, rect2Type)
-        return rect2
-    elif type == VariantType.RECT2I.value:
-        rect2IType: SBType = target.FindFirstType("::Rect2i")
-        rect2i: SBValue = target.CreateValueFromAddress("[rect2i]", mem_addr, rect2IType)
-        return rect2i
-    elif type == VariantType.VECTOR3.value:
-        vector3Type: SBType = target.FindFirstType("::Vector3")
-        vector3: SBValue = target.CreateValueFromAddress("[vector3]", mem_addr, vector3Type)
-        return vector3
-    elif type == VariantType.VECTOR3I.value:
-        vector3iType: SBType = target.FindFirstType("::Vector3i")
-        vector3i: SBValue = target.CreateValueFromAddress("[vector3i]", mem_addr, vector3iType)
-        return vector3i
-    elif type == VariantType.VECTOR4.value:
-        vector4Type: SBType = target.FindFirstType("::Vector4")
-        vector4: SBValue = target.CreateValueFromAddress("[vector4]", mem_addr, vector4Type)
-        return vector4
-    elif type == VariantType.VECTOR4I.value:
-        vector4iType: SBType = target.FindFirstType("::Vector4i")
-        vector4i: SBValue = target.CreateValueFromAddress("[vector4i]", mem_addr, vector4iType)
-        return vector4i
-    elif type == VariantType.PLANE.value:
-        planeType: SBType = target.FindFirstType("::Plane")
-        plane: SBValue = target.CreateValueFromAddress("[plane]", mem_addr, planeType)
-        return plane
-    elif type == VariantType.QUATERNION.value:
-        quaternionType: SBType = target.FindFirstType("::Quaternion")
-        quaternion: SBValue = target.CreateValueFromAddress("[quaternion]", mem_addr, quaternionType)
-        return quaternion
-    elif type == VariantType.COLOR.value:
-        colorType: SBType = target.FindFirstType("::Color")
-        color: SBValue = target.CreateValueFromAddress("[color]", mem_addr, colorType)
-        return color
-    elif type == VariantType.STRING_NAME.value:
-        stringNameType: SBType = target.FindFirstType("::StringName")
-        stringName: SBValue = target.CreateValueFromAddress("[stringName]", mem_addr, stringNameType)
-        return stringName
-    elif type == VariantType.NODE_PATH.value:
-        nodePathType: SBType = target.FindFirstType("::NodePath")
-        nodePath: SBValue = target.CreateValueFromAddress("[nodePath]", mem_addr, nodePathType)
-        return nodePath
-    elif type == VariantType.RID.value:
-        ridType: SBType = target.FindFirstType("::RID")
-        rid: SBValue = target.CreateValueFromAddress("[rid]", mem_addr, ridType)
-        return rid
-    elif type == VariantType.OBJECT.value:
-        objDataType: SBType = target.FindFirstType("Variant::ObjData")
-        objData: SBValue = target.CreateValueFromAddress("[objData]", mem_addr, objDataType)
-        return objData.GetChildMemberWithName("obj")
-    elif type == VariantType.CALLABLE.value:
-        callableType: SBType = target.FindFirstType("::Callable")
-        callable: SBValue = target.CreateValueFromAddress("[callable]", mem_addr, callableType)
-        return callable
-    elif type == VariantType.SIGNAL.value:
-        signalType: SBType = target.FindFirstType("::Signal")
-        signal: SBValue = target.CreateValueFromAddress("[signal]", mem_addr, signalType)
-        return signal
-    elif type == VariantType.DICTIONARY.value:
-        dictionaryType: SBType = target.FindFirstType("::Dictionary")
-        dictionary: SBValue = target.CreateValueFromAddress("[dictionary]", mem_addr, dictionaryType)
-        return dictionary
-    elif type == VariantType.ARRAY.value:
-        arrayType: SBType = target.FindFirstType("::Array")
-        array: SBValue = target.CreateValueFromAddress("[array]", mem_addr, arrayType)
-        return array
-    else:
+    if kind == VARIANT_STORAGE_PACKED_ARRAY:
+        packed_array: SBValue = data.GetChildMemberWithName("packed_array")
         if not is_valid_pointer(packed_array):
             return None
-        if type == VariantType.PACKED_BYTE_ARRAY.value:
-            packedByteArrayType: SBType = target.FindFirstType("Variant::PackedArrayRef<unsigned char>")
-            packedByteArray: SBValue = target.CreateValueFromAddress(
-                "packedByteArrayref", packed_array_addr, packedByteArrayType
-            )
-            return packedByteArray.GetChildMemberWithName("array")
-        elif type == VariantType.PACKED_INT32_ARRAY.value:
-            packedInt32ArrayType: SBType = target.FindFirstType("Variant::PackedArrayRef<int>")
-            packedInt32Array: SBValue = target.CreateValueFromAddress(
-                "packedInt32Arrayref", packed_array_addr, packedInt32ArrayType
-            )
-            return packedInt32Array.GetChildMemberWithName("array")
-        elif type == VariantType.PACKED_INT64_ARRAY.value:
-            packedInt64ArrayType: SBType = target.FindFirstType("Variant::PackedArrayRef<long long>")
-            packedInt64Array: SBValue = target.CreateValueFromAddress(
-                "packedInt64Arrayref", packed_array_addr, packedInt64ArrayType
-            )
-            return packedInt64Array.GetChildMemberWithName("array")
-        elif type == VariantType.PACKED_FLOAT32_ARRAY.value:
-            packedFloat32ArrayType: SBType = target.FindFirstType("Variant::PackedArrayRef<float>")
-            packedFloat32Array: SBValue = target.CreateValueFromAddress(
-                "packedFloat32Arrayref", packed_array_addr, packedFloat32ArrayType
-            )
-            return packedFloat32Array.GetChildMemberWithName("array")
-        elif type == VariantType.PACKED_FLOAT64_ARRAY.value:
-            packedFloat64ArrayType: SBType = target.FindFirstType("Variant::PackedArrayRef<double>")
-            packedFloat64Array: SBValue = target.CreateValueFromAddress(
-                "packedFloat64Arrayref", packed_array_addr, packedFloat64ArrayType
-            )
-            return packedFloat64Array.GetChildMemberWithName("array")
-        elif type == VariantType.PACKED_VECTOR2_ARRAY.value:
-            packedVector2ArrayType: SBType = target.FindFirstType("Variant::PackedArrayRef<Vector2>")
-            packedVector2Array: SBValue = target.CreateValueFromAddress(
-                "packedVector2Arrayref", packed_array_addr, packedVector2ArrayType
-            )
-            return packedVector2Array.GetChildMemberWithName("array")
-        elif type == VariantType.PACKED_VECTOR3_ARRAY.value:
-            packedVector3ArrayType: SBType = target.FindFirstType("Variant::PackedArrayRef<Vector3>")
-            packedVector3Array: SBValue = target.CreateValueFromAddress(
-                "packedVector3Arrayref", packed_array_addr, packedVector3ArrayType
-            )
-            return packedVector3Array.GetChildMemberWithName("array")
-        elif type == VariantType.PACKED_STRING_ARRAY.value:
-            packedStringArrayType: SBType = target.FindFirstType("Variant::PackedArrayRef<String>")
-            packedStringArray: SBValue = target.CreateValueFromAddress(
-                "packedStringArrayref", packed_array_addr, packedStringArrayType
-            )
-            return packedStringArray.GetChildMemberWithName("array")
-        elif type == VariantType.PACKED_COLOR_ARRAY.value:
-            packedColorArrayType: SBType = target.FindFirstType("Variant::PackedArrayRef<Color>")
-            packedColorArray: SBValue = target.CreateValueFromAddress(
-                "packedColorArrayref", packed_array_addr, packedColorArrayType
-            )
-            return packedColorArray.GetChildMemberWithName("array")
-        elif type == VariantType.PACKED_VECTOR4_ARRAY.value:
-            packedVector4ArrayType: SBType = target.FindFirstType("Variant::PackedArrayRef<Vector4>")
-            packedVector4Array: SBValue = target.CreateValueFromAddress(
-                "packedVector4Arrayref", packed_array_addr, packedVector4ArrayType
-            )
-            return packedVector4Array.GetChildMemberWithName("array")
-    return None
+        packed_array_ref = target.CreateValueFromAddress(child_name, packed_array.GetAddress(), value_type)
+        return packed_array_ref.GetChildMemberWithName("array")
+    mem_addr: SBAddress = data.GetChildMemberWithName("_mem").GetAddress()
+    value: SBValue = target.CreateValueFromAddress(child_name, mem_addr, value_type)
+    if kind == VARIANT_STORAGE_OBJECT:
+        return value.GetChildMemberWithName("obj")
+    return value
 
 
 class _SBSyntheticValueProviderWithSummary(SBSyntheticValueProvider):
+    __slots__ = ()
+
     def get_summary(self, max_children=Opts.MAX_AMOUNT_OF_CHILDREN_IN_SUMMARY, max_str_len=Opts.SUMMARY_STRING_MAX_LENGTH) -> str:
         raise Exception("Not implemented")
 
@@ -311,9 +254,36 @@ class _SBSyntheticValueProviderWithSummary(SBSyntheticValueProvider):
         raise Exception("Not implemented")
 
 
+# Validation tiers, from cheapest to most thorough; passing a tier implies passing the ones before it
+VALIDATION_CHEAP = 0  # the object's own members, and pointer lookups in the memory region map
+VALIDATION_MEDIUM = 1  # a few reads through pointers (e.g. the head of a list)
+VALIDATION_FULL = 2  # everything the synthetic children rely on (e.g. the tail of a list)
+VALIDATION_TIERS = (VALIDATION_CHEAP, VALIDATION_MEDIUM, VALIDATION_FULL)
+
+# (load address, type name, provider class) -> (highest tier passed, tier that failed or None), shared by every
+# provider of the same object during a stop (e.g. its summary and its synthetic children)
+validity_cache = StopScopedCache("validity")
+
+PROVIDER_REGISTRY_MAX_ENTRIES = 10000
+
+# (load address, type name, provider class) -> the provider made for that object during the current stop, so that its
+# summary, its synthetic children and any wrapper around it (Array, Dictionary, GDExtension types...) share one provider
+provider_registry = StopScopedCache("providers", PROVIDER_REGISTRY_MAX_ENTRIES)
+
+
+def get_provider_registry_key(cls: type, valobj: SBValue) -> Optional[tuple]:
+    load_address = valobj.GetLoadAddress()
+    if load_address == LLDB_INVALID_ADDRESS or load_address == 0:
+        return None
+    # range children are at the address of their container, but only show part of it
+    if parse_range_child_name(valobj.GetName()) is not None:
+        return None
+    return (load_address, valobj.GetType().GetUnqualifiedType().GetDisplayTypeName(), cls)
+
+
 class GodotSynthProvider(_SBSyntheticValueProviderWithSummary):
-    synth_by_id: weakref.WeakValueDictionary[int, _SBSyntheticValueProviderWithSummary] = weakref.WeakValueDictionary()
-    next_id = 0
+    # Providers only keep their state in slots; class attributes are only used for per-class constants
+    __slots__ = ("valobj", "internal_dict", "is_summary")
 
     @print_trace_dec
     def __init__(self, valobj: SBValue, internal_dict, is_summary=False):
@@ -321,9 +291,17 @@ class GodotSynthProvider(_SBSyntheticValueProviderWithSummary):
         self.valobj = valobj
         self.internal_dict = internal_dict
         self.is_summary = is_summary
-        self.obj_id = GodotSynthProvider.next_id
-        GodotSynthProvider.synth_by_id[self.obj_id] = self
-        GodotSynthProvider.next_id += 1
+        self._register()
+
+    def _register(self):
+        key = get_provider_registry_key(type(self), self.valobj)
+        if key is None:
+            return
+        provider_registry.sync(self.valobj.GetProcess())
+        existing: Optional[GodotSynthProvider] = provider_registry.get(key)
+        # don't replace a provider made for the synthetic children with one that was only made for a summary
+        if existing is None or existing.is_summary or not self.is_summary:
+            provider_registry.put(key, self)
 
     # SBSyntheticValueProvider, override these
     def num_children(self, max=UINT32_MAX) -> int:
@@ -342,8 +320,6 @@ class GodotSynthProvider(_SBSyntheticValueProviderWithSummary):
     # Don't override this, override get_index_of_child instead
     @print_trace_dec
     def get_child_index(self, name: str) -> Optional[int]:
-        if name == "$$object-id$$":
-            return self.obj_id
         try:
             return self.get_index_of_child(name)
         except Exception as e:
@@ -357,7 +333,7 @@ class GodotSynthProvider(_SBSyntheticValueProviderWithSummary):
     # _SBSyntheticValueProviderWithSummary
     @print_trace_dec
     def get_summary(self, max_children=Opts.MAX_AMOUNT_OF_CHILDREN_IN_SUMMARY, max_str_len=Opts.SUMMARY_STRING_MAX_LENGTH) -> str:
-        if not self.check_valid(self.valobj):
+        if not self.is_valid():
             return INVALID_SUMMARY
         return GenericShortSummary(self.valobj, self.internal_dict, summary_length=max_str_len, no_children=True)
 
@@ -365,36 +341,87 @@ class GodotSynthProvider(_SBSyntheticValueProviderWithSummary):
         print("check_valid not implemented")
         return False
 
+    def check_valid_tier(self, obj: SBValue, tier: int) -> bool:
+        """
+        Runs the checks of one tier; it's only called once the tiers before it have passed.
+        By default, check_valid() is the full tier.
+        """
+        return self.check_valid(obj) if tier == VALIDATION_FULL else True
+
+    def is_valid(self, tier: Optional[int] = None) -> bool:
+        """
+        Validates self.valobj up to `tier`: the cheap tier for summaries, and the full tier for synthetic children by default.
+        Verdicts are cached for the current stop, so each tier of an object is checked at most once however many providers ask.
+        """
+        if tier is None:
+            tier = VALIDATION_CHEAP if self.is_summary else VALIDATION_FULL
+        load_address = self.valobj.GetLoadAddress()
+        if load_address == LLDB_INVALID_ADDRESS or load_address == 0:
+            return all(self.check_valid_tier(self.valobj, t) for t in VALIDATION_TIERS[: tier + 1])
+        validity_cache.sync(self.valobj.GetProcess())
+        key = (load_address, self.valobj.GetType().GetUnqualifiedType().GetName(), type(self))
+        passed, failed = validity_cache.get(key, (-1, None))
+        if failed is not None:
+            return failed > tier
+        if passed >= tier:
+            return True
+        while passed < tier:
+            if not self.check_valid_tier(self.valobj, passed + 1):
+                validity_cache.put(key, (passed, passed + 1))
+                return False
+            passed += 1
+        validity_cache.put(key, (passed, None))
+        return True
+
 # template function
 T = TypeVar('T', bound=_SBSyntheticValueProviderWithSummary)
 
 def get_synth_provider_for_object(cls: type[T], valobj: SBValue, internal_dict, is_summary) -> T:
-    obj_id = valobj.GetIndexOfChildWithName("$$object-id$$")
-    if obj_id in GodotSynthProvider.synth_by_id:
-        synth_prov = GodotSynthProvider.synth_by_id[obj_id]  # type: ignore
-        if isinstance(synth_prov, cls):
+    """
+    Returns the provider already made for this object during the current stop, or makes (and registers) a new one.
+    A provider made for the synthetic children can also be used for a summary, but not the other way around.
+    """
+    obj = valobj.GetNonSyntheticValue()
+    key = get_provider_registry_key(cls, obj)
+    if key is not None:
+        provider_registry.sync(obj.GetProcess())
+        synth_prov = provider_registry.get(key)
+        if synth_prov is not None and (is_summary or not synth_prov.is_summary):
             return synth_prov
-        else:
-            print(f"ERROR: Synth provider for {valobj.GetDisplayTypeName()} is not of type {cls.__name__}, is {type(synth_prov).__name__}")
-    return cls(valobj.GetNonSyntheticValue(), internal_dict, is_summary)  # type: ignore
+    return cls(obj, internal_dict, is_summary)  # type: ignore
+
+
+@print_trace_dec
+def get_synth_summary(synth_class, valobj: SBValue, dict):
+    synth = get_synth_provider_for_object(synth_class, valobj, dict, is_summary=True)
+    return synth.get_summary()
 
 
 class Variant_SyntheticProvider(GodotSynthProvider):
+    __slots__ = ("data", "variant_type")
+
     def __init__(self, valobj: SBValue, internal_dict, is_summary=False):
         super().__init__(valobj, internal_dict, is_summary)
         self.update()
 
     @print_trace_dec
     def check_valid(self, obj: SBValue) -> bool:
-        variant_type = obj.GetChildMemberWithName("type").GetValueAsUnsigned()
-        data = Variant_GetValue(obj)
-        if variant_type < VariantType.NIL.value or variant_type >= VariantType.VARIANT_MAX.value:
-            return False
+        return all(self.check_valid_tier(obj, tier) for tier in VALIDATION_TIERS)
+
+    def check_valid_tier(self, obj: SBValue, tier: int) -> bool:
+        if tier == VALIDATION_CHEAP:
+            variant_type = obj.GetChildMemberWithName("type").GetValueAsUnsigned()
+            return VariantType.NIL.value <= variant_type < VariantType.VARIANT_MAX.value
+        if tier != VALIDATION_FULL:
+            return True
+        # update() already decoded our own value
+        if obj is self.valobj:
+            variant_type, data = self.variant_type, self.data
+        else:
+            variant_type, data = obj.GetChildMemberWithName("type").GetValueAsUnsigned(), Variant_GetValue(obj)
         if VariantType.NIL.value == variant_type:
             return True
-        if data is None or not data.IsValid():
-            return False
-        return True
+        return data is not None and data.IsValid()
 
     @print_trace_dec
     def _get_variant_type(self):
@@ -407,7 +434,8 @@ class Variant_SyntheticProvider(GodotSynthProvider):
 
     @print_trace_dec
     def get_summary(self, max_children=Opts.MAX_AMOUNT_OF_CHILDREN_IN_SUMMARY, max_str_len=Opts.SUMMARY_STRING_MAX_LENGTH):
-        if not self.check_valid(self.valobj):
+        # the summary shows the decoded value, so it needs the full tier
+        if not self.is_valid(VALIDATION_FULL):
             return INVALID_SUMMARY
         type = self.variant_type
         if type == VariantType.NIL.value:
@@ -450,14 +478,41 @@ class Variant_SyntheticProvider(GodotSynthProvider):
         return self.data or SBValue()
 
 
+STRING_NAME_CACHE_MAX_ENTRIES = 20000
+
+# StringName data is interned and isn't modified while referenced, so the `_data` pointer identifies the name
+string_name_cache = SessionCache("string_names", STRING_NAME_CACHE_MAX_ENTRIES)
+# summary -> `_data` pointer; lets map lookups by a StringName key compare pointers like StringName::operator< does
+string_name_addresses = SessionCache("string_name_addresses", STRING_NAME_CACHE_MAX_ENTRIES)
+
+
 def StringName_SummaryProvider(valobj: SBValue, internal_dict):
     _data: SBValue = valobj.GetChildMemberWithName("_data")
-    if _data.GetValueAsUnsigned() == 0:
+    data_addr = _data.GetValueAsUnsigned()
+    if data_addr == 0:
         return NULL_SUMMARY
+    string_name_cache.sync(valobj.GetProcess())
+    summary = string_name_cache.get(data_addr)
+    if summary is not None:
+        return summary
     if _data.GetChildMemberWithName("cname").GetValueAsUnsigned() == 0:
-        return _data.GetChildMemberWithName("name").GetSummary()
+        summary = _data.GetChildMemberWithName("name").GetSummary()
     else:
-        return _data.GetChildMemberWithName("cname").GetSummary()
+        summary = _data.GetChildMemberWithName("cname").GetSummary()
+    if summary:
+        string_name_cache.put(data_addr, summary)
+        string_name_addresses.sync(valobj.GetProcess())
+        string_name_addresses.put(summary, data_addr)
+    return summary
+
+
+def get_string_name_summary(valobj: SBValue) -> str:
+    """
+    Summary of a StringName member, without going through LLDB's formatter lookup.
+    """
+    if not not_null_check(valobj):
+        return INVALID_SUMMARY
+    return StringName_SummaryProvider(valobj.GetNonSyntheticValue(), None) or INVALID_SUMMARY
 
 
 def Ref_SummaryProvider(valobj: SBValue, internal_dict):
@@ -489,27 +544,31 @@ def NodePath_SummaryProvider(valobj: SBValue, internal_dict):
         rstr = "/"
     for i in range(path_size):
         child = path.get_child_at_index(i)
-        rstr += strip_quotes(get_summary_or_invalid_summary(child))
+        rstr += strip_quotes(get_string_name_summary(child))
         if i < path.num_children() - 1:
             rstr += "/"
     if subpath_size > 0:
         rstr += ":"
     for i in range(subpath_size):
         child = subpath.get_child_at_index(i)
-        rstr += strip_quotes(get_summary_or_invalid_summary(child))
+        rstr += strip_quotes(get_string_name_summary(child))
         if i < subpath_size - 1:
             rstr += ":"
     return rstr
 
 
-@print_trace_dec
-def Quaternion_SummaryProvider(valobj: SBValue, internal_dict):
-    return "{{{0}, {1}, {2}, {3}}}".format(
-        GetFloat(valobj.GetChildMemberWithName("x")),
-        GetFloat(valobj.GetChildMemberWithName("y")),
-        GetFloat(valobj.GetChildMemberWithName("z")),
-        GetFloat(valobj.GetChildMemberWithName("w")),
-    )
+# Shared by the summary providers below and by the packed summary formatters, so that both print the same thing
+VECTOR2_SUMMARY_FORMAT = "({0}, {1})"
+VECTOR3_SUMMARY_FORMAT = "({0}, {1}, {2})"
+VECTOR4_SUMMARY_FORMAT = "({0}, {1}, {2}, {3})"
+RECT2_SUMMARY_FORMAT = "{{position: ({0}, {1}), size: ({2}, {3})}}"
+QUATERNION_SUMMARY_FORMAT = "{{{0}, {1}, {2}, {3}}}"
+PLANE_SUMMARY_FORMAT = "{{normal: ({0}, {1}, {2}), d: {3}}}"
+AABB_SUMMARY_FORMAT = "{{position: {{({0}, {1}, {2})}}, size: {{({3}, {4}, {5})}}}}"
+TRANSFORM2D_SUMMARY_FORMAT = "{{x: ({0}, {1}), y: ({2}, {3}), o: ({4}, {5})}}"
+BASIS_SUMMARY_FORMAT = "{{({0}, {1}, {2}), ({3}, {4}, {5}), ({6}, {7}, {8})}}"
+TRANSFORM3D_SUMMARY_FORMAT = "{{basis: {{({0}, {1}, {2}), ({3}, {4}, {5}), ({6}, {7}, {8})}}, origin: ({9}, {10}, {11})}}"
+PROJECTION_SUMMARY_FORMAT = "{{columns: {{({0}, {1}, {2}, {3}), ({4}, {5}, {6}, {7}), ({8}, {9}, {10}, {11}), ({12}, {13}, {14}, {15})}}}}"
 
 
 @print_trace_dec
@@ -529,7 +588,7 @@ def Signal_SummaryProvider(valobj: SBValue, internal_dict):
     # Signal has a StringName name and an ObjectID object
     name: SBValue = valobj.GetChildMemberWithName("name")
     object: SBValue = valobj.GetChildMemberWithName("object")
-    name_summary, object_summary = name.GetSummary(), object.GetSummary()
+    name_summary, object_summary = get_string_name_summary(name), object.GetSummary()
     if not name_summary or not object_summary:
         return INVALID_SUMMARY
     if NULL_SUMMARY in name_summary and NULL_SUMMARY in object_summary:
@@ -541,7 +600,7 @@ def Signal_SummaryProvider(valobj: SBValue, internal_dict):
 def Callable_SummaryProvider(valobj: SBValue, internal_dict):
     # If `method` is blank, and `custom` is not a null pointer, then it's a CallableCustom
     method: SBValue = valobj.GetChildMemberWithName("method")  # StringName
-    method_name: str = method.GetSummary()
+    method_name: str = get_string_name_summary(method)
     if method_name == NULL_SUMMARY or method_name == EMPTY_SUMMARY:
         custom: SBValue = valobj.GetChildMemberWithName("custom")
         if custom.GetValueAsUnsigned() != 0:
@@ -560,205 +619,285 @@ def Callable_SummaryProvider(valobj: SBValue, internal_dict):
             return "{{<Callable> object:{0}, method:{1}}}".format(obj_id_val, method_name)
 
 
+def ConstructNamedColorTable(global_named_colors_table: SBValue) -> dict[int, str]:
+    table: dict[int, str] = dict[int, str]()
+    try:
+        for i in range(global_named_colors_table.GetNumChildren()):
+            named_color = ValCheck(global_named_colors_table.GetChildAtIndex(i))
+            name_val = ValCheck(named_color.GetChildMemberWithName("name"))
+            name_val_summary = name_val.GetSummary()
+            if not name_val_summary:  # nullptr at the end of the array
+                break
+            name = strip_quotes(name_val_summary)
+            color = ValCheck(named_color.GetChildMemberWithName("color"))
+            table[quantize_color(*GetColorVals(color))] = name
+    except Exception as e:
+        print_verbose(f"EXCEPTION ConstructNamedColorTable: " + str(e))
+        return dict[int, str]()
+    return table
+
+
+# target -> the target's own `named_colors` table, or None if it doesn't have one (the static NAMED_COLORS is used then)
+named_color_tables: dict[int, Optional[dict[int, str]]] = {}
+
+
+def GetNamedColorTable(target: SBTarget) -> Optional[dict[int, str]]:
+    """
+    The live table overrides the static one, in case the engine's colors differ from ours.
+    The target is only searched once; a missing table is remembered as None.
+    """
+    key = get_target_key(target)
+    if key not in named_color_tables:
+        named_colors = target.FindFirstGlobalVariable("named_colors")
+        table = None
+        if named_colors and named_colors.IsValid() and named_colors.GetNumChildren() > 0:
+            table = ConstructNamedColorTable(named_colors) or None
+        named_color_tables[key] = table
+    return named_color_tables[key]
+
+
+def GetColorAlias(valobj: SBValue, vals: Optional[tuple[float, float, float, float]] = None) -> str:
+    rgba8 = quantize_color(*(vals if vals else GetColorVals(valobj)))
+    name = get_named_color(rgba8, GetNamedColorTable(valobj.target))
+    return name if name is not None else "#{:08x}".format(rgba8)
+
+
+def GetHexColor(r, g, b, a) -> str:
+    return "#{:08x}".format(quantize_color(r, g, b, a))
+
+
+def GetColorVals(valobj: SBValue):
+    vals = unpack_math_value(valobj)
+    if vals is None:
+        return (
+            GetFloat(valobj.GetChildMemberWithName("r")),
+            GetFloat(valobj.GetChildMemberWithName("g")),
+            GetFloat(valobj.GetChildMemberWithName("b")),
+            GetFloat(valobj.GetChildMemberWithName("a")),
+        )
+    return vals
+
+
+def get_color_summary(valobj: SBValue, r: float, g: float, b: float, a: float) -> str:
+    if not Opts.NAMED_COLOR_ANNOTATION:
+        hex_str = GetHexColor(r, g, b, a)
+    else:
+        hex_str = GetColorAlias(valobj, (r, g, b, a))
+    return "{{<{0}> r:{1:.3f}, g:{2:.3f}, b:{3:.3f}, a:{4:.3f}}}".format(hex_str, r, g, b, a)
+
+
+# ********************************************************
+# PACKED SUMMARY FORMATTERS
+# Format the elements of a container straight from its buffer, instead of creating an SBValue per element.
+# ********************************************************
+
+# struct codes for basic types, by (is_signed, byte size); same signedness as get_basic_printable_string()
+_SIGNED_INT_CODES = {1: "b", 2: "h", 4: "i", 8: "q"}
+_UNSIGNED_INT_CODES = {1: "B", 2: "H", 4: "I", 8: "Q"}
+_PACKED_SIGNED_BASIC_TYPES = (eBasicTypeSignedChar, eBasicTypeShort, eBasicTypeInt, eBasicTypeLong, eBasicTypeLongLong)
+_PACKED_UNSIGNED_BASIC_TYPES = (
+    eBasicTypeUnsignedChar,
+    eBasicTypeUnsignedShort,
+    eBasicTypeUnsignedInt,
+    eBasicTypeUnsignedLong,
+    eBasicTypeUnsignedLongLong,
+    eBasicTypeBool,
+)
+
+# type name -> (number of components, component kind, format); "real" components are float or double depending on real_t
+# fmt: off
+PACKED_MATH_TYPES: dict[str, tuple[int, str, Any]] = {
+    "Vector2":    (2, "real",  VECTOR2_SUMMARY_FORMAT),
+    "Vector3":    (3, "real",  VECTOR3_SUMMARY_FORMAT),
+    "Vector4":    (4, "real",  VECTOR4_SUMMARY_FORMAT),
+    "Vector2i":   (2, "int32", VECTOR2_SUMMARY_FORMAT),
+    "Vector3i":   (3, "int32", VECTOR3_SUMMARY_FORMAT),
+    "Vector4i":   (4, "int32", VECTOR4_SUMMARY_FORMAT),
+    "Rect2":      (4, "real",  RECT2_SUMMARY_FORMAT),
+    "Rect2i":     (4, "int32", RECT2_SUMMARY_FORMAT),
+    "Quaternion": (4, "real",  QUATERNION_SUMMARY_FORMAT),
+    "Color":      (4, "float", get_color_summary),
+    "Plane":      (4, "real",  PLANE_SUMMARY_FORMAT),
+    "AABB":       (6, "real",  AABB_SUMMARY_FORMAT),
+    "Transform2D": (6, "real", TRANSFORM2D_SUMMARY_FORMAT),
+    "Basis":      (9, "real",  BASIS_SUMMARY_FORMAT),
+    "Transform3D": (12, "real", TRANSFORM3D_SUMMARY_FORMAT),
+    "Projection": (16, "real", PROJECTION_SUMMARY_FORMAT),
+}
+# fmt: on
+
+
+class PackedSummaryFormatter:
+    """
+    Formats elements of a basic or math type from raw memory with struct.iter_unpack.
+    """
+
+    def __init__(self, element_format: str, format):
+        self.struct = struct.Struct(element_format)
+        # str.format string, or a function taking (valobj, *components)
+        self.format = format
+
+    def format_elements(self, valobj: SBValue, data: bytes) -> list[str]:
+        if isinstance(self.format, str):
+            return [self.format.format(*vals) for vals in self.struct.iter_unpack(data)]
+        return [self.format(valobj, *vals) for vals in self.struct.iter_unpack(data)]
+
+    def format_value(self, valobj: SBValue, vals: tuple) -> str:
+        if isinstance(self.format, str):
+            return self.format.format(*vals)
+        return self.format(valobj, *vals)
+
+
+def _create_packed_summary_formatter(type: SBType) -> Optional[PackedSummaryFormatter]:
+    canonical: SBType = type.GetCanonicalType()
+    byte_size = canonical.GetByteSize()
+    if canonical.GetTypeClass() == eTypeClassEnumeration:
+        return None
+    basic_type = canonical.GetBasicType()
+    code = None
+    if basic_type in _PACKED_SIGNED_BASIC_TYPES:
+        code = _SIGNED_INT_CODES.get(byte_size)
+    elif basic_type in _PACKED_UNSIGNED_BASIC_TYPES:
+        code = _UNSIGNED_INT_CODES.get(byte_size)
+    elif basic_type in (eBasicTypeFloat, eBasicTypeDouble):
+        code = {4: "f", 8: "d"}.get(byte_size)
+    if code is not None:
+        return PackedSummaryFormatter("<" + code, "{0}")
+    math_type = PACKED_MATH_TYPES.get(canonical.GetUnqualifiedType().GetDisplayTypeName().removeprefix("::"))
+    if math_type is None:
+        return None
+    count, kind, format = math_type
+    if kind == "int32":
+        code = "i"
+    elif kind == "float":
+        code = "f"
+    else:
+        code = {4: "f", 8: "d"}.get(byte_size // count) if byte_size % count == 0 else None
+    if code is None or struct.calcsize("<" + code * count) != byte_size:
+        return None
+    return PackedSummaryFormatter("<" + code * count, format)
+
+
+# (target, type name) -> formatter, or None if the type can't be formatted from raw memory
+packed_summary_formatters: dict[tuple[int, str], Optional[PackedSummaryFormatter]] = {}
+
+
+def get_packed_summary_formatter(target: SBTarget, type: SBType) -> Optional[PackedSummaryFormatter]:
+    key = (get_target_key(target), type.GetName())
+    if key not in packed_summary_formatters:
+        packed_summary_formatters[key] = _create_packed_summary_formatter(type)
+    return packed_summary_formatters[key]
+
+
+# ********************************************************
+# MATH TYPE SUMMARIES
+# Decoded from one read of the whole value, instead of a GetChildMemberWithName() and GetData() per component.
+# ********************************************************
+
+
+def unpack_math_value(valobj: SBValue) -> Optional[tuple]:
+    formatter = get_packed_summary_formatter(valobj.GetTarget(), valobj.GetType())
+    if formatter is None:
+        return None
+    data = read_value_data(valobj, formatter.struct.size)
+    if data is None:
+        return None
+    return formatter.struct.unpack(data)
+
+
+def get_math_summary(valobj: SBValue) -> str:
+    # the formatter is cached per type, and only made if the type's size matches its components (i.e. real_t's size)
+    formatter = get_packed_summary_formatter(valobj.GetTarget(), valobj.GetType())
+    if formatter is None:
+        return INVALID_SUMMARY
+    data = read_value_data(valobj, formatter.struct.size)
+    if data is None:
+        return INVALID_SUMMARY
+    return formatter.format_value(valobj, formatter.struct.unpack(data))
+
+
 @print_trace_dec
 def Vector2_SummaryProvider(valobj: SBValue, internal_dict):
-    return "({0}, {1})".format(
-        GetFloat(valobj.GetChildMemberWithName("x")),
-        GetFloat(valobj.GetChildMemberWithName("y")),
-    )
+    return get_math_summary(valobj)
 
 
 @print_trace_dec
 def Vector3_SummaryProvider(valobj: SBValue, internal_dict):
-    return "({0}, {1}, {2})".format(
-        GetFloat(valobj.GetChildMemberWithName("x")),
-        GetFloat(valobj.GetChildMemberWithName("y")),
-        GetFloat(valobj.GetChildMemberWithName("z")),
-    )
+    return get_math_summary(valobj)
 
 
 @print_trace_dec
 def Vector4_SummaryProvider(valobj: SBValue, internal_dict):
-    return "({0}, {1}, {2}, {3})".format(
-        GetFloat(valobj.GetChildMemberWithName("x")),
-        GetFloat(valobj.GetChildMemberWithName("y")),
-        GetFloat(valobj.GetChildMemberWithName("z")),
-        GetFloat(valobj.GetChildMemberWithName("w")),
-    )
+    return get_math_summary(valobj)
 
 
 @print_trace_dec
 def Vector2i_SummaryProvider(valobj: SBValue, internal_dict):
-    return "({0}, {1})".format(
-        valobj.GetChildMemberWithName("x").GetValueAsSigned(),
-        valobj.GetChildMemberWithName("y").GetValueAsSigned(),
-    )
+    return get_math_summary(valobj)
 
 
 @print_trace_dec
 def Vector3i_SummaryProvider(valobj: SBValue, internal_dict):
-    return "({0}, {1}, {2})".format(
-        valobj.GetChildMemberWithName("x").GetValueAsSigned(),
-        valobj.GetChildMemberWithName("y").GetValueAsSigned(),
-        valobj.GetChildMemberWithName("z").GetValueAsSigned(),
-    )
+    return get_math_summary(valobj)
 
 
 @print_trace_dec
 def Vector4i_SummaryProvider(valobj: SBValue, internal_dict):
-    return "({0}, {1}, {2}, {3})".format(
-        valobj.GetChildMemberWithName("x").GetValueAsSigned(),
-        valobj.GetChildMemberWithName("y").GetValueAsSigned(),
-        valobj.GetChildMemberWithName("z").GetValueAsSigned(),
-        valobj.GetChildMemberWithName("w").GetValueAsSigned(),
-    )
+    return get_math_summary(valobj)
 
 
 @print_trace_dec
 def Rect2_SummaryProvider(valobj: SBValue, internal_dict):
-    return "{{position: ({0}, {1}), size: ({2}, {3})}}".format(
-        GetFloat(valobj.GetChildMemberWithName("position").GetChildMemberWithName("x")),
-        GetFloat(valobj.GetChildMemberWithName("position").GetChildMemberWithName("y")),
-        GetFloat(valobj.GetChildMemberWithName("size").GetChildMemberWithName("x")),
-        GetFloat(valobj.GetChildMemberWithName("size").GetChildMemberWithName("y")),
-    )
+    return get_math_summary(valobj)
 
 
 @print_trace_dec
 def Rect2i_SummaryProvider(valobj: SBValue, internal_dict):
-    return "{{position: ({0}, {1}), size: ({2}, {3})}}".format(
-        valobj.GetChildMemberWithName("position").GetChildMemberWithName("x").GetValueAsSigned(),
-        valobj.GetChildMemberWithName("position").GetChildMemberWithName("y").GetValueAsSigned(),
-        valobj.GetChildMemberWithName("size").GetChildMemberWithName("x").GetValueAsSigned(),
-        valobj.GetChildMemberWithName("size").GetChildMemberWithName("y").GetValueAsSigned(),
-    )
-
-
-def ConstructNamedColorTable(global_named_colors_table: SBValue) -> dict[str, str]:
-    table: dict[str, str] = dict[str, str]()
-    try:
-        for i in range(global_named_colors_table.GetNumChildren()):
-            named_color = ValCheck(global_named_colors_table.GetChildAtIndex(i))
-            name_val = ValCheck(named_color.GetChildMemberWithName("name"))
-            name_val_summary = name_val.GetSummary()
-            if not name_val_summary:  # nullptr at the end of the array
-                break
-            name = strip_quotes(name_val_summary)
-            color = ValCheck(named_color.GetChildMemberWithName("color"))
-            hex_str = GetHexColor(*GetColorVals(color))
-            table[hex_str] = name
-    except Exception as e:
-        print_verbose(f"EXCEPTION ConstructNamedColorTable: " + str(e))
-        return dict[str, str]()
-    return table
-
-
-constructed_the_table = False
-hex_color_to_name: dict[str, str] = {}
-
-
-def TryConstructNamedColorTable(target: SBTarget) -> None:
-    global constructed_the_table
-    if not constructed_the_table:
-        global hex_color_to_name
-        named_colors = target.FindFirstGlobalVariable("named_colors")
-        if not named_colors or not named_colors.IsValid() or named_colors.GetNumChildren() == 0:
-            return  # return without setting constructed_the_table; we might not be in the right context to do this
-        hex_color_to_name = ConstructNamedColorTable(named_colors)
-        constructed_the_table = True
-        # print_trace(str(hex_color_to_name))
-
-
-def GetColorAlias(valobj: SBValue, vals: Optional[tuple[float, float, float, float]] = None) -> str:
-    r, g, b, a = vals if vals else GetColorVals(valobj)
-    hex_str = GetHexColor(r, g, b, a)
-    TryConstructNamedColorTable(valobj.target)
-    if hex_str in hex_color_to_name:
-        hex_str = hex_color_to_name[hex_str]
-    return hex_str
+    return get_math_summary(valobj)
 
 
-def GetHexColor(r, g, b, a) -> str:
-    def _get_hex(val: float):
-        new_val = max(min(round(val * 255), 255), 0)
-        return "{:02x}".format(new_val)
-
-    r_hex, g_hex, b_hex, a_hex = _get_hex(r), _get_hex(g), _get_hex(b), _get_hex(a)
-    return "#{0}{1}{2}{3}".format(r_hex, g_hex, b_hex, a_hex)
-
-
-def GetColorVals(valobj: SBValue):
-    return (
-        GetFloat(valobj.GetChildMemberWithName("r")),
-        GetFloat(valobj.GetChildMemberWithName("g")),
-        GetFloat(valobj.GetChildMemberWithName("b")),
-        GetFloat(valobj.GetChildMemberWithName("a")),
-    )
+@print_trace_dec
+def Quaternion_SummaryProvider(valobj: SBValue, internal_dict):
+    return get_math_summary(valobj)
 
 
 @print_trace_dec
 def Color_SummaryProvider(valobj: SBValue, internal_dict):
-    r, g, b, a = GetColorVals(valobj)
-    if not Opts.NAMED_COLOR_ANNOTATION:
-        hex_str = GetHexColor(r, g, b, a)
-    else:
-        hex_str = GetColorAlias(valobj, (r, g, b, a))
-    return "{{<{0}> r:{1:.3f}, g:{2:.3f}, b:{3:.3f}, a:{4:.3f}}}".format(hex_str, r, g, b, a)
+    return get_math_summary(valobj)
 
 
 @print_trace_dec
 def Plane_SummaryProvider(valobj: SBValue, internal_dict):
-    return "{{normal: {0}, d: {1}}}".format(
-        valobj.GetChildMemberWithName("normal").GetSummary(),
-        valobj.GetChildMemberWithName("d").GetValueAsSigned(),
-    )
+    return get_math_summary(valobj)
 
 
 @print_trace_dec
 def AABB_SummaryProvider(valobj: SBValue, internal_dict):
-    return "{{position: {{{0}}}, size: {{{1}}}}}".format(
-        valobj.GetChildMemberWithName("position").GetSummary(),
-        valobj.GetChildMemberWithName("size").GetSummary(),
-    )
+    return get_math_summary(valobj)
 
 
 @print_trace_dec
 def Transform2D_SummaryProvider(valobj: SBValue, internal_dict):
-    # transform2d has a Vector2 `origin`, Vector2 `x`, and Vector2 `y`
-    x_row = valobj.GetChildMemberWithName("columns").GetChildAtIndex(0)
-    y_row = valobj.GetChildMemberWithName("columns").GetChildAtIndex(1)
-    o_row = valobj.GetChildMemberWithName("columns").GetChildAtIndex(2)
-    return "{{x: {0}, y: {1}, o: {2}}}".format(x_row.GetSummary(), y_row.GetSummary(), o_row.GetSummary())
+    # transform2d has a Vector2[3] `columns`: x, y and origin
+    return get_math_summary(valobj)
 
 
 @print_trace_dec
 def Transform3D_SummaryProvider(valobj: SBValue, internal_dict):
     # transform3d has a Basis `basis` and Vector3 `origin`
-    return "{{basis: {0}, origin: {1}}}".format(
-        valobj.GetChildMemberWithName("basis").GetSummary(),
-        valobj.GetChildMemberWithName("origin").GetSummary(),
-    )
+    return get_math_summary(valobj)
 
 
 @print_trace_dec
 def Projection_SummaryProvider(valobj: SBValue, internal_dict):
-    # projection has 	`Vector4 columns[4]`
-    return "{{columns: {{{0}, {1}, {2}, {3}}}}}".format(
-        valobj.GetChildMemberWithName("columns").GetChildAtIndex(0).GetSummary(),
-        valobj.GetChildMemberWithName("columns").GetChildAtIndex(1).GetSummary(),
-        valobj.GetChildMemberWithName("columns").GetChildAtIndex(2).GetSummary(),
-        valobj.GetChildMemberWithName("columns").GetChildAtIndex(3).GetSummary(),
-    )
+    # projection has `Vector4 columns[4]`
+    return get_math_summary(valobj)
 
 
 @print_trace_dec
 def Basis_SummaryProvider(valobj: SBValue, internal_dict):
     # basis has a Vector3[3] `rows` (NOT `elements`)
-    # need to translate into (xx, xy, xy), (yx, yy, yz), (zx, zy, zz)
-    x_row = valobj.GetChildMemberWithName("rows").GetChildAtIndex(0)
-    y_row = valobj.GetChildMemberWithName("rows").GetChildAtIndex(1)
-    z_row = valobj.GetChildMemberWithName("rows").GetChildAtIndex(2)
-    return "{{{0}, {1}, {2}}}".format(x_row.GetSummary(), y_row.GetSummary(), z_row.GetSummary())
+    return get_math_summary(valobj)
 
 
 @print_trace_dec
@@ -766,6 +905,51 @@ def RID_SummaryProvider(valobj: SBValue, internal_dict):
     return "<RID=" + str(valobj.GetChildMemberWithName("_id").GetValueAsUnsigned()) + ">"
 
 
+def get_bounded_string_summary(_ptr: SBValue, size: int, char_size: int) -> str:
+    """
+    Reads at most SUMMARY_STRING_MAX_LENGTH characters of a CowData string buffer in one read.
+    `size` is the CowData size, including the null terminator.
+    """
+    max_len = Opts.SUMMARY_STRING_MAX_LENGTH
+    truncated = size - 1 > max_len
+    read_len = max_len if truncated else size
+    data = read_memory(_ptr.GetProcess(), _ptr.GetValueAsUnsigned(), read_len * char_size)
+    if data is None:
+        return INVALID_SUMMARY
+    starr = decode_string_data(data, char_size, final=not truncated)
+    if truncated:
+        return '"{0}"...'.format(starr)
+    if starr.endswith("\x00"):
+        starr = starr[:-1]
+    return '"{0}"'.format(starr)
+
+
+def get_cowdata_string_summary(_ptr: SBValue, size: int, char_size: int, format: int) -> str:
+    """
+    Returns the summary of a CowData string buffer; strings sharing a buffer are only decoded once.
+    """
+    ptr_addr = _ptr.GetValueAsUnsigned()
+    process = _ptr.GetProcess()
+    tag = ("string", char_size)
+    ret = cowdata_cache.get_for_buffer(process, ptr_addr, size, tag)
+    if ret is not None:
+        return ret
+    if Opts.SANITIZE_STRING_SUMMARY:
+        _ptr.format = format
+        ret = _ptr.GetSummary()
+        if ret is None:
+            print_trace("String_SummaryProvider: _ptr.GetSummary() returned None")
+            return EMPTY_SUMMARY
+        if ret.startswith('U"'):
+            ret = '"' + ret.removeprefix('U"')
+    else:
+        ret = get_bounded_string_summary(_ptr, size, char_size)
+        if ret == INVALID_SUMMARY:
+            return ret
+    cowdata_cache.put_for_buffer(process, ptr_addr, size, tag, ret)
+    return ret
+
+
 @print_trace_dec
 def String_SummaryProvider(valobj: SBValue, internal_dict):
     _cowdata: SBValue = valobj.GetChildMemberWithName("_cowdata")
@@ -783,25 +967,7 @@ def String_SummaryProvider(valobj: SBValue, internal_dict):
     if STRINGS_STILL_32_BIT and size > INT32_MAX:
         return INVALID_SUMMARY
     _ptr: SBValue = _cowdata.GetChildMemberWithName("_ptr")
-    _ptr.format = eFormatUnicode32
-    if Opts.SANITIZE_STRING_SUMMARY:
-        ret = _ptr.GetSummary()
-        if ret is None:
-            print_trace("String_SummaryProvider: _ptr.GetSummary() returned None")
-            return EMPTY_SUMMARY
-        if ret.startswith('U"'):
-            ret = '"' + ret.removeprefix('U"')
-        return ret
-    data = _ptr.GetPointeeData(0, size)
-    error: SBError = SBError()
-    arr: bytearray = bytearray()
-    for i in range(data.size):
-        var = data.GetUnsignedInt8(error, i)
-        arr.append(var)
-    starr = arr.decode("utf-32LE")
-    if starr.endswith("\x00"):
-        starr = starr[:-1]
-    return '"{0}"'.format(starr)
+    return get_cowdata_string_summary(_ptr, size, 4, eFormatUnicode32)
 
 
 @print_trace_dec
@@ -817,39 +983,76 @@ def CharString_SummaryProvider(valobj: SBValue, internal_dict):
         return INVALID_SUMMARY
     if size == 0:
         return EMPTY_SUMMARY
-    template_type = type.GetTemplateArgumentType(0)
-    format = eFormatCString
-    if template_type == eBasicTypeChar16 or template_type == eBasicTypeWChar:
-        format = eFormatUnicode16
-    elif template_type == eBasicTypeChar32:
-        format = eFormatUnicode32
     # While cowdata has been promoted to 64-bits, this is still the limit for strings
     if STRINGS_STILL_32_BIT and size > INT32_MAX:
         return INVALID_SUMMARY
     _ptr: SBValue = _cowdata.GetChildMemberWithName("_ptr")
-    _ptr.format = format
-    if Opts.SANITIZE_STRING_SUMMARY:
-        ret = _ptr.GetSummary()
-        if ret is None:
-            print_trace("String_SummaryProvider: _ptr.GetSummary() returned None")
-            return EMPTY_SUMMARY
-        if ret.startswith('U"'):
-            ret = '"' + ret.removeprefix('U"')
-        return ret
-    data = _ptr.GetPointeeData(0, size)
-    error: SBError = SBError()
-    arr: bytearray = bytearray()
-    for i in range(data.size):
-        var = data.GetUnsignedInt8(error, i)
-        arr.append(var)
-    starr = arr.decode("utf-8")
-    if starr.endswith("\x00"):
-        starr = starr[:-1]
-    return '"{0}"'.format(starr)
+    # char, char16_t, char32_t or wchar_t
+    char_size = _ptr.GetType().GetPointeeType().GetByteSize()
+    format = eFormatCString
+    if char_size == 2:
+        format = eFormatUnicode16
+    elif char_size == 4:
+        format = eFormatUnicode32
+    return get_cowdata_string_summary(_ptr, size, char_size, format)
 
 
-@print_trace_dec
-def GenericShortSummary(
+class String_SyntheticProvider(GodotSynthProvider):
+    """
+    Keeps the summary bounded, while the full contents of the string are exposed as a `[contents]` child.
+    The contents are only read from memory once the child is actually displayed.
+    """
+    __slots__ = ("size",)
+    summary_provider = staticmethod(String_SummaryProvider)
+
+    def __init__(self, valobj: SBValue, internal_dict, is_summary=False):
+        super().__init__(valobj, internal_dict, is_summary)
+        self.update()
+
+    def update(self):
+        self.size = 0
+        if self.is_summary:
+            return
+        size = get_cowdata_size_or_none(self.valobj.GetChildMemberWithName("_cowdata"))
+        self.size = size if size and (not STRINGS_STILL_32_BIT or size <= INT32_MAX) else 0
+
+    def check_valid(self, obj: SBValue) -> bool:
+        return get_cowdata_size_or_none(obj.GetChildMemberWithName("_cowdata")) is not None
+
+    def get_summary(self, max_children=Opts.MAX_AMOUNT_OF_CHILDREN_IN_SUMMARY, max_str_len=Opts.SUMMARY_STRING_MAX_LENGTH) -> str:
+        return self.summary_provider(self.valobj, self.internal_dict)
+
+    def num_children(self, max=UINT32_MAX) -> int:
+        return 2 if self.size > 0 else 1
+
+    def has_children(self) -> bool:
+        return True
+
+    def get_index_of_child(self, name: str) -> Optional[int]:
+        if name == "_cowdata":
+            return 0
+        if name == "[contents]":
+            return 1
+        return None
+
+    def get_child_at_index(self, idx: int) -> SBValue:
+        _cowdata: SBValue = self.valobj.GetChildMemberWithName("_cowdata")
+        if idx == 0:
+            return _cowdata
+        if idx != 1 or self.size == 0:
+            return SBValue()
+        _ptr: SBValue = _cowdata.GetChildMemberWithName("_ptr")
+        char_type: SBType = _ptr.GetType().GetPointeeType()
+        return _ptr.CreateValueFromAddress("[contents]", _ptr.GetValueAsUnsigned(), char_type.GetArrayType(self.size))
+
+
+class CharString_SyntheticProvider(String_SyntheticProvider):
+    __slots__ = ()
+    summary_provider = staticmethod(CharString_SummaryProvider)
+
+
+@print_trace_dec
+def GenericShortSummary(
     valobj: SBValue,
     internal_dict,
     summary_length=0,
@@ -915,6 +1118,8 @@ def GenericShortSummary(
             # check if it's derived from _LinkedListLike_SyntheticProvider
 
 
+            if synth_provider_type is not None and issubclass(synth_provider_type, String_SyntheticProvider):
+                return synth_provider_type.summary_provider(valobj.GetNonSyntheticValue(), internal_dict)
             if synth_provider_type is not None:
                 bases_str = str(synth_provider_type.__bases__)
                 is_subclass_of_list_of_children = "_ListOfChildren_SyntheticProvider" in bases_str
@@ -1038,6 +1243,7 @@ def hashmap_trace(func):
 
 # Disabled for now, causing crashes
 class HashMapElement_SyntheticProvider(GodotSynthProvider):
+    __slots__ = ()
     key_val_element_style: bool = Opts.MAP_KEY_VAL_STYLE
 
     @hashmap_trace
@@ -1065,7 +1271,7 @@ class HashMapElement_SyntheticProvider(GodotSynthProvider):
 
     @hashmap_trace
     def get_data(self) -> Optional[SBValue]:
-        if not self.check_valid(self.valobj):
+        if not self.is_valid(VALIDATION_FULL):
             return None
         return self.valobj.GetChildMemberWithName("data")
 
@@ -1099,19 +1305,19 @@ class HashMapElement_SyntheticProvider(GodotSynthProvider):
 
     @hashmap_trace
     def num_children(self, max=UINT32_MAX) -> int:
-        if not self.check_valid(self.valobj):
+        if not self.is_valid(VALIDATION_FULL):
             return 0
         return 2
 
     @hashmap_trace
     def has_children(self):
-        if not self.check_valid(self.valobj):
+        if not self.is_valid(VALIDATION_FULL):
             return False
         return True
 
     @hashmap_trace
     def get_summary(self, max_children=Opts.MAX_AMOUNT_OF_CHILDREN_IN_SUMMARY, max_str_len=Opts.SUMMARY_STRING_MAX_LENGTH) -> str:
-        if not self.check_valid(self.valobj):
+        if not self.is_valid(VALIDATION_FULL):
             return INVALID_SUMMARY
         value = self.get_value()
         if value is None:
@@ -1127,6 +1333,7 @@ class HashMapElement_SyntheticProvider(GodotSynthProvider):
 
 
 class RBMapElement_SyntheticProvider(HashMapElement_SyntheticProvider):
+    __slots__ = ()
 
     @print_trace_dec
     def get_data(self):
@@ -1134,6 +1341,7 @@ class RBMapElement_SyntheticProvider(HashMapElement_SyntheticProvider):
 
 
 class _ListOfChildren_SyntheticProvider(GodotSynthProvider):
+    __slots__ = ("type", "typename", "no_cache", "cache_min", "cache_fetch_max", "_cached_size", "range_view", "can_group_children")
 
     @print_trace_dec
     def __init__(self, valobj: SBValue, internal_dict, is_summary=False):
@@ -1143,8 +1351,16 @@ class _ListOfChildren_SyntheticProvider(GodotSynthProvider):
         self.cache_min = CACHE_MIN if not is_summary else Opts.MAX_AMOUNT_OF_CHILDREN_IN_SUMMARY
         self.cache_fetch_max = CACHE_FETCH_MAX
         self._cached_size = 0
+        # (first, last) element index if this value is a range child of a grouped container
+        self.range_view: Optional[tuple[int, int]] = parse_range_child_name(valobj.GetName())
+        # range children are created at the container's address, so it must have one
+        load_address = valobj.GetLoadAddress()
+        self.can_group_children = load_address != LLDB_INVALID_ADDRESS and load_address != 0
         super().__init__(valobj, internal_dict, is_summary)
-        self.update()
+        if is_summary:
+            self.update_summary()
+        else:
+            self.update()
 
     def update(self) -> None:
         """
@@ -1153,6 +1369,13 @@ class _ListOfChildren_SyntheticProvider(GodotSynthProvider):
         """
         raise Exception("Not implemented")
 
+    def update_summary(self) -> None:
+        """
+        Used instead of update() by providers that are only made for a summary (see get_synth_summary).
+        Override this if update() reads more than the summary needs: the size and the first MAX_AMOUNT_OF_CHILDREN_IN_SUMMARY elements.
+        """
+        self.update()
+
     def get_len(self, obj: SBValue) -> int:
         """
         Override this method to return the non-cached number of elements in this vector-like object
@@ -1181,6 +1404,12 @@ class _ListOfChildren_SyntheticProvider(GodotSynthProvider):
             return INVALID_SUMMARY
         return GenericShortSummary(element, self.internal_dict, 0, False, True)
 
+    def _get_packed_child_summaries(self, count: int) -> Optional[list[str]]:
+        """
+        Override this to format the first `count` children without creating them; return None to use _get_child_summary
+        """
+        return None
+
     # def get_size_synthetic_child(self):
     #     return self.valobj.CreateValueFromData("[size]", SBData.CreateDataFromInt(self.num_elements), self.valobj.target.GetBasicType(eBasicTypeUnsignedInt))
 
@@ -1197,10 +1426,11 @@ class _ListOfChildren_SyntheticProvider(GodotSynthProvider):
         if self.num_elements == 0:
             return ""
         max_children = min(Opts.MAX_AMOUNT_OF_CHILDREN_IN_SUMMARY, self.num_elements)
+        packed_summaries = self._get_packed_child_summaries(max_children)
         i: int = 0
         summ_str = ""
         for i in range(max_children):
-            summ_str += self._get_child_summary(i)
+            summ_str += packed_summaries[i] if packed_summaries else self._get_child_summary(i)
             if len(summ_str) > max_str_len:
                 break
             if max_children != 1 and i < max_children - 1:
@@ -1209,13 +1439,66 @@ class _ListOfChildren_SyntheticProvider(GodotSynthProvider):
             summ_str += ", ..."
         return summ_str
 
+    def _get_view(self) -> tuple[int, int]:
+        """
+        Returns (first element index, element count) of the elements under this value; a range child only has a slice.
+        """
+        if self.range_view is None:
+            return 0, self.num_elements
+        first, last = self.range_view
+        last = min(last, self.num_elements - 1)
+        return first, max(last - first + 1, 0)
+
+    def _get_group_span(self, count: int) -> int:
+        """
+        Returns how many elements each range child holds, or 0 if the elements aren't grouped.
+        The span grows by a factor of CHILD_GROUP_SIZE per level, so that no level has more than CHILD_GROUP_SIZE children.
+        """
+        group_size = Opts.CHILD_GROUP_SIZE
+        if group_size <= 1 or count <= group_size or not self.can_group_children:
+            return 0
+        span = group_size
+        while (count + span - 1) // span > group_size:
+            span *= group_size
+        return span
+
+    def _create_range_child(self, first: int, last: int) -> SBValue:
+        # the same container, named after the range; its provider only shows that slice
+        return self.valobj.CreateValueFromAddress(
+            RANGE_CHILD_NAME_FORMAT.format(first, last), self.valobj.GetLoadAddress(), self.valobj.GetType()
+        )
+
+    # Translates element indices from get_index_of_child to child indices of this (possibly grouped or range) view
+    @print_trace_dec
+    def get_child_index(self, name: str) -> Optional[int]:
+        first, count = self._get_view()
+        span = self._get_group_span(count)
+        if span:
+            child_range = parse_range_child_name(name)
+            if child_range is None or (child_range[0] - first) % span != 0:
+                return None
+            return (child_range[0] - first) // span
+        index = super().get_child_index(name)
+        if index is None or self.range_view is None:
+            return index
+        return index - first if first <= index < first + count else None
+
     @print_trace_dec
     def get_child_at_index(self, idx: int) -> SBValue:
-        return self._create_child_at_element_index(idx) or SBValue()
+        first, count = self._get_view()
+        span = self._get_group_span(count)
+        if span:
+            child_first = first + idx * span
+            if idx < 0 or child_first >= first + count:
+                return SBValue()
+            return self._create_range_child(child_first, min(child_first + span, first + count) - 1)
+        return self._create_child_at_element_index(first + idx) or SBValue()
 
     @print_trace_dec
     def num_children(self, max=UINT32_MAX) -> int:
-        return self.num_elements
+        _, count = self._get_view()
+        span = self._get_group_span(count)
+        return (count + span - 1) // span if span else count
 
     @print_trace_dec
     def has_children(self) -> bool:
@@ -1228,10 +1511,21 @@ class _ListOfChildren_SyntheticProvider(GodotSynthProvider):
         except:
             return None
 
+    def check_valid_tier(self, obj: SBValue, tier: int) -> bool:
+        """
+        Override this with the checks of each tier; see VALIDATION_CHEAP, VALIDATION_MEDIUM and VALIDATION_FULL
+        """
+        return True
+
+    def check_valid(self, obj: SBValue) -> bool:
+        return all(self.check_valid_tier(obj, tier) for tier in VALIDATION_TIERS)
+
     @print_trace_dec
     def get_summary(self, max_children=Opts.MAX_AMOUNT_OF_CHILDREN_IN_SUMMARY, max_str_len=Opts.SUMMARY_STRING_MAX_LENGTH) -> str:
-        if not self.check_valid(self.valobj):
+        if not self.is_valid():
             return INVALID_SUMMARY
+        if self.range_view is not None:
+            return RANGE_SUMMARY_FORMAT.format(count=self._get_view()[1])
         return LIST_FORMAT.format(
             type_name=self.typename,
             type_no_template=self.typename.split("<")[0],
@@ -1240,14 +1534,23 @@ class _ListOfChildren_SyntheticProvider(GodotSynthProvider):
         )
 
 
+# (page_data address, page count) -> page base addresses, shared by every provider of the same PagedArray during a stop
+page_table_cache = StopScopedCache("page_tables")
+
+
 class PagedArray_SyntheticProvider(_ListOfChildren_SyntheticProvider):
+    __slots__ = (
+        "item_type", "item_size", "ptr", "page_size_shift", "page_size_mask", "page_table"
+    )
+
     def __init__(self, valobj: SBValue, internal_dict, is_summary=False):
         self.item_type: Optional[SBType] = None
         self.item_size: int = 0
         self.ptr: Optional[SBValue] = None
         self.page_size_shift: int = 0
         self.page_size_mask: int = 0
-        self.ptr_cast: Optional[SBValue] = None
+        # page base addresses, read in one request
+        self.page_table: Optional[array] = None
         super().__init__(valobj, internal_dict, is_summary)
 
     def get_ptr(self, obj: SBValue) -> SBValue:
@@ -1256,43 +1559,50 @@ class PagedArray_SyntheticProvider(_ListOfChildren_SyntheticProvider):
     def get_len(self, obj: SBValue):
         return obj.GetChildMemberWithName("count").GetValueAsUnsigned(0)
 
-    def check_valid(self, obj: SBValue) -> bool:
+    def check_valid_tier(self, obj: SBValue, tier: int) -> bool:
         page_data = self.get_ptr(obj)
         size = self.get_len(obj)
-
-        if size == 0 and page_data and page_data.TypeIsPointerType():
-            return True
-        if not is_valid_pointer(page_data):
-            return False
+        if size == 0:
+            return tier != VALIDATION_CHEAP or bool(page_data and page_data.TypeIsPointerType()) or is_valid_pointer(page_data)
         page_pool = obj.GetChildMemberWithName("page_pool")
-        if not is_valid_pointer(page_pool):
-            return False
+        if tier == VALIDATION_CHEAP:
+            return is_valid_pointer(page_data) and is_valid_pointer(page_pool)
         pages_allocated = page_pool.GetChildMemberWithName("pages_allocated").GetValueAsUnsigned(0)
-        pages_available = page_pool.GetChildMemberWithName("pages_available").GetValueAsUnsigned(0)
-        if pages_allocated < pages_available:
+        if tier == VALIDATION_MEDIUM:
+            pages_available = page_pool.GetChildMemberWithName("pages_available").GetValueAsUnsigned(0)
+            return pages_allocated >= pages_available
+        # the last page has to exist
+        index = size - 1
+        page_size_shift: int = obj.GetChildMemberWithName("page_size_shift").GetValueAsUnsigned(0)
+        page_size_mask: int = obj.GetChildMemberWithName("page_size_mask").GetValueAsUnsigned(0)
+        page_index = index >> page_size_shift
+        offset = index & page_size_mask
+        if page_index > UINT32_MAX or offset > UINT32_MAX:  # PagedArray can't be bigger than this
             return False
-        try:  # try getting the last element
-            index = size - 1
-            page_size_shift: int = obj.GetChildMemberWithName("page_size_shift").GetValueAsUnsigned(0)
-            page_size_mask: int = obj.GetChildMemberWithName("page_size_mask").GetValueAsUnsigned(0)
-            page_index = index >> page_size_shift
-            offset = index & page_size_mask
-            if page_index > UINT32_MAX or offset > UINT32_MAX:  # PagedArray can't be bigger than this
-                return False
-            if page_index > pages_allocated:
-                return False
-            array_type = page_data.GetType().GetPointeeType().GetArrayType(size).GetPointerType()
-            ptr_cast = page_data.Cast(array_type)
-            last_page = ptr_cast.GetChildAtIndex(page_index)
-            if not last_page or not last_page.IsValid():
-                return False
-            last_val: SBValue = last_page.GetChildAtIndex(offset, eDynamicCanRunTarget, True)
-            if not last_val or not last_val.IsValid():
-                return False
-        except Exception as e:
-            print_verbose("EXCEPTION: " + str(e))
+        if page_index > pages_allocated:
             return False
-        return True
+        process = obj.GetProcess()
+        last_page_addr = read_pointer(process, page_data.GetValueAsUnsigned() + page_index * process.GetAddressByteSize())
+        return last_page_addr != 0
+
+    def _get_page_table(self) -> Optional[array]:
+        if not self.ptr or self.num_elements == 0:
+            return None
+        process = self.valobj.GetProcess()
+        page_data_addr = self.ptr.GetValueAsUnsigned()
+        page_count = ((self.num_elements - 1) >> self.page_size_shift) + 1
+        if self.is_summary:
+            # only the pages of the elements in the summary
+            summary_count = min(self.num_elements, Opts.MAX_AMOUNT_OF_CHILDREN_IN_SUMMARY)
+            page_count = min(page_count, ((summary_count - 1) >> self.page_size_shift) + 1)
+        page_table_cache.sync(process)
+        key = (page_data_addr, page_count)
+        page_table = page_table_cache.get(key)
+        if page_table is None:
+            page_table = read_pointer_array(process, page_data_addr, page_count)
+            if page_table is not None:
+                page_table_cache.put(key, page_table)
+        return page_table
 
     def update(self):
         """
@@ -1300,7 +1610,8 @@ class PagedArray_SyntheticProvider(_ListOfChildren_SyntheticProvider):
         """
         self.num_elements = self.get_len(self.valobj)
         self.ptr = self.get_ptr(self.valobj)
-        if not self.check_valid(self.valobj):
+        self.page_table = None
+        if not self.is_valid():
             self.num_elements = 0
             self.ptr = None
         else:
@@ -1308,24 +1619,54 @@ class PagedArray_SyntheticProvider(_ListOfChildren_SyntheticProvider):
             self.item_size = self.item_type.GetByteSize() if self.item_type else 0
             self.page_size_shift = self.valobj.GetChildMemberWithName("page_size_shift").GetValueAsUnsigned(0)
             self.page_size_mask = self.valobj.GetChildMemberWithName("page_size_mask").GetValueAsUnsigned(0)
-            pointer_to_array_type = self.ptr.GetType().GetPointeeType().GetArrayType(self.num_elements).GetPointerType()
-            self.ptr_cast = self.ptr.Cast(pointer_to_array_type)
+            self.page_table = self._get_page_table()
+            if self.page_table is None or self.item_size == 0:
+                self.num_elements = 0
+
+    def _get_element_address(self, index: int) -> int:
+        if index < 0 or index >= self.num_elements or self.page_table is None:
+            return 0
+        page_index = index >> self.page_size_shift
+        if page_index >= len(self.page_table):
+            return 0
+        page_addr = self.page_table[page_index]
+        if page_addr == 0:
+            return 0
+        return page_addr + (index & self.page_size_mask) * self.item_size
+
+    def _get_packed_child_summaries(self, count: int) -> Optional[list[str]]:
+        if not self.item_type:
+            return None
+        formatter = get_packed_summary_formatter(self.valobj.GetTarget(), self.item_type)
+        if formatter is None:
+            return None
+        # the first few elements are almost always in the first page
+        data = b""
+        index = 0
+        while index < count:
+            page_count = min(count - index, self.page_size_mask + 1 - (index & self.page_size_mask))
+            page_data = read_memory(self.valobj.GetProcess(), self._get_element_address(index), page_count * self.item_size)
+            if page_data is None:
+                return None
+            data += page_data
+            index += page_count
+        return formatter.format_elements(self.valobj, data)
 
     def _create_child_at_element_index(self, index: int) -> Optional[SBValue]:
         name = "[" + str(index) + "]"
         return self.create_child_at_real_index(index, name)
 
     def create_child_at_real_index(self, index: int, name: str) -> Optional[SBValue]:
-        if index < 0 or index >= self.num_elements or not self.ptr or not self.ptr_cast or not self.item_type:
+        address = self._get_element_address(index)
+        if address == 0 or not self.item_type:
             return None
-        page_index = index >> self.page_size_shift
-        offset = index & self.page_size_mask
-        page_data: SBValue = self.ptr_cast.GetChildAtIndex(page_index)
-        child = page_data.CreateChildAtOffset(name, offset * self.item_size, self.item_type)
-        return child
+        return self.valobj.CreateValueFromAddress(name, address, self.item_type)
 
 
 class _ArrayLike_SyntheticProvider(_ListOfChildren_SyntheticProvider):
+    __slots__ = ("item_type", "item_size", "ptr")
+    # Set this if the elements are stored in a CowData buffer (i.e. get_ptr() returns `_cowdata._ptr`)
+    is_cowdata_backed: bool = False
 
     @print_trace_dec
     def __init__(self, valobj: SBValue, internal_dict, is_summary=False):
@@ -1334,8 +1675,46 @@ class _ArrayLike_SyntheticProvider(_ListOfChildren_SyntheticProvider):
         self.ptr: Optional[SBValue] = None
         super().__init__(valobj, internal_dict, is_summary)
 
+    def get_cowdata_ptr_addr(self) -> int:
+        """
+        Returns the address of the CowData buffer, or 0 if this isn't CowData-backed or is empty
+        """
+        if not self.is_cowdata_backed or not self.ptr or self.num_elements == 0:
+            return 0
+        return self.ptr.GetValueAsUnsigned()
+
+    @print_trace_dec
+    def get_children_summary(self, max_children=Opts.MAX_AMOUNT_OF_CHILDREN_IN_SUMMARY, max_str_len=Opts.SUMMARY_STRING_MAX_LENGTH) -> str:
+        ptr_addr = self.get_cowdata_ptr_addr()
+        # the summaries of elements that point elsewhere (e.g. Ref<>) change even if the buffer doesn't
+        if ptr_addr == 0 or not self.item_type or not is_plain_data_type(self.valobj.GetTarget(), self.item_type, False):
+            return super().get_children_summary(max_children, max_str_len)
+        # Objects sharing the same buffer have the same children
+        process = self.valobj.GetProcess()
+        tag = ("children_summary", self.typename, max_children, max_str_len)
+        summ_str = cowdata_cache.get_for_buffer(process, ptr_addr, self.num_elements, tag)
+        if summ_str is None:
+            summ_str = super().get_children_summary(max_children, max_str_len)
+            cowdata_cache.put_for_buffer(process, ptr_addr, self.num_elements, tag, summ_str)
+        return summ_str
+
+    def _get_packed_child_summaries(self, count: int) -> Optional[list[str]]:
+        # providers with their own child summaries (e.g. VMap's "[key]: value") don't just format elements
+        if not self.ptr or not self.item_type or type(self)._get_child_summary is not _ListOfChildren_SyntheticProvider._get_child_summary:
+            return None
+        formatter = get_packed_summary_formatter(self.valobj.GetTarget(), self.item_type)
+        if formatter is None:
+            return None
+        data = read_memory(self.valobj.GetProcess(), self.ptr.GetValueAsUnsigned(), count * self.item_size)
+        if data is None:
+            return None
+        return formatter.format_elements(self.valobj, data)
+
     @print_trace_dec
-    def check_valid(self, obj: SBValue):
+    def check_valid_tier(self, obj: SBValue, tier: int) -> bool:
+        # everything here only looks at the object and the memory region map
+        if tier != VALIDATION_CHEAP:
+            return True
         num_elements = self.get_len(obj)
         ptr = self.get_ptr(obj)
         if not ptr:
@@ -1348,19 +1727,8 @@ class _ArrayLike_SyntheticProvider(_ListOfChildren_SyntheticProvider):
             return True
         if not is_valid_pointer(ptr):
             return False
-        try:
-            ptr_address = ptr.GetValueAsUnsigned()
-            if ptr_address == 0:
-                return False
-            last_val = ptr.CreateValueFromAddress(
-                "_tmp_tail", ptr_address + ((num_elements - 1) * item_size), item_type
-            )
-            if not last_val.IsValid():
-                return False
-        except Exception as e:
-            print_verbose("EXCEPTION: " + str(e))
-            return False
-        return True
+        # the whole array has to be readable
+        return is_range_readable(obj.GetProcess(), ptr.GetValueAsUnsigned(), num_elements * item_size)
 
     @print_trace_dec
     def update(self):
@@ -1372,7 +1740,7 @@ class _ArrayLike_SyntheticProvider(_ListOfChildren_SyntheticProvider):
         if not_null_check(self.ptr) and not (not self.ptr):
             self.item_type = self.ptr.GetType().GetPointeeType()
         self.item_size = self.item_type.GetByteSize() if self.item_type else 0
-        if self.item_size == 0 or not self.check_valid(self.valobj):
+        if self.item_size == 0 or not self.is_valid():
             self.num_elements = 0
             self.ptr = None
 
@@ -1395,7 +1763,12 @@ class _ArrayLike_SyntheticProvider(_ListOfChildren_SyntheticProvider):
             return None
 
 
+STATS_CHILD_NAME = "[stats]"
+
+
 class Vector_SyntheticProvider(_ArrayLike_SyntheticProvider):
+    __slots__ = ()
+    is_cowdata_backed = True
 
     @print_trace_dec
     def __init__(self, valobj: SBValue, internal_dict, is_summary=False):
@@ -1407,13 +1780,65 @@ class Vector_SyntheticProvider(_ArrayLike_SyntheticProvider):
     def get_len(self, obj: SBValue):
         return get_cowdata_size(obj.GetChildMemberWithName("_cowdata"))
 
+    def _get_stats_formatter(self) -> Optional[PackedSummaryFormatter]:
+        # only on the container itself, when its elements are its direct children
+        if not Opts.VECTOR_STATS_CHILD or self.is_summary or self.num_elements == 0 or not self.item_type:
+            return None
+        if self.range_view is not None or self._get_group_span(self.num_elements) != 0:
+            return None
+        return get_packed_summary_formatter(self.valobj.GetTarget(), self.item_type)
+
+    def num_children(self, max=UINT32_MAX) -> int:
+        if self._get_stats_formatter() is not None:
+            return self.num_elements + 1
+        return super().num_children(max)
+
+    def get_index_of_child(self, name: str) -> Optional[int]:
+        if name == STATS_CHILD_NAME:
+            return self.num_elements if self._get_stats_formatter() is not None else None
+        return super().get_index_of_child(name)
+
+    def get_child_at_index(self, idx: int) -> SBValue:
+        if idx == self.num_elements and self._get_stats_formatter() is not None:
+            return self._create_stats_child()
+        return super().get_child_at_index(idx)
+
+    def _create_stats_child(self) -> SBValue:
+        """
+        The statistics of the whole buffer, as a string; computed once per CowData buffer.
+        """
+        formatter = self._get_stats_formatter()
+        ptr_addr = self.get_cowdata_ptr_addr()
+        if formatter is None or ptr_addr == 0:
+            return SBValue()
+        process = self.valobj.GetProcess()
+        tag = ("stats", self.typename)
+        text = cowdata_cache.get_for_buffer(process, ptr_addr, self.num_elements, tag)
+        if text is None:
+            item_size = self.item_size
+            stats = compute_buffer_stats(
+                lambda start, count: read_memory(process, ptr_addr + start * item_size, count * item_size),
+                self.num_elements,
+                formatter.struct,
+            )
+            text = stats.format() if stats is not None else INVALID_SUMMARY
+            cowdata_cache.put_for_buffer(process, ptr_addr, self.num_elements, tag, text)
+        buf = text.encode("utf-8") + b"\0"
+        data = create_data(process, buf)
+        if data is None:
+            return SBValue()
+        char_type: SBType = self.valobj.GetTarget().GetBasicType(eBasicTypeChar).GetArrayType(len(buf))
+        return self.valobj.CreateValueFromData(STATS_CHILD_NAME, data, char_type)
+
 
 class LocalVector_SyntheticProvider(_ArrayLike_SyntheticProvider):
-    def check_valid(self, obj: SBValue):
-        if not super().check_valid(obj):
+    __slots__ = ()
+
+    def check_valid_tier(self, obj: SBValue, tier: int) -> bool:
+        if not super().check_valid_tier(obj, tier):
             return False
         length = self.get_len(obj)
-        if length == 0:
+        if tier != VALIDATION_CHEAP or length == 0:
             return True
         capacity = obj.GetChildMemberWithName("capacity").GetValueAsUnsigned(0)
         if capacity < length:
@@ -1428,6 +1853,8 @@ class LocalVector_SyntheticProvider(_ArrayLike_SyntheticProvider):
 
 
 class VectorView_SyntheticProvider(_ArrayLike_SyntheticProvider):
+    __slots__ = ()
+
     @print_trace_dec
     def __init__(self, valobj: SBValue, internal_dict, is_summary=False):
         super().__init__(valobj, internal_dict, is_summary)
@@ -1440,12 +1867,59 @@ class VectorView_SyntheticProvider(_ArrayLike_SyntheticProvider):
 
 
 class HashSet_SyntheticProvider(_ArrayLike_SyntheticProvider):
+    __slots__ = ()
+
     def get_ptr(self, obj: SBValue) -> SBValue:
         return obj.GetChildMemberWithName("keys")
 
     def get_len(self, obj: SBValue):
         return obj.GetChildMemberWithName("num_elements").GetValueAsUnsigned(0)
 
+    def get_index_of_child(self, name: str) -> Optional[int]:
+        index = super().get_index_of_child(name)
+        if index is not None:
+            return index
+        return self.get_index_of_key(name.lstrip("[").rstrip("]"))
+
+    def get_index_of_key(self, key: str) -> Optional[int]:
+        """
+        Finds a key by probing `hashes` like HashSet::_lookup_pos(); `hash_to_key` maps the bucket to the index in `keys`.
+        """
+        key_type: SBType = self.valobj.GetType().GetTemplateArgumentType(0)
+        hashed = get_key_hash_candidates(key_type, key)
+        if hashed is None or not self.ptr or not self.item_type or self.num_elements == 0:
+            return None
+        process = self.valobj.GetProcess()
+        keys_addr = self.ptr.GetValueAsUnsigned()
+        hashes_addr = self.valobj.GetChildMemberWithName("hashes").GetValueAsUnsigned()
+        hash_to_key_addr = self.valobj.GetChildMemberWithName("hash_to_key").GetValueAsUnsigned()
+        capacity_index = self.valobj.GetChildMemberWithName("capacity_index").GetValueAsUnsigned()
+        if hashes_addr == 0 or hash_to_key_addr == 0:
+            return None
+        found: list[int] = [-1]
+
+        def matches(pos: int) -> bool:
+            key_index = read_unsigned(process, hash_to_key_addr + pos * 4, 4)
+            if key_index is None or key_index >= self.num_elements:
+                return False
+            stored_key = self.valobj.CreateValueFromAddress("key", keys_addr + key_index * self.item_size, self.item_type)
+            if GenericShortSummary(stored_key, self.internal_dict) != key:
+                return False
+            found[0] = key_index
+            return True
+
+        key_kind, candidates = hashed
+        pos = lookup_hashed_key(
+            self.valobj,
+            1,
+            key_kind,
+            candidates,
+            lambda hash: probe_hash_table(process, hashes_addr, capacity_index, hash, matches),
+        )
+        if pos is None or pos < 0:
+            return None
+        return found[0]
+
 
 def _VMap_Pair_get_keypair_summaries(valobj: SBValue, internal_dict, is_VMap_Summary=False) -> tuple[str, str]:
     key: SBValue = valobj.GetChildMemberWithName("key")
@@ -1465,29 +1939,223 @@ def VMap_Pair_SummaryProvider(valobj: SBValue, internal_dict):
     return fmt_str.format(*_VMap_Pair_get_keypair_summaries(valobj, internal_dict))
 
 
+SIGNED_INTEGER_BASIC_TYPES = (
+    eBasicTypeChar,
+    eBasicTypeSignedChar,
+    eBasicTypeWChar,
+    eBasicTypeSignedWChar,
+    eBasicTypeShort,
+    eBasicTypeInt,
+    eBasicTypeLong,
+    eBasicTypeLongLong,
+    eBasicTypeInt128,
+)
+
+KEY_KIND_INTEGER = 0
+KEY_KIND_STRING = 1
+KEY_KIND_STRING_NAME = 2
+
+
+def get_summary_text(summary: str) -> Optional[str]:
+    """
+    Returns the text of a quoted string summary, or None if it isn't one.
+    Escaped or truncated summaries don't round-trip to the original string, so they return None too.
+    """
+    if len(summary) < 2 or summary[0] != '"' or summary[-1] != '"' or "\\" in summary:
+        return None
+    return summary[1:-1]
+
+
+def _compare(a, b) -> int:
+    return (a > b) - (a < b)
+
+
+class TypedMapKey:
+    """
+    A map key parsed back from a key summary (i.e. a child name in MAP_KEY_VAL_STYLE), compared against keys in memory
+    the way Comparator<K> orders them, so sorted containers can be searched without summarizing every key:
+      - integers by value
+      - String by its characters (String::operator<)
+      - StringName by its `_data` pointer (StringName::operator<)
+    """
+
+    def __init__(self, kind: int, value, byte_size: int = 0, signed: bool = False):
+        self.kind = kind
+        self.value = value
+        self.byte_size = byte_size
+        self.signed = signed
+
+    @staticmethod
+    def from_summary(key_type: Optional[SBType], summary: str) -> Optional["TypedMapKey"]:
+        """
+        Returns None if the key type or summary can't be compared in memory; callers should fall back to a linear search.
+        """
+        if key_type is None or not summary:
+            return None
+        if key_type.GetTypeClass() != eTypeClassEnumeration and is_basic_integer_type(key_type):
+            try:
+                value = int(summary)
+            except ValueError:
+                return None
+            canonical: SBType = key_type.GetCanonicalType()
+            return TypedMapKey(
+                KEY_KIND_INTEGER, value, canonical.GetByteSize(), canonical.GetBasicType() in SIGNED_INTEGER_BASIC_TYPES
+            )
+        type_name = key_type.GetUnqualifiedType().GetDisplayTypeName().removeprefix("::")
+        if type_name not in ("String", "StringName"):
+            return None
+        text = get_summary_text(summary)
+        if text is None:
+            return None
+        if type_name == "String":
+            return TypedMapKey(KEY_KIND_STRING, text)
+        data_addr = string_name_addresses.get(summary)
+        if not data_addr:
+            return None
+        return TypedMapKey(KEY_KIND_STRING_NAME, data_addr)
+
+    def is_exact(self) -> bool:
+        """
+        If not found by a search, the key definitely isn't in the container.
+        StringName pointers come from a cache that may be stale, so a miss isn't conclusive for them.
+        """
+        return self.kind != KEY_KIND_STRING_NAME
+
+    def compare(self, process, key_addr: int) -> Optional[int]:
+        """
+        Returns <0, 0 or >0 if the key stored at `key_addr` sorts before, the same as, or after this key.
+        Returns None if the key couldn't be read.
+        """
+        if self.kind == KEY_KIND_INTEGER:
+            stored = read_unsigned(process, key_addr, self.byte_size)
+            if stored is None:
+                return None
+            if self.signed and stored >= 1 << (self.byte_size * 8 - 1):
+                stored -= 1 << (self.byte_size * 8)
+            return _compare(stored, self.value)
+        if self.kind == KEY_KIND_STRING_NAME:
+            return _compare(read_pointer(process, key_addr), self.value)
+        # String is just a CowData<char32_t>, whose only member is `_ptr`
+        ptr_addr = read_pointer(process, key_addr)
+        if ptr_addr == 0:
+            return _compare("", self.value)
+        size = read_unsigned(process, ptr_addr - 8, 8)
+        if size is None:
+            return None
+        # one character past the searched key is enough to know if the stored key is longer
+        length = min(max(size - 1, 0), len(self.value) + 1)
+        data = read_memory(process, ptr_addr, length * 4) if length > 0 else b""
+        if data is None:
+            return None
+        return _compare(decode_string_data(data, 4), self.value)
+
+
+# (target, table type, key kind) -> which of the candidate hashes found a key in a table of that type
+key_hasher_indices: dict[tuple[int, str, str], int] = {}
+
+
+def get_key_hash_candidates(key_type: Optional[SBType], summary: str) -> Optional[tuple[Optional[str], list[int]]]:
+    """
+    Hashes a key parsed back from its summary like HashMapHasherDefault, or VariantHasher for Variant keys (i.e. Dictionary).
+    Returns (key kind, candidate hashes), or None if the key can't be hashed.
+    The key kind is None when the candidates are different readings of the summary rather than different hashers.
+    """
+    if key_type is None or not summary:
+        return None
+    type_name = key_type.GetUnqualifiedType().GetDisplayTypeName().removeprefix("::")
+    text = get_summary_text(summary)
+    if type_name == "Variant":
+        # Variant::hash() of a String and of a StringName is the hash of their text
+        if text is not None:
+            return "string", [hash_djb2(text)]
+        if summary in ("true", "false"):
+            return "bool", [1 if summary == "true" else 0]
+        try:
+            value = int(summary)
+        except ValueError:
+            return None
+        # bool Variants are summarized as 1/0 too, and hash to their value
+        if value in (0, 1):
+            return None, [hash_one_uint64(value), value]
+        return "int", [hash_one_uint64(value)]
+    if key_type.GetTypeClass() != eTypeClassEnumeration and is_basic_integer_type(key_type):
+        try:
+            value = int(summary)
+        except ValueError:
+            return None
+        return "int", get_integer_hash_candidates(value, key_type.GetCanonicalType().GetByteSize())
+    if type_name in ("String", "StringName") and text is not None:
+        return "string", [hash_djb2(text)]
+    return None
+
+
+def has_default_hasher(table: SBValue, hasher_index: int) -> bool:
+    """
+    Whether the Hasher template argument of a hash table is one get_key_hash_candidates() knows how to mimic
+    """
+    hasher_type: SBType = table.GetType().GetTemplateArgumentType(hasher_index)
+    if not hasher_type or not hasher_type.IsValid():
+        return True
+    hasher_name = hasher_type.GetUnqualifiedType().GetDisplayTypeName().removeprefix("::")
+    return hasher_name.startswith("HashMapHasherDefault") or hasher_name.startswith("VariantHasher")
+
+
+def lookup_hashed_key(
+    table: SBValue, hasher_index: int, key_kind: Optional[str], candidates: list[int], probe: Callable[[int], Optional[int]]
+) -> Optional[int]:
+    """
+    Probes a hash table with each candidate hash; `probe` returns a bucket, -1 if not found, or None if it couldn't read the table.
+    The candidate that finds a key is remembered for the table's type (which names its hasher), after which a miss is conclusive.
+    A miss is never conclusive if the table doesn't use the default hasher (`hasher_index` is its template argument).
+    Returns the bucket, -1 if the key isn't in the table, or None if that isn't known.
+    """
+    conclusive = has_default_hasher(table, hasher_index)
+    hasher_key = (get_target_key(table.GetTarget()), table.GetType().GetName(), key_kind)
+    known = key_hasher_indices.get(hasher_key) if key_kind is not None else None
+    if known is not None:
+        pos = probe(candidates[known])
+        return pos if pos is None or pos >= 0 or conclusive else None
+    for i, hash in enumerate(candidates):
+        pos = probe(hash)
+        if pos is None:
+            return None
+        if pos >= 0:
+            if key_kind is not None:
+                key_hasher_indices[hasher_key] = i
+            return pos
+    return -1 if conclusive and len(candidates) == 1 else None
+
+
 class VMap_SyntheticProvider(_ArrayLike_SyntheticProvider):
-    key_val_element_style: bool = Opts.MAP_KEY_VAL_STYLE
-    key_template_type: Optional[SBType] = None
-    key_val_element_style: bool = False
-    ptr_cast: Optional[SBValue] = None
-    cached_key_summaries: list[str] = list[str]()
-    cached_key_to_idx_map: dict[str, int] = dict[str, int]()
-    cache_fetch_max: int = 100
-    cache_min: int = 10
-    no_cache: bool = False
+    __slots__ = ("key_template_type", "key_val_element_style", "ptr_cast", "cached_key_summaries", "cached_key_to_idx_map")
+    is_cowdata_backed = True
+
     def __init__(self, valobj: SBValue, internal_dict, is_summary=False):
         super().__init__(valobj, internal_dict, is_summary)
 
     def update(self) -> None:
         super().update()
+        self.key_template_type: Optional[SBType] = None
+        self.key_val_element_style = False
+        self.ptr_cast: Optional[SBValue] = None
+        self.cached_key_summaries = list[str]()
+        self.cached_key_to_idx_map = dict[str, int]()
         if self.num_elements == 0:
             return
         self.key_template_type = self.valobj.GetType().GetTemplateArgumentType(0) if self.valobj else None
         self.key_val_element_style = should_use_key_val_style(self.key_template_type)
         pointer_to_array_type = self.ptr.GetType().GetPointeeType().GetArrayType(self.num_elements).GetPointerType() if self.ptr else None
         self.ptr_cast = self.ptr.Cast(pointer_to_array_type) if self.ptr and pointer_to_array_type else None
-        self.cached_key_summaries = list[str]()
-        self.cached_key_to_idx_map = dict[str, int]()
+        # key summaries are shared with every VMap using the same buffer
+        process = self.valobj.GetProcess()
+        ptr_addr = self.get_cowdata_ptr_addr()
+        tag = ("key_summaries", self.typename)
+        key_caches = cowdata_cache.get_for_buffer(process, ptr_addr, self.num_elements, tag) if ptr_addr else None
+        if key_caches is None:
+            key_caches = (list[str](), dict[str, int]())
+            if ptr_addr:
+                cowdata_cache.put_for_buffer(process, ptr_addr, self.num_elements, tag, key_caches)
+        self.cached_key_summaries, self.cached_key_to_idx_map = key_caches
         self.cache_elements(self.cache_min)
 
     def get_len(self, obj: SBValue):
@@ -1553,7 +2221,41 @@ class VMap_SyntheticProvider(_ArrayLike_SyntheticProvider):
         )
         return self.create_child_at_real_index(index, f"[{key}]")
 
+    def _find_typed_key(self, typed_key: TypedMapKey) -> Optional[int]:
+        """
+        Binary search over the sorted array; returns the index of the key, -1 if it isn't there, or None if the keys couldn't be read.
+        """
+        if not self.ptr or not self.item_type:
+            return None
+        key_offset = get_type_member_offset(self.item_type, "key")
+        if key_offset < 0:
+            return None
+        process = self.valobj.GetProcess()
+        base_addr = self.ptr.GetValueAsUnsigned()
+        low, high = 0, self.num_elements - 1
+        while low <= high:
+            mid = (low + high) // 2
+            result = typed_key.compare(process, base_addr + mid * self.item_size + key_offset)
+            if result is None:
+                return None
+            if result == 0:
+                return mid
+            if result < 0:
+                low = mid + 1
+            else:
+                high = mid - 1
+        return -1
+
     def get_index_of_key(self, key: str) -> Optional[int]:
+        if key in self.cached_key_to_idx_map:
+            return self.cached_key_to_idx_map[key]
+        typed_key = TypedMapKey.from_summary(self.key_template_type, key)
+        if typed_key is not None:
+            idx = self._find_typed_key(typed_key)
+            if idx == -1 and typed_key.is_exact():
+                return None
+            if idx is not None and idx >= 0 and self.get_key_by_index(idx) == key:
+                return idx
         if self.no_cache:
             for i in range(self.num_elements):
                 if not self.ptr_cast:
@@ -1583,14 +2285,52 @@ class VMap_SyntheticProvider(_ArrayLike_SyntheticProvider):
             return int(name.lstrip("[").rstrip("]"))
 
 
+class NodeLayout:
+    """
+    Offsets of the members of a linked-list node type, resolved once per node type.
+    """
+
+    def __init__(self, node_type: SBType, next_name: str, prev_name: str, data_name: str):
+        self.node_type = node_type
+        self.next_offset = get_type_member_offset(node_type, next_name)
+        self.prev_offset = get_type_member_offset(node_type, prev_name)
+        self.data_offset = get_type_member_offset(node_type, data_name)
+        self.data_type: Optional[SBType] = get_type_member_type(node_type, data_name)
+
+    def is_valid(self) -> bool:
+        return self.next_offset >= 0 and self.data_offset >= 0 and self.data_type is not None
+
+
+node_layouts: dict[tuple[int, str, str], NodeLayout] = {}
+
+
+def get_node_layout(target: SBTarget, node_type: SBType, next_name: str, prev_name: str, data_name: str) -> Optional[NodeLayout]:
+    key = (get_target_key(target), node_type.GetName(), next_name)
+    layout = node_layouts.get(key)
+    if layout is None:
+        layout = node_layouts[key] = NodeLayout(node_type, next_name, prev_name, data_name)
+    return layout if layout.is_valid() else None
+
+
 class _LinkedListLike_SyntheticProvider(_ListOfChildren_SyntheticProvider):
+    __slots__ = (
+        "cached_elements", "node_layout", "process", "checkpoints", "checkpoint_indices", "cursor", "known_indices", "checkpoints_seeded"
+    )
+    # Set to False if get_tail()/the prev member can't be used to walk the list backwards
+    supports_reverse_traversal: bool = True
+    # Names of the members of the element (node) struct; used to resolve their offsets once per node type
+    next_member_name: str = ""
+    prev_member_name: str = ""
+    data_member_name: str = ""
+
     def __init__(self, valobj: SBValue, internal_dict, is_summary=False):
-        self.cached_elements: list[SBValue] = list[SBValue]()
+        # node addresses, SBValues are only created for the children that are displayed
+        self.cached_elements: array = array("Q")
+        self.node_layout: Optional[NodeLayout] = None
+        self.process = valobj.GetProcess()
+        self._reset_checkpoints()
         super().__init__(valobj, internal_dict, is_summary)
 
-    def _create_synthetic_child(self, element: SBValue, index) -> SBValue:
-        raise Exception("Not implemented")
-
     def get_tail(self, obj: SBValue) -> SBValue:
         raise Exception("Not implemented")
 
@@ -1603,113 +2343,337 @@ class _LinkedListLike_SyntheticProvider(_ListOfChildren_SyntheticProvider):
     def get_list_element_data(self, element: SBValue) -> SBValue:
         raise Exception("Not implemented")
 
+    def _get_head_address(self) -> int:
+        head = self.get_ptr(self.valobj)
+        if not not_null_check(head):
+            return 0
+        return head.GetValueAsUnsigned()
+
+    def _get_tail_address(self) -> int:
+        tail = self.get_tail(self.valobj)
+        if not not_null_check(tail):
+            return 0
+        return tail.GetValueAsUnsigned()
+
+    def _update_node_layout(self):
+        self.node_layout = None
+        head = self.get_ptr(self.valobj)
+        if not not_null_check(head) or not head.GetType().IsPointerType():
+            return
+        node_type = head.GetType().GetPointeeType()
+        self.node_layout = get_node_layout(
+            self.valobj.GetTarget(), node_type, self.next_member_name, self.prev_member_name, self.data_member_name
+        )
+
+    def _read_next(self, node_addr: int) -> int:
+        if not self.node_layout:
+            return 0
+        return read_pointer(self.process, node_addr + self.node_layout.next_offset)
+
+    def _read_prev(self, node_addr: int) -> int:
+        if not self.node_layout or self.node_layout.prev_offset < 0:
+            return 0
+        return read_pointer(self.process, node_addr + self.node_layout.prev_offset)
+
+    def _create_data_value(self, node_addr: int, name: str) -> SBValue:
+        if not self.node_layout:
+            return SBValue()
+        return self.valobj.CreateValueFromAddress(name, node_addr + self.node_layout.data_offset, self.node_layout.data_type)
+
+    def _create_synthetic_child(self, node_addr: int, index: int) -> SBValue:
+        return self._create_data_value(node_addr, "[{0}]".format(str(index)))
+
+    def _on_element_cached(self, index: int, node_addr: int):
+        """
+        Override this to record per-element state (e.g. key summaries) as elements are cached
+        """
+        pass
+
     @hashmap_trace
     def _cache_elements(self, size: int):
-        if self.num_elements == 0 or size == 0:
+        if self.num_elements == 0 or size == 0 or not self.node_layout:
             return
         if size > self.num_elements:
             size = self.num_elements
-        start = 0
-        element: Optional[SBValue] = None
+        if len(self.cached_elements) >= size:
+            return
         if len(self.cached_elements) == 0:
-            el = self.get_ptr(self.valobj)
-            if not_null_check(el) and not (not el):
-                element = el
-                self.cached_elements.append(element)
-        else:
-            start = len(self.cached_elements) - 1
-            if start > size:
+            node_addr = self._get_head_address()
+            if node_addr == 0:
                 return
-            element = self.cached_elements[start]
-
-        for _ in range(start + 1, size):
-            element = self.get_list_element_next(element) if element else None
-            if not element:
-                break
-            if element.GetValueAsUnsigned() == 0:
+            self.cached_elements.append(node_addr)
+            self.known_indices[node_addr] = 0
+            self._on_element_cached(0, node_addr)
+        node_addr = self.cached_elements[-1]
+        for index in range(len(self.cached_elements), size):
+            node_addr = self._read_next(node_addr)
+            if node_addr == 0:
                 break
-            self.cached_elements.append(element)
+            self.cached_elements.append(node_addr)
+            self.known_indices[node_addr] = index
+            self._on_element_cached(index, node_addr)
 
     @hashmap_trace
-    def check_valid(self, obj: SBValue) -> bool:
+    def check_valid_tier(self, obj: SBValue, tier: int) -> bool:
         if not not_null_check(obj):
             return False
         size = self.get_len(obj)
-        if size > 0:
-            # check if head_element is valid
-            head_element: SBValue = self.get_ptr(obj)
+        if size == 0:
+            return True
+        head_element: SBValue = self.get_ptr(obj)
+        tail_element: SBValue = self.get_tail(obj)
+        if tier == VALIDATION_CHEAP:
             if not is_valid_pointer(head_element):
                 print_trace("head_element is not valid")
                 return False
-            # check if head_element->prev() is nullptr (it should be if the size is > 0)
-            prev: SBValue = self.get_list_element_prev(head_element)
-            if not pointer_exists_and_is_null(prev):
-                print_trace("head_element->prev is not nullptr")
-                return False
-            # check if tail_element is valid
-            tail_element: SBValue = self.get_tail(obj)
             if not is_valid_pointer(tail_element):
                 print_trace("tail_element is not valid")
                 return False
-            # check if tail_element->next() is nullptr (it should be if the size is > 0)
-            next: SBValue = self.get_list_element_next(tail_element)
-            if not pointer_exists_and_is_null(next):
+        elif tier == VALIDATION_MEDIUM:
+            # head_element->prev() and tail_element->next() should be nullptr if the size is > 0
+            if not pointer_exists_and_is_null(self.get_list_element_prev(head_element)):
+                print_trace("head_element->prev is not nullptr")
+                return False
+            if not pointer_exists_and_is_null(self.get_list_element_next(tail_element)):
                 print_trace("tail_element->next is not nullptr")
                 return False
-            if size >= 2:
-                # check if head_element->next() is valid
-                next = self.get_list_element_next(head_element)
-                if not is_valid_pointer(next):
-                    print_trace("head_element->next is not valid")
-                    return False
-                # check if tail_element->prev() is valid
-                prev = self.get_list_element_prev(self.get_tail(obj))
-                if not is_valid_pointer(prev):
-                    print_trace("tail_element->prev is not valid")
-                    return False
+        elif size >= 2:
+            # head_element->next() and tail_element->prev() should be valid
+            if not is_valid_pointer(self.get_list_element_next(head_element)):
+                print_trace("head_element->next is not valid")
+                return False
+            if not is_valid_pointer(self.get_list_element_prev(tail_element)):
+                print_trace("tail_element->prev is not valid")
+                return False
         return True
 
+    def _reset_elements(self):
+        self._reset_checkpoints()
+        self.cached_elements = array("Q")
+        self.process = self.valobj.GetProcess()
+        self._update_node_layout()
+
     @hashmap_trace
     def update(self):
-        if self.cached_elements is None:
-            self.cached_elements = list[SBValue]()
         self.num_elements = self.get_len(self.valobj)
-        if self.check_valid(self.valobj) == False:
+        if not self.is_valid():
+            self.num_elements = 0
+        self._reset_elements()
+        if self.node_layout is None:
+            self.num_elements = 0
+        if self.num_elements == 0:
+            return
+        if self.range_view is not None:
+            self._share_walk_state()
+        if self.no_cache:
+            return
+        self._cache_elements(self.cache_min)
+
+    @hashmap_trace
+    def update_summary(self):
+        # no walk state is shared or checkpointed; a range child's summary is only its element count
+        self.num_elements = self.get_len(self.valobj)
+        if not self.is_valid():
             self.num_elements = 0
-        self.cached_elements.clear()
-        if self.no_cache or self.num_elements == 0:
+        self._reset_elements()
+        if self.node_layout is None:
+            self.num_elements = 0
+        if self.num_elements == 0 or self.range_view is not None or self.no_cache:
             return
         self._cache_elements(self.cache_min)
 
+    def _share_walk_state(self) -> Optional["_LinkedListLike_SyntheticProvider"]:
+        """
+        Range children start from the walk state of the whole container (found through the provider registry),
+        so that expanding a range walks from the nearest checkpoint instead of from the head.
+        The checkpoints are shared, so ranges expanded later also start from the ones recorded here.
+        Returns the container's provider, or None if its state couldn't be used.
+        """
+        container = self.valobj.CreateValueFromAddress("container", self.valobj.GetLoadAddress(), self.type)
+        if not container:
+            return None
+        parent = get_synth_provider_for_object(type(self), container, self.internal_dict, False)
+        if parent is self or parent.num_elements != self.num_elements or parent.node_layout is None:
+            return None
+        # cached elements are copied; a provider caching further also records their keys (see HashMap)
+        self.cached_elements = array("Q", parent.cached_elements)
+        self.checkpoints = parent.checkpoints
+        self.checkpoint_indices = parent.checkpoint_indices
+        self.known_indices = parent.known_indices
+        self.checkpoints_seeded = parent.checkpoints_seeded
+        self.cursor = parent.cursor
+        return parent
+
+    def _reset_checkpoints(self):
+        # index -> node address, recorded every CHECKPOINT_INTERVAL elements while walking the list
+        self.checkpoints: dict[int, int] = dict[int, int]()
+        self.checkpoint_indices: list[int] = list[int]()
+        # the last element that was looked up, so that paging through consecutive children is O(1) per child
+        self.cursor: Optional[tuple[int, int]] = None
+        # node address -> index, of every cached element and checkpoint
+        self.known_indices: dict[int, int] = dict[int, int]()
+        # whether checkpoints were recorded up to the tail, see _seed_checkpoints()
+        self.checkpoints_seeded = False
+
+    def _record_checkpoint(self, index: int, node_addr: int):
+        if index % CHECKPOINT_INTERVAL != 0 or index in self.checkpoints:
+            return
+        self.checkpoints[index] = node_addr
+        self.known_indices[node_addr] = index
+        bisect.insort(self.checkpoint_indices, index)
+
     @hashmap_trace
-    def _get_uncached_element_at_index(self, index: int) -> Optional[SBValue]:
+    def _seed_checkpoints(self):
+        """
+        Walks once from the furthest known element to the tail, recording checkpoints, so that the index of any node
+        is at most CHECKPOINT_INTERVAL steps back from a known one.
+        """
+        self.checkpoints_seeded = True
+        current = len(self.cached_elements) - 1
+        node_addr = self.cached_elements[-1] if current >= 0 else 0
+        if self.checkpoint_indices and self.checkpoint_indices[-1] > current:
+            current = self.checkpoint_indices[-1]
+            node_addr = self.checkpoints[current]
+        if node_addr == 0:
+            current, node_addr = 0, self._get_head_address()
+            if node_addr == 0:
+                return
+            self.known_indices[node_addr] = 0
+        while current < self.num_elements - 1:
+            node_addr = self._read_next(node_addr)
+            if node_addr == 0:
+                return
+            current += 1
+            self._record_checkpoint(current, node_addr)
+
+    def _get_nearest_anchors(self, index: int) -> tuple[Optional[tuple[int, int]], Optional[tuple[int, int]]]:
+        """
+        Returns the closest known (index, node address) at or before `index`, and the closest one after it.
+        """
+        before: Optional[tuple[int, int]] = None
+        after: Optional[tuple[int, int]] = None
+        if len(self.cached_elements) > 0:
+            last_cached = min(len(self.cached_elements), index + 1) - 1
+            before = (last_cached, self.cached_elements[last_cached])
+        else:
+            head_addr = self._get_head_address()
+            if head_addr != 0:
+                before = (0, head_addr)
+        pos = bisect.bisect_right(self.checkpoint_indices, index)
+        if pos > 0:
+            cp_index = self.checkpoint_indices[pos - 1]
+            if before is None or cp_index > before[0]:
+                before = (cp_index, self.checkpoints[cp_index])
+        if self.cursor and self.cursor[0] <= index and (before is None or self.cursor[0] > before[0]):
+            before = self.cursor
+        if not self.supports_reverse_traversal:
+            return before, None
+        if pos < len(self.checkpoint_indices):
+            cp_index = self.checkpoint_indices[pos]
+            after = (cp_index, self.checkpoints[cp_index])
+        if self.cursor and self.cursor[0] > index and (after is None or self.cursor[0] < after[0]):
+            after = self.cursor
+        if after is None:
+            tail_addr = self._get_tail_address()
+            if tail_addr != 0:
+                after = (self.num_elements - 1, tail_addr)
+        return before, after
+
+    @hashmap_trace
+    def _get_uncached_element_at_index(self, index: int) -> int:
+        """
+        Walks from the nearest checkpoint (forwards, or backwards if that is shorter) to the element at `index`.
+        Returns the node address, or 0 if it couldn't be reached.
+        """
         if index < 0 or index >= self.num_elements or self.valobj.IsValid() == False:
+            return 0
+        before, after = self._get_nearest_anchors(index)
+        node_addr = 0
+        if after is not None and (before is None or after[0] - index < index - before[0]):
+            current, node_addr = after
+            while current > index:
+                node_addr = self._read_prev(node_addr)
+                if node_addr == 0:
+                    return 0
+                current -= 1
+                self._record_checkpoint(current, node_addr)
+        elif before is not None:
+            current, node_addr = before
+            while current < index:
+                node_addr = self._read_next(node_addr)
+                if node_addr == 0:
+                    return 0
+                current += 1
+                self._record_checkpoint(current, node_addr)
+        if node_addr != 0:
+            self.cursor = (index, node_addr)
+        return node_addr
+
+    @hashmap_trace
+    def _get_element_at_index(self, index: int) -> int:
+        if self.no_cache or index >= self.cache_fetch_max:
+            return self._get_uncached_element_at_index(index)
+        if index >= len(self.cached_elements):
+            self._cache_elements(len(self.cached_elements) + self.cache_fetch_max)
+        if index >= len(self.cached_elements):
+            return 0
+        return self.cached_elements[index]
+
+    @hashmap_trace
+    def _get_index_of_node(self, node_addr: int) -> Optional[int]:
+        """
+        Finds the index of an element found by address (e.g. by a tree search), by walking backwards until
+        reaching an element whose index is already known (a cached element, a checkpoint, or the head).
+        The first lookup records checkpoints up to the tail; after that, no walk is longer than CHECKPOINT_INTERVAL.
+        """
+        if node_addr == 0 or self.num_elements == 0 or not self.node_layout or self.node_layout.prev_offset < 0:
             return None
-        element = self.get_ptr(self.valobj)
-        for _ in range(index):
-            element = self.get_list_element_next(element) if element else None
-            if not element:
+        index: Optional[int] = self.known_indices.get(node_addr)
+        if index is not None:
+            return index
+        if self.cursor and self.cursor[1] == node_addr:
+            return self.cursor[0]
+        if not self.checkpoints_seeded:
+            self._seed_checkpoints()
+        path: list[int] = []
+        addr = node_addr
+        for _ in range(self.num_elements):
+            known = self.known_indices.get(addr)
+            if known is None and self.cursor and self.cursor[1] == addr:
+                known = self.cursor[0]
+            if known is not None:
+                index = known + len(path)
                 break
-        return element
+            path.append(addr)
+            addr = self._read_prev(addr)
+            if addr == 0:
+                # either path[-1] is the head, or the read failed
+                if path[-1] == self._get_head_address():
+                    index = len(path) - 1
+                break
+        if index is None or index >= self.num_elements:
+            return None
+        for steps, addr in enumerate(path):
+            self._record_checkpoint(index - steps, addr)
+        self.cursor = (index, node_addr)
+        return index
 
     @hashmap_trace
     def _create_child_at_element_index(self, index: int) -> Optional[SBValue]:
         if index < 0 or index >= self.num_elements or self.valobj.IsValid() == False:
             return None
-
-        element: Optional[SBValue] = None
-        if self.no_cache or index >= self.cache_fetch_max:
-            element = self._get_uncached_element_at_index(index) if self.valobj else None
-        else:
-            if index >= len(self.cached_elements):
-                self._cache_elements(len(self.cached_elements) + self.cache_fetch_max)
-            element = self.cached_elements[index]
-        if not element:
+        node_addr = self._get_element_at_index(index)
+        if node_addr == 0:
             return None
-        return self._create_synthetic_child(element, index)
+        return self._create_synthetic_child(node_addr, index)
 
 
 class List_SyntheticProvider(_LinkedListLike_SyntheticProvider):
+    __slots__ = ()
+    next_member_name = "next_ptr"
+    prev_member_name = "prev_ptr"
+    data_member_name = "value"
+
     def __init__(self, valobj: SBValue, internal_dict, is_summary=False):
         super().__init__(valobj, internal_dict, is_summary)
 
@@ -1740,23 +2704,14 @@ class List_SyntheticProvider(_LinkedListLike_SyntheticProvider):
     def get_list_element_data(self, element: SBValue) -> SBValue:
         return element.GetChildMemberWithName("value")
 
-    def _create_synthetic_child(self, element: SBValue, index):
-        value: SBValue = element.GetChildMemberWithName("value")
-        offset = get_offset_of_object_member(element, "value")
-        if offset < 0:
-            return SBValue()
-        return element.CreateChildAtOffset("[{0}]".format(str(index)), offset, value.GetType())
-
 
 class HashMap_SyntheticProvider(_LinkedListLike_SyntheticProvider):
-    key_val_element_style: bool = Opts.MAP_KEY_VAL_STYLE
-    cached_elements: list[SBValue] = list[SBValue]()
-    cached_key_to_idx_map: dict[str, int] = dict[str, int]()
-    cached_idx_to_key_map: dict[int, str] = dict[int, str]()
-    key_template_type: Optional[SBType] = None
-    num_elements: int = 0
-    no_cache: bool = False
-    cached_skip_length: int = -1
+    __slots__ = (
+        "key_val_element_style", "cached_key_to_idx_map", "cached_idx_to_key_map", "key_template_type", "key_is_string_name", "key_offset", "key_type"
+    )
+    next_member_name = "next"
+    prev_member_name = "prev"
+    data_member_name = "data"
 
     @hashmap_trace
     def __init__(self, valobj: SBValue, internal_dict, is_summary=False):
@@ -1765,19 +2720,44 @@ class HashMap_SyntheticProvider(_LinkedListLike_SyntheticProvider):
     @hashmap_trace
     def update(self) -> None:
         self.num_elements = self.get_len(self.valobj)
-        is_valid = self.check_valid(self.valobj)
-        if not is_valid:
+        if not self.is_valid():
             self.num_elements = 0
-        self.cached_elements = list[SBValue]()
-        self.cached_key_to_idx_map = dict[str, int]()
-        self.cached_idx_to_key_map = dict[int, str]()
+        self._reset_elements()
+        if self.node_layout is None:
+            self.num_elements = 0
+        self._update_key_info()
+        if self.range_view is not None and self.num_elements != 0:
+            parent = self._share_walk_state()
+            if isinstance(parent, HashMap_SyntheticProvider) and parent.cached_key_to_idx_map is not None:
+                self.cached_key_to_idx_map = dict(parent.cached_key_to_idx_map)
+                self.cached_idx_to_key_map = dict(parent.cached_idx_to_key_map or {})
+        if not self.no_cache:
+            self._cache_elements(self.cache_min)
+
+    @hashmap_trace
+    def update_summary(self) -> None:
+        super().update_summary()
+        # _get_child_summary formats the keys itself, so none are recorded while caching
+        self._update_key_info()
+
+    def _update_key_info(self):
+        # key <-> index maps, only made once a key is recorded
+        self.cached_key_to_idx_map: Optional[dict[str, int]] = None
+        self.cached_idx_to_key_map: Optional[dict[int, str]] = None
         self.key_val_element_style = False
         self.key_template_type = None
-        if self.num_elements != 0:
-            self.key_template_type = self.valobj.GetType().GetTemplateArgumentType(0) if is_valid else None
+        self.key_is_string_name = False
+        self.key_offset = -1
+        self.key_type = None
+        if self.num_elements != 0 and self.node_layout and self.node_layout.data_type:
+            self.key_template_type = self.valobj.GetType().GetTemplateArgumentType(0)
             self.key_val_element_style = should_use_key_val_style(self.key_template_type)
-        if not self.no_cache:
-            self._cache_elements(self.cache_min)
+            if self.key_template_type:
+                key_type_name = self.key_template_type.GetUnqualifiedType().GetDisplayTypeName()
+                self.key_is_string_name = key_type_name in ("StringName", "::StringName")
+            # both RBMap and HashMap use KeyValue<K, V> for the data member of their elements
+            self.key_offset = get_type_member_offset(self.node_layout.data_type, "key")
+            self.key_type = get_type_member_type(self.node_layout.data_type, "key")
 
     @hashmap_trace
     def get_len(self, obj: SBValue):
@@ -1811,25 +2791,105 @@ class HashMap_SyntheticProvider(_LinkedListLike_SyntheticProvider):
     def get_list_element_keyvalue(self, element: SBValue) -> SBValue:
         return self.get_list_element_data(element).GetChildMemberWithName("value")
 
+    @hashmap_trace
+    def get_key_summary(self, key: SBValue) -> str:
+        # StringName keys (method names, property keys, ...) go straight to the StringName cache
+        if self.key_is_string_name:
+            return get_string_name_summary(key)
+        return GenericShortSummary(key, self.internal_dict, 0, False, False)
+
+    @hashmap_trace
+    def _create_key_value(self, node_addr: int) -> SBValue:
+        if not self.node_layout or self.key_offset < 0 or not self.key_type:
+            return SBValue()
+        return self.valobj.CreateValueFromAddress("key", node_addr + self.node_layout.data_offset + self.key_offset, self.key_type)
+
+    @hashmap_trace
+    def _get_key_summary_at(self, node_addr: int) -> str:
+        return self.get_key_summary(self._create_key_value(node_addr))
+
     @hashmap_trace
     def get_index_of_child(self, name: str):
+        name = name.lstrip("[").rstrip("]")
         if self.key_val_element_style:
-            return self.get_index_of_key(name.lstrip("[").rstrip("]"))
-        else:
-            return int(name.lstrip("[").rstrip("]"))
+            return self.get_index_of_key(name)
+        try:
+            return int(name)
+        except ValueError:
+            # e.g. a Dictionary key
+            return self.get_index_of_key(name)
+
+    @hashmap_trace
+    def _find_element_by_key(self, key: str) -> Optional[int]:
+        """
+        Finds the element of a key by probing `hashes` like HashMap::_lookup_pos().
+        Returns the element address, 0 if the key isn't in the map, or None if that isn't known.
+        """
+        hashed = get_key_hash_candidates(self.key_template_type, key)
+        if hashed is None or not self.key_template_type or not self.node_layout:
+            return None
+        hashes_addr = self.valobj.GetChildMemberWithName("hashes").GetValueAsUnsigned()
+        elements_addr = self.valobj.GetChildMemberWithName("elements").GetValueAsUnsigned()
+        capacity_index = self.valobj.GetChildMemberWithName("capacity_index").GetValueAsUnsigned()
+        if hashes_addr == 0 or elements_addr == 0:
+            return None
+        found: list[int] = [0]
+
+        def matches(pos: int) -> bool:
+            element_addr = read_pointer(self.process, elements_addr + pos * self.process.GetAddressByteSize())
+            if element_addr == 0 or self._get_key_summary_at(element_addr) != key:
+                return False
+            found[0] = element_addr
+            return True
+
+        key_kind, candidates = hashed
+        pos = lookup_hashed_key(
+            self.valobj,
+            2,
+            key_kind,
+            candidates,
+            lambda hash: probe_hash_table(self.process, hashes_addr, capacity_index, hash, matches),
+        )
+        if pos is None:
+            return None
+        return found[0] if pos >= 0 else 0
+
+    def _record_key(self, index: int, key: str, replace: bool = True):
+        if self.cached_key_to_idx_map is None or self.cached_idx_to_key_map is None:
+            self.cached_key_to_idx_map = dict[str, int]()
+            self.cached_idx_to_key_map = dict[int, str]()
+        if replace or key not in self.cached_key_to_idx_map:
+            self.cached_key_to_idx_map[key] = index
+        if replace or index not in self.cached_idx_to_key_map:
+            self.cached_idx_to_key_map[index] = key
+
+    def _get_cached_index_of_key(self, key: str) -> Optional[int]:
+        return self.cached_key_to_idx_map.get(key) if self.cached_key_to_idx_map else None
 
     @hashmap_trace
     def get_index_of_key(self, key: str):
-        if key in self.cached_key_to_idx_map and self.cached_key_to_idx_map[key] is not None:
-            return self.cached_key_to_idx_map[key]
+        idx = self._get_cached_index_of_key(key)
+        if idx is not None:
+            return idx
+        element_addr = self._find_element_by_key(key)
+        if element_addr == 0:
+            return None
+        if element_addr is not None:
+            idx = self._get_index_of_node(element_addr)
+            if idx is not None:
+                self._record_key(idx, key)
+                return idx
+        if not self.key_val_element_style:
+            # keys are only recorded while caching in MAP_KEY_VAL_STYLE
+            return None
         while len(self.cached_elements) < self.num_elements:  # type: ignore
-            new_length = len(self.cached_elements) + self.cache_fetch_max
-            if new_length > self.num_elements:
-                new_length = self.num_elements
-            self._cache_elements(new_length)
-            idx = self.cached_key_to_idx_map[key]
+            cached_count = len(self.cached_elements)
+            self._cache_elements(cached_count + self.cache_fetch_max)
+            idx = self._get_cached_index_of_key(key)
             if idx is not None:  # type: ignore
                 return idx
+            if len(self.cached_elements) == cached_count:
+                break
         return None
 
     @hashmap_trace
@@ -1837,104 +2897,162 @@ class HashMap_SyntheticProvider(_LinkedListLike_SyntheticProvider):
     def _get_child_summary(self, real_index: int) -> str:
         if real_index < 0 or real_index >= self.num_elements or not self.valobj or self.valobj.IsValid() == False:
             return INVALID_SUMMARY
-        keyval_synth_val = self._create_child_at_element_index(real_index)
+        # the element is made from its node directly, so that its key isn't also formatted for the child's name
+        node_addr = self._get_element_at_index(real_index)
+        if node_addr == 0:
+            return INVALID_SUMMARY
+        keyval_synth_val = self._create_data_value(node_addr, "[{0}]".format(real_index))
         if not not_null_check(keyval_synth_val) or not keyval_synth_val:
             return INVALID_SUMMARY
         keyval_data = keyval_synth_val.GetNonSyntheticValue()
         # both RBMap and HashMap use KeyValue<K, V> for the data member of their elements
         key = keyval_data.GetChildMemberWithName("key")
         value = keyval_data.GetChildMemberWithName("value")
-        key_summary = GenericShortSummary(key, self.internal_dict)
+        key_summary = self.get_key_summary(key)
         value_summary = GenericShortSummary(value, self.internal_dict)
         return "[{0}]: {1}".format(key_summary, value_summary)
 
-    def get_offset_of_element_data(self, element: SBValue) -> int:
-        if self.cached_skip_length >= 0:
-            return self.cached_skip_length
-        data = self.get_list_element_data(element)
-        next_addr = element.GetChildMemberWithName("next").GetAddress()
-        data_addr = data.GetAddress()
-        self.cached_skip_length = data_addr.GetOffset() - next_addr.GetOffset()
-        return self.cached_skip_length
-
     @hashmap_trace
-    def _cache_elements(self, size: int):
-        if self.num_elements == 0 or size == 0:
+    def _on_element_cached(self, index: int, node_addr: int):
+        if self.is_summary or not self.key_val_element_style:
             return
-        if size > self.num_elements:
-            size = self.num_elements
-        start = 0
-        element: SBValue
-        if self.cached_elements is None:
-            self.cached_elements = list[SBValue]()
-        if len(self.cached_elements) == 0:
-            element = self.get_ptr(self.valobj)
-            if not not_null_check(element):
-                return
-            self.cached_elements.append(element)
-        else:
-            start = len(self.cached_elements) - 1
-            if start > size:
-                return
-            element = self.cached_elements[start]
-        if self.key_val_element_style:
-            key = self.get_list_element_key(element)
-            keySummary = GenericShortSummary(key, self.internal_dict, 0, False, False)
-            self.cached_key_to_idx_map[keySummary] = start
-            self.cached_idx_to_key_map[start] = keySummary
-        for _ in range(start + 1, size):
-            element = self.get_list_element_next(element)
-            if not element or element.GetValueAsUnsigned() == 0:
-                break
-            self.cached_elements.append(element)
-            if self.key_val_element_style:
-                key = self.get_list_element_key(element)
-                keySummary = GenericShortSummary(key, self.internal_dict, 0, False, False)
-                self.cached_key_to_idx_map[keySummary] = len(self.cached_elements) - 1
-                self.cached_idx_to_key_map[len(self.cached_elements) - 1] = keySummary
+        keySummary = self._get_key_summary_at(node_addr)
+        self._record_key(index, keySummary)
 
     @hashmap_trace
-    def _create_synthetic_child(self, element: SBValue, index):
-        if not element or not element.IsValid():
-            print_trace("HashMap_SyntheticProvider._create_synthetic_child(): element is None or invalid")
-            return SBValue()
+    def _create_synthetic_child(self, node_addr: int, index: int) -> SBValue:
         if self.key_val_element_style:
             keyname = ""
-            if index in self.cached_idx_to_key_map:
+            if self.cached_idx_to_key_map and index in self.cached_idx_to_key_map:
                 keyname = self.cached_idx_to_key_map[index]
             else:
-                key = self.get_list_element_key(element)
-                keyname = GenericShortSummary(key, self.internal_dict, 0, False, False)
+                keyname = self._get_key_summary_at(node_addr)
         else:
             keyname = str(index)
-        if keyname not in self.cached_key_to_idx_map:
-            self.cached_key_to_idx_map[keyname] = index
-        if index not in self.cached_idx_to_key_map:
-            self.cached_idx_to_key_map[index] = keyname
-        offset = self.get_offset_of_element_data(element)
-        hme_data_type = self.get_list_element_data(element).GetType()
-        value = element.CreateChildAtOffset("[{0}]".format(str(index)), offset, hme_data_type)
-        return value
+        self._record_key(index, keyname, replace=False)
+        return self._create_data_value(node_addr, "[{0}]".format(str(index)))
+
+
+# (_root, _nil) -> (front, back) element addresses
+rbmap_extremes_cache = StopScopedCache("rbmap_extremes")
 
 
 class RBMap_SyntheticProvider(HashMap_SyntheticProvider):
+    __slots__ = ()
+    next_member_name = "_next"
+    prev_member_name = "_prev"
+    data_member_name = "_data"
+
     def get_len(self, obj: SBValue):
         return obj.GetChildMemberWithName("_data").GetChildMemberWithName("size_cache").GetValueAsUnsigned(0)
 
+    def _get_extremes(self, obj: SBValue) -> tuple[int, int, Optional[SBType]]:
+        """
+        Finds the first and last elements by descending from `_data._root` in memory, like RBMap::front() and RBMap::back().
+        Returns (front address, back address, Element pointer type)
+        """
+        _data: SBValue = obj.GetChildMemberWithName("_data")
+        _root: SBValue = _data.GetChildMemberWithName("_root")
+        if not not_null_check(_root) or not _root.GetType().IsPointerType():
+            return 0, 0, None
+        element_ptr_type: SBType = _root.GetType()
+        root_addr = _root.GetValueAsUnsigned()
+        nil_addr = _data.GetChildMemberWithName("_nil").GetValueAsUnsigned()
+        if root_addr == 0:
+            return 0, 0, element_ptr_type
+        process = obj.GetProcess()
+        rbmap_extremes_cache.sync(process)
+        extremes = rbmap_extremes_cache.get((root_addr, nil_addr))
+        if extremes is not None:
+            return extremes[0], extremes[1], element_ptr_type
+        element_type = element_ptr_type.GetPointeeType()
+        left_offset = get_type_member_offset(element_type, "left")
+        right_offset = get_type_member_offset(element_type, "right")
+        if left_offset < 0 or right_offset < 0:
+            return 0, 0, element_ptr_type
+        # _root is a sentinel, the actual root of the tree is its left child
+        top = read_pointer(process, root_addr + left_offset)
+        if top == 0 or top == nil_addr:
+            front = back = 0
+        else:
+            # a red-black tree can't be deeper than 2*log2(n+1); bound the descent in case of garbage
+            max_depth = 2 * max(self.get_len(obj), 1).bit_length() + 2
+            front = self._descend(process, top, nil_addr, left_offset, max_depth)
+            back = self._descend(process, top, nil_addr, right_offset, max_depth)
+        rbmap_extremes_cache.put((root_addr, nil_addr), (front, back))
+        return front, back, element_ptr_type
+
+    @staticmethod
+    def _descend(process, element_addr: int, nil_addr: int, child_offset: int, max_depth: int) -> int:
+        for _ in range(max_depth):
+            child = read_pointer(process, element_addr + child_offset)
+            if child == 0:
+                return 0
+            if child == nil_addr:
+                return element_addr
+            element_addr = child
+        return 0
+
+    def _has_default_comparator(self) -> bool:
+        comparator_type: SBType = self.valobj.GetType().GetTemplateArgumentType(2)
+        if not comparator_type or not comparator_type.IsValid():
+            return True
+        return comparator_type.GetUnqualifiedType().GetDisplayTypeName().removeprefix("::").startswith("Comparator<")
+
+    @hashmap_trace
+    def _find_typed_key(self, typed_key: TypedMapKey) -> Optional[int]:
+        """
+        Descends the tree like RBMap::find(); returns the element address, 0 if the key isn't there, or None if the keys couldn't be compared.
+        """
+        if not self.node_layout or self.key_offset < 0 or not self._has_default_comparator():
+            return None
+        _data: SBValue = self.valobj.GetChildMemberWithName("_data")
+        root_addr = _data.GetChildMemberWithName("_root").GetValueAsUnsigned()
+        nil_addr = _data.GetChildMemberWithName("_nil").GetValueAsUnsigned()
+        left_offset = get_type_member_offset(self.node_layout.node_type, "left")
+        right_offset = get_type_member_offset(self.node_layout.node_type, "right")
+        if root_addr == 0 or left_offset < 0 or right_offset < 0:
+            return None
+        key_offset = self.node_layout.data_offset + self.key_offset
+        # _root is a sentinel, the actual root of the tree is its left child
+        element_addr = read_pointer(self.process, root_addr + left_offset)
+        max_depth = 2 * max(self.num_elements, 1).bit_length() + 2
+        for _ in range(max_depth):
+            if element_addr == 0:
+                return None
+            if element_addr == nil_addr:
+                return 0
+            result = typed_key.compare(self.process, element_addr + key_offset)
+            if result is None:
+                return None
+            if result == 0:
+                return element_addr
+            element_addr = read_pointer(self.process, element_addr + (right_offset if result < 0 else left_offset))
+        return None
+
+    @hashmap_trace
+    def _find_element_by_key(self, key: str) -> Optional[int]:
+        typed_key = TypedMapKey.from_summary(self.key_template_type, key)
+        if typed_key is None:
+            return None
+        element_addr = self._find_typed_key(typed_key)
+        if element_addr == 0:
+            return 0 if typed_key.is_exact() else None
+        if element_addr and self._get_key_summary_at(element_addr) == key:
+            return element_addr
+        return None
+
     def get_ptr(self, obj: SBValue) -> SBValue:
-        return obj.EvaluateExpression("front()").GetNonSyntheticValue()
+        front, _, element_ptr_type = self._get_extremes(obj)
+        if element_ptr_type is None:
+            return SBValue()
+        return create_pointer_value(obj, "front", front, element_ptr_type)
 
     def get_tail(self, obj: SBValue) -> SBValue:
-        raise Exception("Not implemented, should not be called")
-
-    def get_offset_of_element_data(self, element: SBValue) -> int:
-        if self.cached_skip_length >= 0:
-            return self.cached_skip_length
-        data = self.get_list_element_data(element)
-        data_addr = data.GetAddress()
-        right_addr = element.GetChildMemberWithName("right").GetAddress()
-        self.cached_skip_length = data_addr.GetOffset() - right_addr.GetOffset()
-        return self.cached_skip_length
+        _, back, element_ptr_type = self._get_extremes(obj)
+        if element_ptr_type is None:
+            return SBValue()
+        return create_pointer_value(obj, "back", back, element_ptr_type)
 
     def get_list_element_next(self, element: SBValue) -> SBValue:
         return element.GetChildMemberWithName("_next")
@@ -1945,25 +3063,144 @@ class RBMap_SyntheticProvider(HashMap_SyntheticProvider):
     def get_list_element_data(self, element: SBValue) -> SBValue:
         return element.GetChildMemberWithName("_data")
 
-    def check_valid(self, obj: SBValue) -> bool:
-        size = self.get_len(obj)
-        if size > 0:
-            # check if head_element is valid
-            head_element: SBValue = self.get_ptr(obj)
-            if not is_valid_pointer(head_element):
-                return False
-            prev = self.get_list_element_prev(head_element)
-            if not pointer_exists_and_is_null(prev):
-                return False
-            if size >= 2:
-                # check if head_element->next() is valid
-                next: SBValue = self.get_list_element_next(head_element)
-                if not is_valid_pointer(next):
-                    return False
-        return True
+
+class AHashMap_SyntheticProvider(_ArrayLike_SyntheticProvider):
+    """
+    AHashMap keeps its KeyValue elements in one contiguous `elements` array, in insertion order (erasing moves the last
+    element into the hole), and the hash table in a separate `map_data` array of (hash, element index) buckets.
+    Children are indexed directly; keys are found by probing `map_data`.
+    """
+
+    __slots__ = ("key_template_type", "key_val_element_style", "key_is_string_name", "key_offset", "key_type")
+
+    def __init__(self, valobj: SBValue, internal_dict, is_summary=False):
+        super().__init__(valobj, internal_dict, is_summary)
+
+    def get_ptr(self, obj: SBValue) -> SBValue:
+        return obj.GetChildMemberWithName("elements")
+
+    def get_len(self, obj: SBValue):
+        return obj.GetChildMemberWithName("num_elements").GetValueAsUnsigned(0)
+
+    def check_valid_tier(self, obj: SBValue, tier: int) -> bool:
+        if not super().check_valid_tier(obj, tier):
+            return False
+        num_elements = self.get_len(obj)
+        if tier != VALIDATION_CHEAP or num_elements == 0:
+            return True
+        # `capacity` is the power of 2 capacity - 1
+        capacity_mask = obj.GetChildMemberWithName("capacity").GetValueAsUnsigned(0)
+        if capacity_mask & (capacity_mask + 1) != 0 or num_elements > capacity_mask + 1:
+            return False
+        return is_valid_pointer(obj.GetChildMemberWithName("map_data"))
+
+    def update(self) -> None:
+        super().update()
+        self.key_template_type: Optional[SBType] = None
+        self.key_val_element_style = False
+        self.key_is_string_name = False
+        self.key_offset = -1
+        self.key_type: Optional[SBType] = None
+        if self.num_elements == 0 or not self.item_type:
+            return
+        self.key_template_type = self.valobj.GetType().GetTemplateArgumentType(0)
+        self.key_val_element_style = should_use_key_val_style(self.key_template_type)
+        if self.key_template_type:
+            key_type_name = self.key_template_type.GetUnqualifiedType().GetDisplayTypeName()
+            self.key_is_string_name = key_type_name in ("StringName", "::StringName")
+        self.key_offset = get_type_member_offset(self.item_type, "key")
+        self.key_type = get_type_member_type(self.item_type, "key")
+
+    def get_key_summary(self, key: SBValue) -> str:
+        if self.key_is_string_name:
+            return get_string_name_summary(key)
+        return GenericShortSummary(key, self.internal_dict, 0, False, False)
+
+    def _get_key_summary_at(self, index: int) -> str:
+        if not self.ptr or self.key_offset < 0 or not self.key_type:
+            return INVALID_SUMMARY
+        key_addr = self.ptr.GetValueAsUnsigned() + index * self.item_size + self.key_offset
+        return self.get_key_summary(self.valobj.CreateValueFromAddress("key", key_addr, self.key_type))
+
+    def _create_child_at_element_index(self, index: int) -> Optional[SBValue]:
+        key = self._get_key_summary_at(index) if self.key_val_element_style else str(index)
+        return self.create_child_at_real_index(index, "[{0}]".format(key))
+
+    @wrap_in_try_except_ret_error_summary
+    def _get_child_summary(self, real_index: int) -> str:
+        element = self.create_child_at_real_index(real_index, "[{0}]".format(real_index))
+        if not element:
+            return INVALID_SUMMARY
+        key_summary = self.get_key_summary(element.GetChildMemberWithName("key"))
+        value_summary = GenericShortSummary(element.GetChildMemberWithName("value"), self.internal_dict)
+        return "[{0}]: {1}".format(key_summary, value_summary)
+
+    def get_index_of_child(self, name: str) -> Optional[int]:
+        name = name.lstrip("[").rstrip("]")
+        if not self.key_val_element_style:
+            try:
+                return int(name)
+            except ValueError:
+                pass
+        return self.get_index_of_key(name)
+
+    def get_index_of_key(self, key: str) -> Optional[int]:
+        """
+        Finds a key by probing `map_data` like AHashMap::_lookup_idx(); the buckets hold the index in `elements`.
+        If the key can't be hashed, or a miss isn't conclusive (e.g. a custom hasher), the elements are scanned instead.
+        """
+        if not self.ptr or self.num_elements == 0:
+            return None
+        hashed = get_key_hash_candidates(self.key_template_type, key)
+        if hashed is not None:
+            process = self.valobj.GetProcess()
+            map_data_addr = self.valobj.GetChildMemberWithName("map_data").GetValueAsUnsigned()
+            capacity_mask = self.valobj.GetChildMemberWithName("capacity").GetValueAsUnsigned()
+
+            def matches(index: int) -> bool:
+                return index < self.num_elements and self._get_key_summary_at(index) == key
+
+            key_kind, candidates = hashed
+            index = lookup_hashed_key(
+                self.valobj,
+                2,
+                key_kind,
+                candidates,
+                lambda hash: probe_ahash_table(process, map_data_addr, capacity_mask, hash, matches),
+            )
+            if index is not None:
+                return index if index >= 0 else None
+        for i in range(self.num_elements):
+            if self._get_key_summary_at(i) == key:
+                return i
+        return None
+
+
+# (target, type name) -> the provider class for the layout of a hash map type, found by probing its members
+hash_map_provider_types: dict[tuple[int, str], Optional[type]] = {}
+
+
+def get_hash_map_provider_type(valobj: SBValue) -> Optional[type]:
+    """
+    Returns HashMap_SyntheticProvider for maps with linked elements (`head_element`), or AHashMap_SyntheticProvider
+    for maps with a contiguous `elements` array and `map_data`.
+    """
+    map_type: SBType = valobj.GetType().GetUnqualifiedType()
+    key = (get_target_key(valobj.GetTarget()), map_type.GetName())
+    if key in hash_map_provider_types:
+        return hash_map_provider_types[key]
+    provider_type: Optional[type] = None
+    if get_type_member_offset(map_type, "head_element") >= 0:
+        provider_type = HashMap_SyntheticProvider
+    elif get_type_member_offset(map_type, "elements") >= 0 and get_type_member_offset(map_type, "map_data") >= 0:
+        provider_type = AHashMap_SyntheticProvider
+    hash_map_provider_types[key] = provider_type
+    return provider_type
 
 
 class _Proxy_SyntheticProvider(GodotSynthProvider):
+    __slots__ = ("synth_proxy",)
+
     def __init__(self, valobj, internal_dict, is_summary=False):
         super().__init__(valobj, internal_dict, is_summary)
         self.synth_proxy: Optional[_ListOfChildren_SyntheticProvider] = None
@@ -1978,8 +3215,12 @@ class _Proxy_SyntheticProvider(GodotSynthProvider):
     def check_valid(self, obj: SBValue) -> bool:
         return not(not(self.synth_proxy and self.synth_proxy.check_valid(self.synth_proxy.valobj)))
 
+    def is_valid(self, tier: Optional[int] = None) -> bool:
+        # the inner provider caches its own verdicts
+        return not(not(self.synth_proxy and self.synth_proxy.is_valid(tier)))
+
     def get_summary(self, max_children=Opts.MAX_AMOUNT_OF_CHILDREN_IN_SUMMARY, max_str_len=Opts.SUMMARY_STRING_MAX_LENGTH):
-        if not self.synth_proxy or not self.check_valid(self.valobj):
+        if not self.synth_proxy or not self.is_valid():
             return INVALID_SUMMARY
         size = self.synth_proxy.num_elements
         children_summary = self.synth_proxy.get_children_summary(max_children, max_str_len)
@@ -2013,6 +3254,8 @@ class _Proxy_SyntheticProvider(GodotSynthProvider):
 
 # just a proxy for Vector_SyntheticProvider
 class Array_SyntheticProvider(_Proxy_SyntheticProvider):
+    __slots__ = ()
+
     def update(self):
         self.synth_proxy = None
         _p: SBValue = self.valobj.GetChildMemberWithName("_p")
@@ -2025,21 +3268,39 @@ class Array_SyntheticProvider(_Proxy_SyntheticProvider):
             )
 
 
+# Uses the provider for the layout of the map type, see get_hash_map_provider_type()
+class HashMapLayout_SyntheticProvider(_Proxy_SyntheticProvider):
+    __slots__ = ()
+
+    def update(self):
+        self.synth_proxy = None
+        provider_type = get_hash_map_provider_type(self.valobj)
+        if provider_type is not None:
+            self.synth_proxy = get_synth_provider_for_object(provider_type, self.valobj, self.internal_dict, self.is_summary)
+
+    def get_summary(self, max_children=Opts.MAX_AMOUNT_OF_CHILDREN_IN_SUMMARY, max_str_len=Opts.SUMMARY_STRING_MAX_LENGTH):
+        if not self.synth_proxy:
+            return INVALID_SUMMARY
+        return self.synth_proxy.get_summary(max_children, max_str_len)
+
+
 class Dictionary_SyntheticProvider(_Proxy_SyntheticProvider):
+    __slots__ = ()
+
     @wrap_in_try_except_ret_none
     def update(self):
         self.synth_proxy = None
         _p: SBValue = self.valobj.GetChildMemberWithName("_p")
         if is_valid_pointer(_p):
-            self.synth_proxy = get_synth_provider_for_object(
-                HashMap_SyntheticProvider,
-                _p.GetChildMemberWithName("variant_map"),
-                self.internal_dict,
-                self.is_summary,
-            )
+            variant_map: SBValue = _p.GetChildMemberWithName("variant_map")
+            provider_type = get_hash_map_provider_type(variant_map)
+            if provider_type is not None:
+                self.synth_proxy = get_synth_provider_for_object(provider_type, variant_map, self.internal_dict, self.is_summary)
 
 
 class VSet_SyntheticProvider(_Proxy_SyntheticProvider):
+    __slots__ = ()
+
     def update(self):
         self.synth_proxy = None
         _data: SBValue = self.valobj.GetChildMemberWithName("_data")
@@ -2050,9 +3311,7 @@ class VSet_SyntheticProvider(_Proxy_SyntheticProvider):
 
 
 class RingBuffer_SyntheticProvider(_Proxy_SyntheticProvider):
-    read_pos: int = 0
-    write_pos: int = 0
-    size_mask: int = 0
+    __slots__ = ("read_pos", "write_pos", "size_mask")
 
     def update(self) -> None:
         self.synth_proxy: Optional[Vector_SyntheticProvider] = None
@@ -2069,7 +3328,7 @@ class RingBuffer_SyntheticProvider(_Proxy_SyntheticProvider):
             self.write_pos = self.valobj.GetChildMemberWithName("write_pos").GetValueAsSigned() & self.size_mask
 
     def get_summary(self, max_children=Opts.MAX_AMOUNT_OF_CHILDREN_IN_SUMMARY, max_str_len=Opts.SUMMARY_STRING_MAX_LENGTH):
-        if not self.check_valid(self.valobj):
+        if not self.is_valid():
             return INVALID_SUMMARY
         children_summary = ""
         size = 0
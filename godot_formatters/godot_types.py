@@ -8,6 +8,7 @@ from godot_formatters.godot_providers import *
 
 HASHSET_PATTERN:str = "^(::)?HashSet<.+(,[^,]+)?(,[^,]+)?>$"
 HASHMAP_PATTERN:str = "^(::)?HashMap<.+,.+(,[^,]+)?(,[^,]+)?(,[^,]+)?>$"
+AHASHMAP_PATTERN:str = "^(::)?AHashMap<.+,.+(,[^,]+)?(,[^,]+)?>$"
 LIST_PATTERN:str = "^(::)?List<.+(,[^,]+)?>$"
 ARRAY_PATTERN:str = "^(::)?Array$"
 TYPEDARRAY_PATTERN:str = "^(::)?TypedArray<.+>$"
@@ -29,6 +30,8 @@ RBMAP_ELEMENT_PATTERN:str = "^(::)?RBMap<.+,.+(,[^,]+){0,2}>::Element$"
 
 SYNTHETIC_PROVIDERS: dict[str,type] = {
     "^(::)?Variant$":          Variant_SyntheticProvider,
+    "^(::)?String$":           String_SyntheticProvider,
+    "^(::)?CharString(T<.+>)?$": CharString_SyntheticProvider,
     # HASH_MAP_ELEMENT_PATTERN:  HashMapElement_SyntheticProvider,
     VECTOR_PATTERN:            Vector_SyntheticProvider,
     VECTOR_VIEW_PATTERN:       VectorView_SyntheticProvider,
@@ -37,7 +40,8 @@ SYNTHETIC_PROVIDERS: dict[str,type] = {
     HASHSET_PATTERN:           HashSet_SyntheticProvider,
     ARRAY_PATTERN:             Array_SyntheticProvider,
     TYPEDARRAY_PATTERN:        Array_SyntheticProvider,
-    HASHMAP_PATTERN:           HashMap_SyntheticProvider,
+    HASHMAP_PATTERN:           HashMapLayout_SyntheticProvider,
+    AHASHMAP_PATTERN:          HashMapLayout_SyntheticProvider,
     DICTIONARY_PATTERN:        Dictionary_SyntheticProvider,
     VMAP_PATTERN:              VMap_SyntheticProvider,
     VSET_PATTERN:              VSet_SyntheticProvider,
@@ -0,0 +1,155 @@
+from godot_formatters.utils import read_memory
+from typing import Callable, Optional
+import struct
+
+# Python versions of the engine hashers in core/templates/hashfuncs.h, and the probing used by HashMap/HashSet,
+# so that a key can be found by hashing it instead of walking every element.
+
+UINT32_MASK = 0xFFFFFFFF
+UINT64_MASK = 0xFFFFFFFFFFFFFFFF
+
+HASH_MURMUR3_SEED = 0x7F07C65
+# HashMap/HashSet mark empty buckets with a hash of 0; a key that hashes to 0 is stored as 1
+EMPTY_HASH = 0
+
+# fmt: off
+HASH_TABLE_SIZE_PRIMES = (
+    5, 13, 23, 47, 97, 193, 389, 769, 1543, 3079, 6151, 12289, 24593, 49157, 98317, 196613, 393241, 786433, 1572869,
+    3145739, 6291469, 12582917, 25165843, 50331653, 100663319, 201326611, 402653189, 805306457, 1610612741,
+)
+# fmt: on
+
+# Read this many buckets of the `hashes` array at a time while probing
+PROBE_READ_BUCKETS = 16
+
+
+def hash_rotl32(x: int, r: int) -> int:
+    return ((x << r) | (x >> (32 - r))) & UINT32_MASK
+
+
+def hash_fmix32(h: int) -> int:
+    h &= UINT32_MASK
+    h ^= h >> 16
+    h = (h * 0x85EBCA6B) & UINT32_MASK
+    h ^= h >> 13
+    h = (h * 0xC2B2AE35) & UINT32_MASK
+    h ^= h >> 16
+    return h
+
+
+def hash_murmur3_one_32(p_in: int, p_seed: int = HASH_MURMUR3_SEED) -> int:
+    p_in = (p_in * 0xCC9E2D51) & UINT32_MASK
+    p_in = hash_rotl32(p_in, 15)
+    p_in = (p_in * 0x1B873593) & UINT32_MASK
+    p_seed ^= p_in
+    p_seed = hash_rotl32(p_seed, 13)
+    return (p_seed * 5 + 0xE6546B64) & UINT32_MASK
+
+
+def hash_murmur3_one_64(p_in: int, p_seed: int = HASH_MURMUR3_SEED) -> int:
+    p_in &= UINT64_MASK
+    p_seed = hash_murmur3_one_32(p_in & UINT32_MASK, p_seed)
+    return hash_murmur3_one_32(p_in >> 32, p_seed)
+
+
+def hash_one_uint64(p_int: int) -> int:
+    v = p_int & UINT64_MASK
+    v = (~v + (v << 18)) & UINT64_MASK
+    v ^= v >> 31
+    v = (v * 21) & UINT64_MASK
+    v ^= v >> 11
+    v = (v + (v << 6)) & UINT64_MASK
+    v ^= v >> 22
+    return v & UINT32_MASK
+
+
+def hash_djb2(text: str) -> int:
+    """
+    String::hash() and StringName::hash()
+    """
+    h = 5381
+    for c in text:
+        h = ((h << 5) + h + ord(c)) & UINT32_MASK
+    return h
+
+
+def get_integer_hash_candidates(value: int, byte_size: int) -> list[int]:
+    """
+    HashMapHasherDefault has hashed integers differently across engine versions, so every known variant is tried.
+    """
+    if byte_size > 4:
+        return [hash_one_uint64(value), hash_murmur3_one_64(value)]
+    value &= UINT32_MASK
+    return [hash_fmix32(value), value, hash_murmur3_one_32(value)]
+
+
+def get_stored_hash(hash: int) -> int:
+    hash &= UINT32_MASK
+    return hash + 1 if hash == EMPTY_HASH else hash
+
+
+def probe_hash_table(process, hashes_addr: int, capacity_index: int, hash: int, matches: Callable[[int], bool]) -> Optional[int]:
+    """
+    Walks the Robin Hood probe sequence of `hash` like HashMap::_lookup_pos().
+    `matches(pos)` is called for every bucket storing the same hash.
+    Returns the matching bucket, -1 if the key isn't in the table, or None if the table couldn't be read.
+    """
+    if hashes_addr == 0 or capacity_index >= len(HASH_TABLE_SIZE_PRIMES):
+        return None
+    capacity = HASH_TABLE_SIZE_PRIMES[capacity_index]
+    hash = get_stored_hash(hash)
+    pos = hash % capacity
+    buckets: tuple[int, ...] = ()
+    buckets_start = 0
+    for distance in range(capacity):
+        if not buckets_start <= pos < buckets_start + len(buckets):
+            count = min(PROBE_READ_BUCKETS, capacity - pos)
+            data = read_memory(process, hashes_addr + pos * 4, count * 4)
+            if data is None:
+                return None
+            buckets = struct.unpack("<%dI" % count, data)
+            buckets_start = pos
+        stored = buckets[pos - buckets_start]
+        if stored == EMPTY_HASH:
+            return -1
+        # the element in this bucket is closer to its own position than we are to ours; ours would have displaced it
+        if distance > (pos - stored % capacity + capacity) % capacity:
+            return -1
+        if stored == hash and matches(pos):
+            return pos
+        pos = (pos + 1) % capacity
+    return -1
+
+
+def probe_ahash_table(process, map_data_addr: int, capacity_mask: int, hash: int, matches: Callable[[int], bool]) -> Optional[int]:
+    """
+    Walks the probe sequence of `hash` like AHashMap::_lookup_idx(). `map_data` buckets are (hash, element index) pairs,
+    and the capacity is a power of 2 (AHashMap stores it as `capacity - 1`).
+    `matches(element index)` is called for every bucket storing the same hash.
+    Returns the matching element index, -1 if the key isn't in the table, or None if the table couldn't be read.
+    """
+    if map_data_addr == 0 or capacity_mask & (capacity_mask + 1) != 0:
+        return None
+    capacity = capacity_mask + 1
+    hash = get_stored_hash(hash)
+    pos = hash & capacity_mask
+    buckets: tuple[int, ...] = ()
+    buckets_start = 0
+    for distance in range(capacity):
+        if not buckets_start <= pos < buckets_start + len(buckets) // 2:
+            count = min(PROBE_READ_BUCKETS, capacity - pos)
+            data = read_memory(process, map_data_addr + pos * 8, count * 8)
+            if data is None:
+                return None
+            buckets = struct.unpack("<%dI" % (count * 2), data)
+            buckets_start = pos
+        stored = buckets[(pos - buckets_start) * 2]
+        element_index = buckets[(pos - buckets_start) * 2 + 1]
+        if stored == hash and matches(element_index):
+            return element_index
+        if stored == EMPTY_HASH:
+            return -1
+        if distance > ((pos - (stored & capacity_mask) + capacity) & capacity_mask):
+            return -1
+        pos = (pos + 1) & capacity_mask
+    return -1
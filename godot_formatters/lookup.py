@@ -1,15 +1,90 @@
 from godot_formatters.godot_types import (SYNTHETIC_PROVIDERS, SUMMARY_PROVIDERS)
-from typing import Optional
+from functools import lru_cache
+from typing import Generic, Optional, TypeVar
 import re
 
+LOOKUP_MEMO_SIZE = 4096
+
+# characters that can appear in a type name without having any regex meaning
+_LITERAL_CHARS = re.compile(r"[A-Za-z0-9_:]*")
+
+P = TypeVar("P")
+
+
+class ProviderDispatchIndex(Generic[P]):
+    """
+    Precompiled index over a {regex: provider} table.
+
+    Patterns are split into three buckets when the index is built:
+      - exact names (e.g. `^(::)?Vector3$`), resolved with a dict lookup
+      - templates keyed by their head (e.g. `^(::)?Vector<.+>$` -> `Vector<`), only those regexes are tried
+      - anything else (e.g. `^(::)?Packed\\w+Array$`), tried only if the type name starts with the literal prefix
+    When several patterns could match, the one listed first in the table wins, same as a linear scan.
+    Resolved type names are memoized in an LRU cache.
+    """
+
+    def __init__(self, providers: dict[str, P], memo_size: int = LOOKUP_MEMO_SIZE):
+        self.exact: dict[str, list[tuple[int, P]]] = {}
+        self.by_head: dict[str, list[tuple[int, re.Pattern, P]]] = {}
+        self.fallback: list[tuple[int, str, re.Pattern, P]] = []
+        for order, (pattern, provider) in enumerate(providers.items()):
+            self._add_pattern(order, pattern, provider)
+        self.lookup = lru_cache(maxsize=memo_size)(self._resolve)
+
+    def _add_pattern(self, order: int, pattern: str, provider: P):
+        compiled = re.compile(pattern)
+        body = pattern.removeprefix("^")
+        prefixes = [""]
+        if body.startswith("(::)?"):
+            body = body.removeprefix("(::)?")
+            prefixes = ["", "::"]
+        literal = _LITERAL_CHARS.match(body).group(0)  # type: ignore
+        rest = body[len(literal) :]
+        if literal and rest == "$":
+            for prefix in prefixes:
+                self.exact.setdefault(prefix + literal, []).append((order, provider))
+        elif literal and rest.startswith("<"):
+            for prefix in prefixes:
+                self.by_head.setdefault(prefix + literal + "<", []).append((order, compiled, provider))
+        else:
+            for prefix in prefixes:
+                self.fallback.append((order, prefix + literal, compiled, provider))
+
+    def _resolve(self, type_name: str) -> Optional[P]:
+        best_order = -1
+        best: Optional[P] = None
+        for order, provider in self.exact.get(type_name, ()):
+            best_order, best = order, provider
+            break
+        template_start = type_name.find("<")
+        if template_start > 0:
+            for order, compiled, provider in self.by_head.get(type_name[: template_start + 1], ()):
+                if best_order != -1 and order > best_order:
+                    break
+                if compiled.match(type_name):
+                    best_order, best = order, provider
+                    break
+        for order, literal, compiled, provider in self.fallback:
+            if best_order != -1 and order > best_order:
+                break
+            if type_name.startswith(literal) and compiled.match(type_name):
+                best_order, best = order, provider
+                break
+        return best
+
+    def clear(self):
+        self.lookup.cache_clear()
+
+    def stats(self):
+        return self.lookup.cache_info()
+
+
+synthetic_provider_index: ProviderDispatchIndex[type] = ProviderDispatchIndex(SYNTHETIC_PROVIDERS)
+summary_provider_index: ProviderDispatchIndex[object] = ProviderDispatchIndex(SUMMARY_PROVIDERS)
+
+
 def get_synthetic_provider_for_type(type_name: str) -> Optional[type]:
-    for pattern, provider in SYNTHETIC_PROVIDERS.items():
-        if re.match(pattern, type_name):
-            return provider
-    return None
+    return synthetic_provider_index.lookup(type_name)
 
 def get_summary_provider_for_type(type_name: str) -> Optional[object]:
-    for pattern, provider in SUMMARY_PROVIDERS.items():
-        if re.match(pattern, type_name):
-            return provider
-    return None
+    return summary_provider_index.lookup(type_name)
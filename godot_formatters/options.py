@@ -14,6 +14,8 @@ class GodotFormatterOptions:
     MAP_KEY_VAL_STYLE = False
     SANITIZE_STRING_SUMMARY = True
     MIDEBUGGER_COMPAT = False
+    VECTOR_STATS_CHILD = False
+    CHILD_GROUP_SIZE = 0
     FILTER = ""  #'"' + '" , "'.join([".*update.*", ".*__init__.*"]) + '"'
 
 
@@ -33,6 +35,8 @@ HELP_STRING_MAP = {
     "MAP_KEY_VAL_STYLE": 'Display children in Map-like templates in a key-value list style (e.g. ["key"] = "value"). If false, will display children in an indexed-list style (e.g. [0] = ["key"]: "value")',
     "SANITIZE_STRING_SUMMARY": "Sanitize string summaries to escape all formatting characters and quotes",
     "MIDEBUGGER_COMPAT": "Force compatibility settings with the MIDebugger interface (i.e. the official MS C++ vscode debugger `cppdbg`). This is not necessary if using a native LLDB interface (e.g. `lldp-dap` debugger extension for vscode)",
+    "VECTOR_STATS_CHILD": "Add a `[stats]` child to Vectors and Packed*Arrays of numbers or vectors, with the count, min, max, mean, NaN/Inf counts and the largest elements",
+    "CHILD_GROUP_SIZE": "If > 0, containers with more children than this show them in ranges (e.g. [0..9999]) of at most this many children per level, nested as needed. 0 disables grouping",
     "FILTER": "List of regex filters to apply to trace output",
 }
 
@@ -55,11 +59,14 @@ EMPTY_SUMMARY = "<empty>"  # Empty string, nodepath, etc.
 INVALID_SUMMARY = "<invalid>"  # Invalid pointer, uninitialized objects, etc.
 ERROR_SUMMARY = "<!ERROR!>"  # Error summary
 LIST_FORMAT = "{type_no_template}[{size}]{{{children}}}"
+RANGE_SUMMARY_FORMAT = "{{{count} elements}}"  # Range children of grouped containers
 
 # Synthetic list-like configs; because linked-lists need to traverse the list to get a specific element, we need to cache the members to be performant.
 NO_CACHE_MEMBERS = False
 CACHE_MIN = 500
 CACHE_FETCH_MAX = 5000
+# Linked-list elements past the cache are located by walking from the nearest recorded node; one node is recorded every CHECKPOINT_INTERVAL elements.
+CHECKPOINT_INTERVAL = 64
 
 STRINGS_STILL_32_BIT = True  # if true, strings are still 32-bit
 MAX_DEPTH = 3
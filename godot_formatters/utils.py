@@ -9,9 +9,14 @@ import traceback
 import optparse
 import re
 import json
+import codecs
 
 from enum import Enum
 import weakref
+from collections import OrderedDict
+from array import array
+import bisect
+import struct
 from types import TracebackType
 from typing import final, Optional
 
@@ -22,8 +27,9 @@ from lldb import (SBCommandReturnObject, SBExecutionContext, SBTypeCategory, eFo
                   eBasicTypeChar8, eBasicTypeShort, eBasicTypeUnsignedShort, eBasicTypeInt, eBasicTypeUnsignedInt, eBasicTypeLong, eBasicTypeUnsignedLong, eBasicTypeLongLong, 
                   eBasicTypeUnsignedLongLong, eBasicTypeInt128, eBasicTypeUnsignedInt128, eBasicTypeBool, eBasicTypeHalf, eBasicTypeFloat, eBasicTypeDouble, eBasicTypeLongDouble, 
                   eBasicTypeFloatComplex, eBasicTypeDoubleComplex, eBasicTypeLongDoubleComplex, eBasicTypeObjCID, eBasicTypeObjCClass, eBasicTypeObjCSel, eBasicTypeNullPtr, eReturnStatusSuccessFinishNoResult, eReturnStatusSuccessFinishResult, 
-                  eTypeClassClass, eTypeClassEnumeration, eTypeClassPointer, eTypeOptionCascade)
-from lldb import ( SBValue, SBAddress, SBData, SBType, SBTypeEnumMember, SBTypeEnumMemberList, SBSyntheticValueProvider, SBError, SBTarget, SBDebugger, SBTypeSummary, SBTypeSynthetic, SBTypeNameSpecifier)
+                  eTypeClassClass, eTypeClassEnumeration, eTypeClassPointer, eTypeOptionCascade,
+                  eTypeClassBuiltin, eTypeClassArray, eTypeClassStruct, eTypeClassUnion, eByteOrderBig)
+from lldb import ( SBMemoryRegionInfo, SBValue, SBAddress, SBData, SBType, SBTypeEnumMember, SBTypeEnumMemberList, SBSyntheticValueProvider, SBError, SBTarget, SBDebugger, SBTypeSummary, SBTypeSynthetic, SBTypeNameSpecifier)
 # fmt: on
 
 
@@ -379,39 +385,82 @@ def is_basic_integer_type(type: SBType):
     return False
 
 
+class EnumTable:
+    """
+    Decoding table of an enum type: value -> name, and flag value -> name for values that are a combination of flags.
+    Where members share a value, the first one declared is used.
+    """
+
+    __slots__ = ("names", "flags", "masks")
+
+    def __init__(self, type: SBType):
+        self.names: dict[int, str] = {}
+        # single-bit members
+        self.flags: dict[int, str] = {}
+        # (value, name) of multi-bit members (e.g. masks), widest first
+        self.masks: list[tuple[int, str]] = []
+        member: SBTypeEnumMember
+        for member in type.GetEnumMembers():
+            value: int = member.unsigned
+            if value in self.names:
+                continue
+            self.names[value] = member.name
+            if value != 0 and value & (value - 1) == 0:
+                self.flags[value] = member.name
+            elif value != 0:
+                self.masks.append((value, member.name))
+        self.masks.sort(key=lambda mask: bin(mask[0]).count("1"), reverse=True)
+
+    def format(self, value: int) -> str:
+        name = self.names.get(value)
+        if name is not None:
+            return name
+        # this is probably a combination of flags; members whose bits are all set are named first, then single bits
+        found: list[tuple[int, str]] = []
+        remaining_value = value
+        for mask, name in self.masks:
+            if remaining_value & mask == mask:
+                remaining_value &= ~mask
+                found.append((mask & -mask, name))
+        unknown_bits = 0
+        while remaining_value:
+            bit = remaining_value & -remaining_value
+            remaining_value ^= bit
+            name = self.flags.get(bit)
+            if name is None:
+                unknown_bits |= bit
+            else:
+                found.append((bit, name))
+        # in the order of their lowest bit
+        flag_names = [name for _, name in sorted(found)]
+        if unknown_bits != 0:
+            flag_names.append("0x" + format(unknown_bits, "x"))
+        return " | ".join(flag_names)
+
+
+# (target, enum type name) -> decoding table, or None if the type has no members
+enum_tables: dict[tuple[int, str], Optional[EnumTable]] = {}
+
+
+def get_enum_table(target: SBTarget, type: SBType) -> Optional[EnumTable]:
+    type_name = type.GetName()
+    # anonymous enums (and enums in anonymous namespaces) can share a name with different members, so they aren't cached
+    if not type_name or type_name.startswith("(") or "(anonymous" in type_name:
+        table = EnumTable(type)
+        return table if table.names else None
+    key = (get_target_key(target), type_name)
+    if key not in enum_tables:
+        table = EnumTable(type)
+        enum_tables[key] = table if table.names else None
+    return enum_tables[key]
+
+
 def get_enum_string(valobj: SBValue) -> str:
-    type: SBType = valobj.GetType()
-    enumMembers: SBTypeEnumMemberList = type.GetEnumMembers()
     starting_value = valobj.GetValueAsUnsigned()
-    if enumMembers.IsValid() and enumMembers.GetSize() > 0:
-        member: SBTypeEnumMember
-        member_names: list[str] = []
-        member_values: list[int] = []
-        for member in enumMembers:
-            member_names.append(member.name)
-            member_values.append(member.unsigned)
-        if member_values.count(starting_value) == 0:
-            # this is probably a flag
-            flag_summary = ""
-            remaining_value = starting_value
-            for i, member_value in enumerate(member_values):
-                if member_value & remaining_value:
-                    if flag_summary != "":
-                        flag_summary += " | "
-                    flag_summary += member_names[i]
-                    # remove the flag from the start_value
-                    remaining_value &= ~member_value
-            if remaining_value != 0:
-                if remaining_value != starting_value:
-                    flag_summary += " | "
-                flag_summary += "0x" + format(remaining_value, "x")
-            # flag_summary += " (" + str(starting_value) + ")"
-            return flag_summary
-        else:
-            # get the index of the value
-            name = member_names[member_values.index(starting_value)]
-            return name  # + " (" + str(starting_value) + ")"
-    return "<Invalid Enum> (" + str(starting_value) + ")"
+    table = get_enum_table(valobj.GetTarget(), valobj.GetType())
+    if table is None:
+        return "<Invalid Enum> (" + str(starting_value) + ")"
+    return table.format(starting_value)
 
 
 def get_basic_printable_string(valobj: SBValue) -> str:
@@ -503,8 +552,9 @@ def is_valid_pointer(ptr: SBValue) -> bool:
     if ptr.GetValueAsUnsigned() == 0:
         print_verbose("is_valid_pointer(): ptr = nullptr")
         return False
-    if not ptr.Dereference().IsValid():
-        print_verbose("is_valid_pointer(): ptr dereference is not valid")
+    pointee_size = ptr.GetType().GetPointeeType().GetByteSize()
+    if not is_range_readable(ptr.GetProcess(), ptr.GetValueAsUnsigned(), pointee_size):
+        print_verbose("is_valid_pointer(): ptr points to unreadable memory")
         return False
     return True
 
@@ -561,20 +611,89 @@ def get_offset_of_object_member(obj: SBValue, member: str) -> int:
     return member_addr_val - element_addr_val  # type: ignore
 
 
+def get_type_member(type: SBType, member: str):
+    for i in range(type.GetNumberOfFields()):
+        field = type.GetFieldAtIndex(i)
+        if field.GetName() == member:
+            return field
+    return None
+
+
+def get_type_member_offset(type: SBType, member: str) -> int:
+    """
+    Offset in bytes of a (direct) member of `type`, or -1 if it doesn't have one with this name.
+    """
+    field = get_type_member(type, member) if member else None
+    if field is None:
+        return -1
+    return field.GetOffsetInBytes()
+
+
+def get_type_member_type(type: SBType, member: str) -> Optional[SBType]:
+    field = get_type_member(type, member) if member else None
+    if field is None:
+        return None
+    return field.GetType()
+
+
+# (target, type name, allow pointers) -> is_plain_data_type() result
+plain_data_types: dict[tuple[int, str, bool], bool] = {}
+
+# Their formatters look at where the value is stored (e.g. Variant casts `_data._mem` in place)
+ADDRESS_DEPENDENT_TYPE_NAMES = ("Variant", "::Variant")
+
+
+def _is_plain_data_type(type: SBType, depth: int, allow_pointers: bool) -> bool:
+    type = type.GetCanonicalType()
+    if depth > MAX_DEPTH * 4 or type.GetByteSize() == 0:
+        return False
+    type_class = type.GetTypeClass()
+    if type_class == eTypeClassPointer:
+        return allow_pointers
+    if type_class in (eTypeClassBuiltin, eTypeClassEnumeration):
+        return True
+    if type_class == eTypeClassArray:
+        return _is_plain_data_type(type.GetArrayElementType(), depth + 1, allow_pointers)
+    if type_class not in (eTypeClassClass, eTypeClassStruct, eTypeClassUnion):
+        return False
+    if type.GetUnqualifiedType().GetDisplayTypeName() in ADDRESS_DEPENDENT_TYPE_NAMES:
+        return False
+    for i in range(type.GetNumberOfDirectBaseClasses()):
+        if not _is_plain_data_type(type.GetDirectBaseClassAtIndex(i).GetType(), depth + 1, allow_pointers):
+            return False
+    for i in range(type.GetNumberOfFields()):
+        if not _is_plain_data_type(type.GetFieldAtIndex(i).GetType(), depth + 1, allow_pointers):
+            return False
+    return True
+
+
+def is_plain_data_type(target: SBTarget, type: SBType, allow_pointers: bool = True) -> bool:
+    """
+    Whether a value of this type formats the same when created from a copy of its bytes as when read in place,
+    i.e. it is made only of scalars and pointers, and isn't (and doesn't contain) an address-dependent type.
+    Without `allow_pointers`, its format also can't depend on memory outside of it (e.g. an Object* or a Ref<>).
+    """
+    key = (get_target_key(target), type.GetName(), allow_pointers)
+    result = plain_data_types.get(key)
+    if result is None:
+        result = plain_data_types[key] = _is_plain_data_type(type, 0, allow_pointers)
+    return result
+
+
 def not_null_check(valobj: Optional[SBValue]) -> bool:
     if not valobj or not valobj.IsValid():
         return False
     return True
 
 
-@print_trace_dec
-def get_synth_summary(synth_class, valobj: SBValue, dict):
-    obj = valobj
-    if valobj.IsSynthetic():
-        obj = valobj.GetNonSyntheticValue()
-    synth = synth_class(obj, dict, 1)
-    summary = synth.get_summary()
-    return summary
+def get_target_key(target: SBTarget) -> int:
+    """
+    Returns a key identifying the debugged process of `target`, for per-target caches.
+    """
+    process = target.GetProcess()
+    if not process or not process.IsValid():
+        return 0
+    return process.GetUniqueID()
 
 
 def ValCheck(val: SBValue) -> SBValue:
@@ -590,6 +709,428 @@ def ValCheck(val: SBValue) -> SBValue:
     return val
 
 
+# ********************************************************
+# MEMORY READING
+# ********************************************************
+
+
+def read_memory(process, address: int, size: int) -> Optional[bytes]:
+    """
+    Reads `size` bytes at `address` in one request; returns None if the read fails.
+    """
+    if size <= 0:
+        return b""
+    if address == 0 or not process or not process.IsValid() or is_known_unreadable(process, address, size):
+        return None
+    error = SBError()
+    data = process.ReadMemory(address, size, error)
+    if error.Fail() or data is None or len(data) != size:
+        print_verbose(f"read_memory(): failed to read {size} bytes at 0x{address:x}: {error.GetCString()}")
+        record_unreadable_address(process, address, size)
+        return None
+    return data
+
+
+def read_value_data(valobj: SBValue, size: int) -> Optional[bytes]:
+    """
+    Reads the first `size` bytes of a value in one request: from memory if it has an address,
+    or from its SBData otherwise (e.g. a value in a register); returns None if the read fails.
+    """
+    address = valobj.GetLoadAddress()
+    if address != LLDB_INVALID_ADDRESS and address != 0:
+        return read_memory(valobj.GetProcess(), address, size)
+    data: SBData = valobj.GetData()
+    if not data or data.GetByteSize() < size:
+        return None
+    error = SBError()
+    raw = data.ReadRawData(error, 0, size)
+    if error.Fail() or raw is None or len(raw) != size:
+        return None
+    return raw
+
+
+def read_unsigned(process, address: int, byte_size: int) -> Optional[int]:
+    if address == 0 or not process or not process.IsValid() or is_known_unreadable(process, address, byte_size):
+        return None
+    error = SBError()
+    value = process.ReadUnsignedFromMemory(address, byte_size, error)
+    if error.Fail():
+        record_unreadable_address(process, address, byte_size)
+        return None
+    return value
+
+
+def read_pointer(process, address: int) -> int:
+    """
+    Reads a pointer at `address`; returns 0 if the read fails.
+    """
+    pointer_size = process.GetAddressByteSize()
+    if address == 0 or is_known_unreadable(process, address, pointer_size):
+        return 0
+    error = SBError()
+    value = process.ReadPointerFromMemory(address, error)
+    if error.Fail():
+        record_unreadable_address(process, address, pointer_size)
+        return 0
+    return value
+
+
+def read_pointer_array(process, address: int, count: int) -> Optional[array]:
+    """
+    Reads `count` consecutive pointers at `address` in one request; returns None if the read fails.
+    """
+    if not process or not process.IsValid():
+        return None
+    pointer_size = process.GetAddressByteSize()
+    data = read_memory(process, address, count * pointer_size)
+    if data is None:
+        return None
+    byte_order = ">" if process.GetByteOrder() == eByteOrderBig else "<"
+    return array("Q", struct.unpack("%s%d%s" % (byte_order, count, "I" if pointer_size == 4 else "Q"), data))
+
+
+def create_data(process, buf: bytes) -> Optional[SBData]:
+    """
+    Wraps bytes read from the process in an SBData, to create values with CreateValueFromData.
+    """
+    data = SBData()
+    error = SBError()
+    data.SetData(error, buf, process.GetByteOrder(), process.GetAddressByteSize())
+    if error.Fail():
+        return None
+    return data
+
+
+def create_pointer_value(valobj: SBValue, name: str, address: int, pointer_type: SBType) -> SBValue:
+    """
+    Creates a value of `pointer_type` holding `address`, without evaluating any expression.
+    """
+    process = valobj.GetProcess()
+    byte_order = process.GetByteOrder()
+    addr_size = process.GetAddressByteSize()
+    if addr_size == 4:
+        data = SBData.CreateDataFromUInt32Array(byte_order, addr_size, [address])
+    else:
+        data = SBData.CreateDataFromUInt64Array(byte_order, addr_size, [address])
+    return valobj.CreateValueFromData(name, data, pointer_type)
+
+
+STRING_ENCODINGS = {1: "utf-8", 2: "utf-16-le", 4: "utf-32-le"}
+
+
+def decode_string_data(data, char_size: int, final=True) -> str:
+    """
+    Decodes a buffer of `char_size`-wide characters.
+    If `final` is False, a multi-byte sequence cut off at the end of the buffer is dropped instead of replaced.
+    """
+    encoding = STRING_ENCODINGS.get(char_size, "utf-8")
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    return decoder.decode(memoryview(data), final)
+
+
+# ********************************************************
+# CACHES
+# ********************************************************
+
+LLDB_INVALID_ADDRESS = 0xFFFFFFFFFFFFFFFF
+STOP_CACHE_MAX_ENTRIES = 100000
+
+# Every cache registers itself here, so they can be inspected and cleared by the `cache` command
+registered_caches: list["FormatterCache"] = []
+
+_MISSING = object()
+
+
+class FormatterCache:
+    def __init__(self, name: str, max_entries: int = STOP_CACHE_MAX_ENTRIES):
+        self.name = name
+        self.max_entries = max_entries
+        self.entries: dict = {}
+        self.hits = 0
+        self.misses = 0
+        registered_caches.append(self)
+
+    def clear(self):
+        self.entries.clear()
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        value = self.entries.get(key, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        if key not in self.entries and len(self.entries) >= self.max_entries:
+            self.entries.clear()
+        self.entries[key] = value
+
+    def get_stats_str(self) -> str:
+        total = self.hits + self.misses
+        rate = (self.hits / total) if total else 0.0
+        return f"{self.name}: {len(self.entries)} entries, {self.hits} hits, {self.misses} misses ({rate:.1%} hit rate)"
+
+
+class StopScopedCache(FormatterCache):
+    """
+    Cache whose entries are only valid while the process stays stopped; it's emptied as soon as the stop ID changes.
+    """
+
+    def __init__(self, name: str, max_entries: int = STOP_CACHE_MAX_ENTRIES):
+        super().__init__(name, max_entries)
+        self.stop_key: Optional[tuple[int, int]] = None
+
+    def sync(self, process, stop_key: Optional[tuple[int, int]] = None) -> None:
+        """
+        `stop_key` can be passed if the caller already has get_process_stop_key(process), to sync several caches with one lookup.
+        """
+        if stop_key is None:
+            stop_key = get_process_stop_key(process)
+        if stop_key != self.stop_key:
+            self.entries.clear()
+            self.stop_key = stop_key
+
+    def clear(self):
+        super().clear()
+        self.stop_key = None
+
+
+class SessionCache(FormatterCache):
+    """
+    Bounded LRU cache whose entries stay valid for as long as the process is alive.
+    """
+
+    def __init__(self, name: str, max_entries: int):
+        super().__init__(name, max_entries)
+        self.entries: OrderedDict = OrderedDict()
+        self.process_id: Optional[int] = None
+
+    def sync(self, process) -> None:
+        process_id = get_process_stop_key(process)[0]
+        if process_id != self.process_id:
+            self.entries.clear()
+            self.process_id = process_id
+
+    def get(self, key, default=None):
+        value = super().get(key, _MISSING)
+        if value is _MISSING:
+            return default
+        self.entries.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+        elif len(self.entries) >= self.max_entries:
+            self.entries.popitem(last=False)
+        self.entries[key] = value
+
+    def clear(self):
+        super().clear()
+        self.process_id = None
+
+
+class CowDataCache(FormatterCache):
+    """
+    Values decoded from a CowData buffer, keyed by (_ptr address, size, tag), shared by every object using that buffer.
+    A shared buffer (refcount > 1) can't be written to without first being copied to a new allocation,
+    so entries from an earlier stop are reused as long as the buffer is still shared.
+    """
+
+    def get_for_buffer(self, process, ptr_addr: int, size: int, tag, default=None):
+        key = (ptr_addr, size, tag)
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        entry_stop_key, value = entry
+        stop_key = get_process_stop_key(process)
+        if entry_stop_key != stop_key:
+            if entry_stop_key[0] != stop_key[0] or not is_cowdata_shared(process, ptr_addr):
+                del self.entries[key]
+                self.misses += 1
+                return default
+            self.entries[key] = (stop_key, value)
+        self.hits += 1
+        return value
+
+    def put_for_buffer(self, process, ptr_addr: int, size: int, tag, value):
+        self.put((ptr_addr, size, tag), (get_process_stop_key(process), value))
+
+
+cowdata_cache = CowDataCache("cowdata")
+
+
+def clear_all_caches():
+    for cache in registered_caches:
+        cache.clear()
+
+
+def get_process_stop_key(process) -> tuple[int, int]:
+    if not process or not process.IsValid():
+        return (0, 0)
+    # expression evaluation may change memory, so those count as stops as well
+    return (process.GetUniqueID(), process.GetStopID(True))
+
+
+# Name of a child that shows a range of the elements of its container (a value of the same type at the same address)
+RANGE_CHILD_NAME_FORMAT = "[{0}..{1}]"
+RANGE_CHILD_NAME_RE = re.compile(r"^\[(\d+)\.\.(\d+)\]$")
+
+
+def parse_range_child_name(name: Optional[str]) -> Optional[tuple[int, int]]:
+    """
+    Returns the (first, last) element indices of a range child name, e.g. "[0..9999]".
+    """
+    match = RANGE_CHILD_NAME_RE.match(name) if name else None
+    if not match:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
+
+# ********************************************************
+# MEMORY REGIONS
+# ********************************************************
+
+
+class MemoryRegionMap:
+    """
+    The readable address ranges of a process (adjacent regions merged), so that pointers can be checked without reading them.
+    """
+
+    def __init__(self, process):
+        self.starts = array("Q")
+        self.ends = array("Q")
+        regions = process.GetMemoryRegions()
+        info = SBMemoryRegionInfo()
+        readable: list[tuple[int, int]] = []
+        for i in range(regions.GetSize()):
+            if regions.GetMemoryRegionAtIndex(i, info) and info.IsReadable():
+                readable.append((info.GetRegionBase(), info.GetRegionEnd()))
+        for start, end in sorted(readable):
+            if len(self.ends) > 0 and self.ends[-1] >= start:
+                self.ends[-1] = max(self.ends[-1], end)
+            else:
+                self.starts.append(start)
+                self.ends.append(end)
+
+    def is_usable(self) -> bool:
+        # not every platform reports memory regions (or their permissions)
+        return len(self.starts) > 0
+
+    def is_readable(self, address: int, size: int) -> bool:
+        pos = bisect.bisect_right(self.starts, address) - 1
+        return pos >= 0 and address + size <= self.ends[pos]
+
+
+# process ID -> MemoryRegionMap, or None if the process doesn't report its regions; rebuilt on every stop
+memory_region_maps = StopScopedCache("memory_regions", 16)
+# (address, size) of the reads that failed during the current stop
+unreadable_addresses = StopScopedCache("unreadable_addresses")
+
+
+def get_memory_region_map(process, build=True, stop_key: Optional[tuple[int, int]] = None) -> Optional[MemoryRegionMap]:
+    if stop_key is None:
+        stop_key = get_process_stop_key(process)
+    memory_region_maps.sync(process, stop_key)
+    key = stop_key[0]
+    region_map = memory_region_maps.get(key, _MISSING)
+    if region_map is _MISSING:
+        if not build:
+            return None
+        try:
+            region_map = MemoryRegionMap(process)
+        except Exception as e:
+            print_verbose("get_memory_region_map(): " + str(e))
+            region_map = None
+        if region_map is not None and not region_map.is_usable():
+            region_map = None
+        memory_region_maps.put(key, region_map)
+    return region_map  # type: ignore
+
+
+def record_unreadable_address(process, address: int, size: int):
+    unreadable_addresses.sync(process)
+    unreadable_addresses.put((address, size), True)
+
+
+def is_known_unreadable(process, address: int, size: int) -> bool:
+    """
+    True if the range is known not to be readable during this stop, without reading it or building the region map.
+    """
+    # this runs before every read, so the stop is only looked up once for both caches
+    stop_key = get_process_stop_key(process)
+    unreadable_addresses.sync(process, stop_key)
+    if unreadable_addresses.get((address, size)) is not None:
+        return True
+    region_map = get_memory_region_map(process, build=False, stop_key=stop_key)
+    return region_map is not None and not region_map.is_readable(address, size)
+
+
+def is_range_readable(process, address: int, size: int) -> bool:
+    """
+    Checks that `size` bytes at `address` are readable with a lookup in the memory region map.
+    If the process doesn't report its regions, the last byte of the range is read instead.
+    """
+    if address == 0 or not process or not process.IsValid():
+        return False
+    size = max(size, 1)
+    stop_key = get_process_stop_key(process)
+    unreadable_addresses.sync(process, stop_key)
+    if unreadable_addresses.get((address, size)) is not None:
+        return False
+    region_map = get_memory_region_map(process, stop_key=stop_key)
+    if region_map is not None:
+        readable = region_map.is_readable(address, size)
+    else:
+        readable = read_memory(process, address + size - 1, 1) is not None
+    if not readable:
+        record_unreadable_address(process, address, size)
+    return readable
+
+
+def get_value_cache_key(valobj: SBValue) -> Optional[tuple[int, str]]:
+    """
+    Returns (load address, canonical type name), or None if the value doesn't live in process memory.
+    """
+    address = valobj.GetLoadAddress()
+    if address == LLDB_INVALID_ADDRESS or address == 0:
+        return None
+    # a range child has the same address and type as its container, but not the same summary
+    if parse_range_child_name(valobj.GetName()) is not None:
+        return None
+    return (address, valobj.GetType().GetCanonicalType().GetName())
+
+
+summary_cache = StopScopedCache("summaries")
+
+
+def cached_summary_dec(summary_fn):
+    """
+    Caches the result of a summary function for (load address, canonical type name) until the process resumes.
+    """
+
+    def wrapper(valobj: SBValue, internal_dict):
+        key = get_value_cache_key(valobj)
+        if key is None:
+            return summary_fn(valobj, internal_dict)
+        summary_cache.sync(valobj.GetProcess())
+        summary = summary_cache.get(key, _MISSING)
+        if summary is _MISSING:
+            summary = summary_fn(valobj, internal_dict)
+            summary_cache.put(key, summary)
+        return summary
+
+    wrapper.__name__ = summary_fn.__name__
+    wrapper.__qualname__ = summary_fn.__qualname__
+    return wrapper
+
+
 # ********************************************************
 # GODOT-SPECIFIC UTILITIES
 # ********************************************************
@@ -675,28 +1216,24 @@ def get_cowdata_size_or_none(_cowdata: SBValue, null_means_zero=True) -> Optiona
         if not _cowdata_template_type.IsValid():
             print_verbose("COWDATASIZE Invalid: _cowdata template type is not valid")
             return None
-        uint64_type: SBType = _cowdata.GetTarget().GetBasicType(eBasicTypeUnsignedLongLong)
+        process = _cowdata.GetProcess()
         ptr_addr_val = _ptr.GetValueAsUnsigned()
         if ptr_addr_val - 8 < 0:
             print_verbose("COWDATASIZE Invalid: ptr_addr_val - 8 is less than 0: " + str(ptr_addr_val))
             return None
-        size_child: SBValue = _ptr.CreateValueFromAddress("size", ptr_addr_val - 8, uint64_type)
-        if not size_child.IsValid():
+        unsigned_size = read_unsigned(process, ptr_addr_val - 8, 8)
+        if unsigned_size is None:
             print_verbose("COWDATASIZE Invalid: Size value at ptr_addr - 8 is not valid")
             return None
-        size = size_child.GetValueAsSigned()
+        size = unsigned_size - (1 << 64) if unsigned_size >= (1 << 63) else unsigned_size
         if size < 0:
             print_verbose("COWDATASIZE Invalid: Size is less than 0: " + str(size))
             return None
         if size > 0:
-            item_size = _ptr.GetType().GetByteSize()
-            last_val = _ptr.CreateValueFromAddress(
-                "_tmp_tail",
-                ptr_addr_val + ((size - 1) * item_size),
-                _ptr.GetType().GetPointeeType(),
-            )
-            if not last_val.IsValid():
-                print_verbose("COWDATASIZE Invalid: Last value is not valid: " + str(last_val))
+            # the whole buffer has to be readable
+            item_size = max(_ptr.GetType().GetPointeeType().GetByteSize(), 1)
+            if not is_range_readable(process, ptr_addr_val, size * item_size):
+                print_verbose("COWDATASIZE Invalid: the buffer is not readable")
                 return None
     except Exception as e:
         print_verbose("COWDATASIZE Exception: " + str(e))
@@ -706,6 +1243,12 @@ def get_cowdata_size_or_none(_cowdata: SBValue, null_means_zero=True) -> Optiona
     return size
 
 
+# The refcount is located before the size, at the cowdata address - 16 bytes
+def is_cowdata_shared(process, ptr_addr: int) -> bool:
+    refcount = read_unsigned(process, ptr_addr - 16, 8)
+    return refcount is not None and refcount > 1
+
+
 def is_cowdata_valid(_cowdata: SBValue) -> bool:
     size = get_cowdata_size_or_none(_cowdata)
     if size is None: